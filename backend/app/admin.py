@@ -1,7 +1,13 @@
 from django.contrib import admin
-from .models import User, Token, Resume
+from .models import User, Token, Resume, ExtractionJob, Skill, ResumeSkill, MarketSnapshot, EmailOutbox, UsedResetToken
 
 # Register your models here.
 admin.site.register(User)
 admin.site.register(Token)
-admin.site.register(Resume)
\ No newline at end of file
+admin.site.register(Resume)
+admin.site.register(ExtractionJob)
+admin.site.register(Skill)
+admin.site.register(ResumeSkill)
+admin.site.register(MarketSnapshot)
+admin.site.register(EmailOutbox)
+admin.site.register(UsedResetToken)
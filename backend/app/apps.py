@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.core.signals import request_started
 
 
 class AppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'app'
+
+    def ready(self):
+        from .utils import outbox
+
+        # The first request of each worker process starts its email outbox sender.
+        request_started.connect(outbox.start_sender, dispatch_uid="app.outbox.start_sender")
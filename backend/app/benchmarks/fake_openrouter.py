@@ -0,0 +1,212 @@
+"""A local OpenAI-compatible stand-in for OpenRouter, used by the benchmark commands.
+
+It answers POST {url}/chat/completions with canned JSON shaped like the real
+prompts expect (roadmaps, market analysis, skill arrays), and can simulate
+time-to-first-token latency, a token generation rate and error responses.
+"""
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SAMPLE_SKILLS = ["Python", "SQL", "Git", "Docker", "React", "Communication"]
+SAMPLE_RECOMMENDATIONS = ["Kubernetes", "AWS", "System Design", "CI/CD", "TypeScript"]
+
+
+def _skills_in(prompt, pattern):
+    match = re.search(pattern, prompt)
+    if not match:
+        return []
+    return [s.strip() for s in match.group(1).split(",") if s.strip()]
+
+
+def _roadmap(skills):
+    levels = [
+        {
+            "level": level,
+            "description": f"{level} topics",
+            "projects": ["Project 1", "Project 2"],
+            "resources": ["Official docs", "Free course"],
+            "timeframe": "1-2 months",
+        }
+        for level in ("Beginner", "Intermediate", "Advanced")
+    ]
+    return {"roadmap": {s.title(): {"levels": levels, "prerequisites": ["Basics"],
+                                     "market_relevance": "High"} for s in skills}}
+
+
+def _market(skills):
+    return {"skills": {s.title(): {"relevance_score": 8, "trend": "growing",
+                                   "industries": ["Software", "Finance", "Retail"],
+                                   "related_roles": ["Engineer", "Analyst", "Developer"],
+                                   "complementary_skills": ["Git", "Linux", "Cloud"],
+                                   "insights": "Steady demand."} for s in skills}}
+
+
+def fake_completion(prompt: str) -> str:
+    """Return a plausible model answer for one of the app's prompts."""
+    skills = _skills_in(prompt, r"learning roadmap for these skills: (.*)")
+    if skills:
+        return json.dumps(_roadmap(skills))
+    skills = _skills_in(prompt, r"job market for these skills: (.*)")
+    if skills:
+        return json.dumps(_market(skills))
+    if "Recommended skills" in prompt:
+        return json.dumps(SAMPLE_RECOMMENDATIONS)
+    if "JSON array" in prompt:
+        return json.dumps(SAMPLE_SKILLS)
+    return "OK"
+
+
+def _tokens(text):
+    # Roughly four characters per token, like the real tokenizers.
+    return [text[i:i + 4] for i in range(0, len(text), 4)] or [""]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        server = self.server.fake
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length) or b"{}")
+        server.record_request()
+        if not self.path.endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+
+        roll = random.random()
+        if roll < server.rate_limit_rate:
+            self._send_json(429, {"error": {"message": "rate limited"}},
+                            {"Retry-After": str(server.retry_after)})
+            return
+        if roll < server.rate_limit_rate + server.error_rate:
+            self._send_json(500, {"error": {"message": "upstream error"}})
+            return
+
+        prompt = "".join(m.get("content") or "" for m in request.get("messages", []))
+        text = server.responder(prompt)
+        tokens = _tokens(text)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        model = request.get("model", "fake")
+        latency = server.model_latency.get(model, server.latency)
+        if request.get("stream"):
+            # Like OpenRouter, stream headers go out before the first token.
+            self._stream(completion_id, model, tokens, server.token_rate, latency, len(_tokens(prompt)))
+            return
+        if latency:
+            time.sleep(latency)
+
+        if server.token_rate:
+            time.sleep(len(tokens) / server.token_rate)
+        self._send_json(200, {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": text}}],
+            "usage": {"prompt_tokens": len(_tokens(prompt)), "completion_tokens": len(tokens),
+                      "total_tokens": len(_tokens(prompt)) + len(tokens)},
+        })
+
+    def _stream(self, completion_id, model, tokens, token_rate, latency, prompt_tokens):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        try:
+            self.wfile.flush()
+            if latency:
+                time.sleep(latency)
+            for i, token in enumerate(tokens):
+                if token_rate:
+                    time.sleep(1 / token_rate)
+                chunk = {"id": completion_id, "object": "chat.completion.chunk",
+                         "created": int(time.time()), "model": model,
+                         "choices": [{"index": 0, "delta": {"content": token},
+                                      "finish_reason": "stop" if i == len(tokens) - 1 else None}]}
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+            # Like OpenRouter, usage arrives on a final chunk without choices.
+            usage = {"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                     "model": model, "choices": [],
+                     "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": len(tokens),
+                               "total_tokens": prompt_tokens + len(tokens)}}
+            self.wfile.write(f"data: {json.dumps(usage)}\n\n".encode("utf-8"))
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # concurrency benchmarks open hundreds of connections at once
+
+
+class FakeOpenRouterServer:
+    """Threaded fake OpenRouter server; use as a context manager or call start()/stop().
+
+    latency: seconds before the first token (model_latency overrides it per
+    model name); token_rate: tokens per second (None for instant);
+    error_rate / rate_limit_rate: fraction of requests answered with a
+    500 / 429 (with Retry-After: retry_after).
+    """
+
+    def __init__(self, latency=0.0, token_rate=None, error_rate=0.0, rate_limit_rate=0.0,
+                 retry_after=1, responder=fake_completion, host="127.0.0.1", port=0, model_latency=None):
+        self.latency = latency
+        self.model_latency = dict(model_latency or {})
+        self.token_rate = token_rate
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.responder = responder
+        self.requests = 0
+        self._count_lock = threading.Lock()
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.fake = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api/v1"
+
+    def record_request(self):
+        with self._count_lock:
+            self.requests += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
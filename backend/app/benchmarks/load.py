@@ -0,0 +1,262 @@
+"""Load-test scenarios for every API endpoint and a closed-loop runner (see manage.py bench_endpoints).
+
+Sync endpoints are driven through Django's WSGI handler from a thread pool,
+the async/ ones through the ASGI application on one event loop; each of
+concurrency workers sends its next request as soon as the last one returns.
+"""
+import asyncio
+import io
+import itertools
+import json
+import math
+import os
+import statistics
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from django.test import Client
+
+from app.models import ExtractionJob, User
+from app.utils.passwords import hash_password
+from app.utils.reset_tokens import issue_reset_token
+
+from .sample_resumes import sample_resume
+
+PASSWORD = "bench-password-123"
+LOGIN_EMAIL = "bench-load@example.com"
+ROLE = "Software Engineer"
+
+# (latency in seconds, status code, Server-Timing header)
+Sample = Tuple[float, int, str]
+
+
+def _skills(seed: int) -> Dict[str, Any]:
+    return {"json": {"skills": [f"skill {seed}", f"tool {seed}"]}}
+
+
+def _recommend(seed: int) -> Dict[str, Any]:
+    return {"json": {"skills": [f"skill {seed}"], "role": ROLE}}
+
+
+def _resume(seed: int) -> Dict[str, Any]:
+    return {"files": {"file": (f"resume_{seed}.pdf", sample_resume(seed), "application/pdf")}, "data": {"role": ROLE}}
+
+
+def _resume_zip(seed: int, count: int = 3) -> Dict[str, Any]:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for i in range(count):
+            archive.writestr(f"resume_{i}.pdf", sample_resume(seed * count + i))
+    return {"files": {"file": (f"resumes_{seed}.zip", buffer.getvalue(), "application/zip")}, "data": {"role": ROLE}}
+
+
+def _register(seed: int) -> Dict[str, Any]:
+    return {"json": {"name": f"Bench {seed}", "email": f"bench-{seed}@example.com", "password": PASSWORD}}
+
+
+def _login_user() -> User:
+    user, _ = User.objects.get_or_create(email=LOGIN_EMAIL, defaults={"name": "Bench", "password": ""})
+    if not user.password:
+        User.objects.filter(pk=user.pk).update(password=hash_password(PASSWORD))
+    return user
+
+
+def _login(seed: int) -> Dict[str, Any]:
+    _login_user()
+    return {"json": {"email": LOGIN_EMAIL, "password": PASSWORD}}
+
+
+def _forgot_password(seed: int) -> Dict[str, Any]:
+    _login_user()
+    return {"json": {"email": LOGIN_EMAIL}}
+
+
+def _reset_password(seed: int) -> Dict[str, Any]:
+    # A user per request: a reset link works once.
+    user = User.objects.create(name=f"Reset {seed}", email=f"bench-reset-{seed}@example.com", password="!")
+    return {"json": {"id": user.id, "token": issue_reset_token(user), "password": PASSWORD}}
+
+
+_job_lock = threading.Lock()
+_job_id = None
+
+
+def _job_status(seed: int) -> Dict[str, Any]:
+    global _job_id
+    with _job_lock:
+        if _job_id is None or not ExtractionJob.objects.filter(pk=_job_id).exists():
+            _job_id = ExtractionJob.objects.create(status=ExtractionJob.SUCCEEDED, role=ROLE, result={}).id
+    return {"path": f"extract-skills/jobs/{_job_id}"}
+
+
+class Scenario:
+    """One endpoint: its route under /api/v1/, method, transport and a per-request payload builder."""
+
+    def __init__(self, route: str, build: Callable[[int], Dict[str, Any]], method: str = "POST",
+                 transport: str = "wsgi", stream: bool = False):
+        self.route = route
+        self.build = build
+        self.method = method
+        self.transport = transport
+        self.stream = stream
+
+
+# Keyed by the route in app/urls.py; builders run before the clock starts and
+# get a fresh seed per request, so no two requests share an LLM prompt or a PDF.
+SCENARIOS = {
+    "extract-skills": Scenario("extract-skills", _resume),
+    "extract-skills/bulk": Scenario("extract-skills/bulk", _resume_zip),
+    "extract-skills/jobs": Scenario("extract-skills/jobs", _job_status, method="GET"),
+    "register": Scenario("register", _register),
+    "login": Scenario("login", _login),
+    "forgotPassword": Scenario("forgotPassword", _forgot_password),
+    "resetPassword": Scenario("resetPassword", _reset_password),
+    "skill-roadmap": Scenario("skill-roadmap", _skills),
+    "skill-recommend": Scenario("skill-recommend", _recommend),
+    "skill-market-analysis": Scenario("skill-market-analysis", _skills),
+    "skill-roadmap/stream": Scenario("skill-roadmap/stream", _skills, stream=True),
+    "skill-market-analysis/stream": Scenario("skill-market-analysis/stream", _skills, stream=True),
+    "async/extract-skills": Scenario("async/extract-skills", _resume, transport="asgi"),
+    "async/skill-roadmap": Scenario("async/skill-roadmap", _skills, transport="asgi"),
+    "async/skill-recommend": Scenario("async/skill-recommend", _recommend, transport="asgi"),
+    "async/skill-market-analysis": Scenario("async/skill-market-analysis", _skills, transport="asgi"),
+}
+
+_seeds = itertools.count()
+
+
+def build_requests(scenario: Scenario, count: int) -> List[Dict[str, Any]]:
+    specs = []
+    for _ in range(count):
+        spec = scenario.build(next(_seeds))
+        spec.setdefault("path", scenario.route)
+        specs.append(spec)
+    return specs
+
+
+def _wsgi_request(client: Client, scenario: Scenario, spec: Dict[str, Any]):
+    path = f"/api/v1/{spec['path']}"
+    if "json" in spec:
+        return client.generic(scenario.method, path, json.dumps(spec["json"]), content_type="application/json")
+    if "files" in spec:
+        data = dict(spec.get("data") or {})
+        for field, (name, content, _) in spec["files"].items():
+            upload = io.BytesIO(content)
+            upload.name = name
+            data[field] = upload
+        return client.post(path, data)
+    return client.generic(scenario.method, path)
+
+
+def run_wsgi(scenario: Scenario, specs: List[Dict[str, Any]], concurrency: int) -> Tuple[float, List[Sample]]:
+    """Send specs through the WSGI handler from concurrency threads; returns (elapsed, samples)."""
+    local = threading.local()
+
+    def one(spec):
+        if not hasattr(local, "client"):
+            local.client = Client(SERVER_NAME="localhost")
+        started = time.perf_counter()
+        response = _wsgi_request(local.client, scenario, spec)
+        if response.streaming:
+            b"".join(response.streaming_content)
+        return time.perf_counter() - started, response.status_code, response.get("Server-Timing", "")
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bench-client") as executor:
+        samples = list(executor.map(one, specs))
+    return time.perf_counter() - started, samples
+
+
+def run_asgi(application, scenario: Scenario, specs: List[Dict[str, Any]],
+             concurrency: int) -> Tuple[float, List[Sample]]:
+    """Send specs through the ASGI application with concurrency requests in flight; returns (elapsed, samples)."""
+    async def run():
+        slots = asyncio.Semaphore(concurrency)
+        transport = httpx.ASGITransport(app=application)
+        async with httpx.AsyncClient(transport=transport, base_url="http://localhost", timeout=None) as client:
+            async def one(spec):
+                async with slots:
+                    kwargs = {key: spec[key] for key in ("json", "files", "data") if key in spec}
+                    started = time.perf_counter()
+                    response = await client.request(scenario.method, f"/api/v1/{spec['path']}", **kwargs)
+                    return (time.perf_counter() - started, response.status_code,
+                            response.headers.get("server-timing", ""))
+
+            started = time.perf_counter()
+            samples = await asyncio.gather(*(one(spec) for spec in specs))
+            return time.perf_counter() - started, list(samples)
+
+    return asyncio.run(run())
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of values, or None if there are none."""
+    if not values:
+        return None
+    values = sorted(values)
+    return values[max(0, math.ceil(pct / 100 * len(values)) - 1)]
+
+
+def _stage_means(headers: List[str]) -> Dict[str, float]:
+    """Mean duration (ms) per Server-Timing entry over the responses that reported it."""
+    durations: Dict[str, List[float]] = {}
+    for header in headers:
+        for entry in filter(None, (part.strip() for part in header.split(","))):
+            name, _, params = entry.partition(";")
+            for param in params.split(";"):
+                key, _, value = param.partition("=")
+                if key.strip() == "dur":
+                    durations.setdefault(name, []).append(float(value))
+    return {name: round(statistics.mean(values), 1) for name, values in durations.items()}
+
+
+def summarize(elapsed: float, samples: List[Sample]) -> Dict[str, Any]:
+    latencies = [sample[0] * 1000 for sample in samples]
+    codes: Dict[str, int] = {}
+    for _, code, _ in samples:
+        codes[str(code)] = codes.get(str(code), 0) + 1
+    ok = sum(count for code, count in codes.items() if code.startswith("2"))
+
+    def ms(value):
+        return None if value is None else round(value, 1)
+
+    return {
+        "requests": len(samples),
+        "ok": ok,
+        "errors": len(samples) - ok,
+        "status_codes": codes,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else None,
+        "latency_ms": {
+            "mean": ms(statistics.mean(latencies)) if latencies else None,
+            "p50": ms(percentile(latencies, 50)),
+            "p95": ms(percentile(latencies, 95)),
+            "p99": ms(percentile(latencies, 99)),
+            "max": ms(max(latencies)) if latencies else None,
+        },
+        "stages_ms": _stage_means([sample[2] for sample in samples]),
+    }
+
+
+def rss_mb() -> Optional[float]:
+    """Current resident memory of this process in MiB (Linux), or None."""
+    try:
+        with open("/proc/self/statm") as f:
+            return round(int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20, 1)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident memory of this process in MiB, or None where the resource module is missing."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return round(peak / (2 ** 20 if os.uname().sysname == "Darwin" else 2 ** 10), 1)
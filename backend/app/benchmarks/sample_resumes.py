@@ -0,0 +1,76 @@
+"""Synthetic resume PDFs for benchmarks: minimal, valid PDFs that PyPDF2 can read."""
+import os
+import random
+import zipfile
+from typing import List
+
+from app.utils.skill_taxonomy import SKILLS
+
+SECTIONS = ["Summary", "Experience", "Projects", "Skills", "Education"]
+
+
+def make_pdf(pages: List[str]) -> bytes:
+    """A PDF with one page per string, each line drawn as a separate text line."""
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    kids = []
+    for index, text in enumerate(pages):
+        page_id, content_id = 4 + 2 * index, 5 + 2 * index
+        kids.append(f"{page_id} 0 R")
+        lines = " ".join(f"({line.replace('(', '').replace(')', '')}) '" for line in text.split("\n"))
+        stream = f"BT /F1 11 Tf 50 750 Td 14 TL {lines} ET".encode()
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode()
+        objects[content_id] = b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>".encode()
+
+    data = b"%PDF-1.4\n"
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = len(data)
+        data += b"%d 0 obj\n" % object_id + objects[object_id] + b"\nendobj\n"
+    xref = len(data)
+    size = max(offsets) + 1
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % size
+    for object_id in range(1, size):
+        data += b"%010d 00000 n \n" % offsets[object_id]
+    data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref)
+    return data
+
+
+def sample_resume(seed: int, pages: int = 1) -> bytes:
+    """A resume PDF listing a random (but seed-stable) handful of taxonomy skills."""
+    rng = random.Random(seed)
+    names = sorted(SKILLS)
+    page_texts = []
+    for page in range(pages):
+        skills = rng.sample(names, 8)
+        lines = [f"Candidate {seed}", SECTIONS[page % len(SECTIONS)]]
+        lines += [f"Built project {seed}-{page}-{i} using {skill}." for i, skill in enumerate(skills[:5])]
+        lines += ["Skills", ", ".join(skills)]
+        page_texts.append("\n".join(lines))
+    return make_pdf(page_texts)
+
+
+def write_samples(directory: str, count: int, pages: int = 1) -> List[str]:
+    """Write count distinct resume PDFs into directory; returns their paths."""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for seed in range(count):
+        path = os.path.join(directory, f"resume_{seed:04d}.pdf")
+        with open(path, "wb") as f:
+            f.write(sample_resume(seed, pages))
+        paths.append(path)
+    return paths
+
+
+def write_sample_zip(path: str, count: int, pages: int = 1) -> str:
+    """A ZIP of count distinct resume PDFs."""
+    with zipfile.ZipFile(path, "w") as archive:
+        for seed in range(count):
+            archive.writestr(f"resume_{seed:04d}.pdf", sample_resume(seed, pages))
+    return path
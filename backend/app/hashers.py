@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with its iteration count taken from settings.PASSWORD_HASH_ITERATIONS.
+
+    Uses the same "pbkdf2_sha256" algorithm name as Django's hasher, so
+    existing hashes verify unchanged and are rehashed at the configured
+    cost the next time their user logs in.
+    """
+
+    @property
+    def iterations(self):
+        return getattr(settings, "PASSWORD_HASH_ITERATIONS", PBKDF2PasswordHasher.iterations)
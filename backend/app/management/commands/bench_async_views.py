@@ -0,0 +1,124 @@
+import asyncio
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+
+from app.benchmarks.fake_openrouter import FakeOpenRouterServer
+from app.utils import openrouter_client
+
+ENDPOINTS = {
+    "roadmap": ("skill-roadmap", lambda i: {"skills": [f"skill {i}"]}),
+    "market": ("skill-market-analysis", lambda i: {"skills": [f"skill {i}"]}),
+    "recommend": ("skill-recommend", lambda i: {"skills": [f"skill {i}"], "role": "Software Engineer",
+                                                "strategy": "llm"}),
+}
+
+
+def _app_threads():
+    # The fake server's per-connection threads are not part of the app under test.
+    return sum(1 for t in threading.enumerate() if "process_request_thread" not in t.name)
+
+
+class _ThreadPeak:
+    """Samples the app's thread count in the background and keeps the maximum."""
+
+    def __init__(self):
+        self.peak = _app_threads()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(0.01):
+            self.peak = max(self.peak, _app_threads())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def _summary(label, elapsed, latencies, statuses, threads):
+    latencies = sorted(latencies)
+    ok = sum(1 for s in statuses if s == 200)
+    return (f"{label:>5}: {elapsed:6.2f} s  {len(latencies) / elapsed:7.1f} req/s  "
+            f"p50 {statistics.median(latencies) * 1000:7.0f} ms  "
+            f"p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:7.0f} ms  "
+            f"{ok}/{len(statuses)} ok  peak threads {threads}")
+
+
+class Command(BaseCommand):
+    help = ("Compare concurrent requests to a sync endpoint on a WSGI thread pool with its async/ version "
+            "on one ASGI event loop, against a local fake LLM. The LLM cache, hedging and rate limits are bypassed.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200, help="Concurrent requests per run.")
+        parser.add_argument("--latency", type=float, default=1.0, help="Fake LLM latency per call, in seconds.")
+        parser.add_argument("--threads", type=int, default=8,
+                            help="WSGI request threads (e.g. gunicorn --workers 2 --threads 4).")
+        parser.add_argument("--endpoint", choices=sorted(ENDPOINTS), default="roadmap")
+
+    def _wsgi(self, path, body, count, threads):
+        client_local = threading.local()
+
+        def one(i):
+            if not hasattr(client_local, "client"):
+                client_local.client = Client(SERVER_NAME="localhost")
+            response = client_local.client.post(path, body(i), content_type="application/json")
+            # Every request is sent at once, so time spent queued for a thread counts.
+            return time.perf_counter() - start, response.status_code
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(one, range(count)))
+        return time.perf_counter() - start, results
+
+    def _asgi(self, path, body, count):
+        application = get_asgi_application()
+
+        async def run():
+            transport = httpx.ASGITransport(app=application)
+            async with httpx.AsyncClient(transport=transport, base_url="http://localhost", timeout=None) as client:
+                async def one(i):
+                    response = await client.post(path, json=body(i))
+                    return time.perf_counter() - start, response.status_code
+
+                start = time.perf_counter()
+                results = await asyncio.gather(*(one(i) for i in range(count)))
+                return time.perf_counter() - start, results
+
+        return asyncio.run(run())
+
+    def handle(self, *args, **options):
+        count, threads = options["requests"], options["threads"]
+        route, body = ENDPOINTS[options["endpoint"]]
+        os.environ.setdefault("OPENROUTER_API_KEY", "fake-key")
+        with FakeOpenRouterServer(latency=options["latency"]) as server, \
+                override_settings(LLM_CACHE_ENABLED=False, OPENROUTER_RATE_LIMIT_ENABLED=False,
+                                  LLM_HEDGE_ENABLED=False, LLM_SINGLEFLIGHT_SHARED=False,
+                                  MARKET_SNAPSHOT_MAX_AGE_DAYS=-1):
+            os.environ["OPENROUTER_BASE_URL"] = server.url
+            openrouter_client.reset_client()
+            with _ThreadPeak() as wsgi_peak:
+                wsgi_time, wsgi = self._wsgi(f"/api/v1/{route}", body, count, threads)
+            with _ThreadPeak() as asgi_peak:
+                asgi_time, asgi = self._asgi(f"/api/v1/async/{route}", body, count)
+        openrouter_client.reset_client()
+
+        self.stdout.write(f"{count} concurrent /{route} requests, fake LLM latency {options['latency']} s")
+        self.stdout.write(_summary("wsgi", wsgi_time, [r[0] for r in wsgi], [r[1] for r in wsgi],
+                                   wsgi_peak.peak) + f"  ({threads} request threads)")
+        self.stdout.write(_summary("asgi", asgi_time, [r[0] for r in asgi], [r[1] for r in asgi],
+                                   asgi_peak.peak) + "  (1 event loop)")
+        self.stdout.write(f"speedup: {wsgi_time / asgi_time:.1f}x")
+        # Django gives each ASGI request a thread for its sync middleware hooks; it sits idle while the view awaits.
+        self.stdout.write("asgi threads are mostly idle per-request middleware threads, not blocked upstream calls")
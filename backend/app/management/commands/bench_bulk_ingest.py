@@ -0,0 +1,61 @@
+import os
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+
+from app.benchmarks.fake_openrouter import FakeOpenRouterServer
+from app.benchmarks.sample_resumes import write_samples
+from app.utils import openrouter_client
+from app.utils.bulk_ingest import ingest_files, list_pdf_dir
+from app.utils.resume_pipeline import run_resume_pipeline
+
+
+class Command(BaseCommand):
+    help = ("Compare one-by-one /extract-skills processing with bulk ingestion against a local fake LLM. "
+            "Nothing is written: each run is rolled back, and the LLM cache and rate limits are bypassed.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--files", type=int, default=40)
+        parser.add_argument("--pages", type=int, default=2)
+        parser.add_argument("--latency", type=float, default=0.3, help="Fake LLM latency per call, in seconds.")
+        parser.add_argument("--workers", type=int, help="Bulk LLM-stage workers (BULK_LLM_WORKERS).")
+        parser.add_argument("--role", default="Software Engineer")
+
+    def _timed(self, run):
+        start = time.perf_counter()
+        with transaction.atomic():
+            result = run()
+            transaction.set_rollback(True)
+        return time.perf_counter() - start, result
+
+    def handle(self, *args, **options):
+        count, role = options["files"], options["role"]
+        os.environ.setdefault("OPENROUTER_API_KEY", "fake-key")
+        with tempfile.TemporaryDirectory() as directory, \
+                FakeOpenRouterServer(latency=options["latency"]) as server, \
+                override_settings(LLM_CACHE_ENABLED=False, OPENROUTER_RATE_LIMIT_ENABLED=False):
+            os.environ["OPENROUTER_BASE_URL"] = server.url
+            openrouter_client.reset_client()
+            write_samples(directory, count, options["pages"])
+            files = list_pdf_dir(directory)
+
+            def sequential():
+                for _, path in files:
+                    with open(path, "rb") as f:
+                        run_resume_pipeline(f, role)
+
+            calls = server.requests
+            seq_time, _ = self._timed(sequential)
+            seq_calls, calls = server.requests - calls, server.requests
+            bulk_time, result = self._timed(lambda: ingest_files(files, role, options["workers"]))
+            bulk_calls = server.requests - calls
+        openrouter_client.reset_client()
+
+        self.stdout.write(f"{count} resumes x {options['pages']} pages, fake LLM latency {options['latency']} s")
+        self.stdout.write(f"  one by one: {seq_time:7.2f} s  {count / seq_time:6.2f} resumes/s  ({seq_calls} LLM calls)")
+        self.stdout.write(f"  bulk:       {bulk_time:7.2f} s  {count / bulk_time:6.2f} resumes/s  ({bulk_calls} LLM calls, "
+                          f"{result['created']} created, {result['failed']} failed)")
+        self.stdout.write(f"  speedup:    {seq_time / bulk_time:.1f}x")
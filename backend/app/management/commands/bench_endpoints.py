@@ -0,0 +1,121 @@
+import json
+import os
+import platform
+import subprocess
+import tempfile
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connections
+from django.test import override_settings
+from django.test.utils import setup_databases, teardown_databases
+
+from app.benchmarks import load
+from app.benchmarks.fake_openrouter import FakeOpenRouterServer
+from app.utils import openrouter_client
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=settings.BASE_DIR, timeout=5).stdout.strip() or None
+    except Exception:
+        return None
+
+
+class Command(BaseCommand):
+    help = ("Load-test every API endpoint at increasing concurrency against a local fake OpenRouter server and "
+            "report throughput, p50/p95/p99 latency and memory as JSON. Runs on a throwaway test database; "
+            "the LLM cache and rate limits are bypassed unless asked for.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", default="1,4,16", help="Comma-separated concurrency levels.")
+        parser.add_argument("--requests-per-worker", type=int, default=5,
+                            help="Requests per endpoint and level = concurrency x this.")
+        parser.add_argument("--endpoints", help=f"Comma-separated subset of: {', '.join(load.SCENARIOS)}.")
+        parser.add_argument("--latency", type=float, default=0.2, help="Fake LLM latency per call, in seconds.")
+        parser.add_argument("--token-rate", type=float, help="Fake LLM tokens per second (default: instant).")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of LLM calls answered with 500.")
+        parser.add_argument("--rate-limit-rate", type=float, default=0.0,
+                            help="Fraction of LLM calls answered with 429.")
+        parser.add_argument("--llm-cache", action="store_true", help="Keep the LLM cache on.")
+        parser.add_argument("--rate-limits", action="store_true", help="Keep the outbound rate limits on.")
+        parser.add_argument("--output", help="Write the JSON report here instead of to stdout.")
+
+    def handle(self, *args, **options):
+        levels = [int(level) for level in options["concurrency"].split(",") if level.strip()]
+        names = [name.strip() for name in (options["endpoints"] or ",".join(load.SCENARIOS)).split(",")]
+        unknown = [name for name in names if name not in load.SCENARIOS]
+        if unknown or not levels or min(levels) < 1:
+            raise CommandError(f"Unknown endpoints: {', '.join(unknown)}" if unknown
+                               else "--concurrency needs levels of at least 1")
+
+        profile = {key: options[key] for key in ("latency", "token_rate", "error_rate", "rate_limit_rate")}
+        report = {
+            "commit": _commit(),
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+            "fake_llm": profile,
+            "llm_cache": options["llm_cache"],
+            "rate_limits": options["rate_limits"],
+            "results": [],
+        }
+        os.environ.setdefault("OPENROUTER_API_KEY", "fake-key")
+        with tempfile.TemporaryDirectory() as directory:
+            # A file-backed test database: the in-memory one serializes concurrent writers.
+            for alias in connections:
+                if connections[alias].vendor == "sqlite":
+                    connections[alias].settings_dict.setdefault("TEST", {})["NAME"] = os.path.join(
+                        directory, f"bench_{alias}.sqlite3")
+            old_config = setup_databases(verbosity=0, interactive=False)
+            try:
+                with FakeOpenRouterServer(**profile) as server, override_settings(
+                        DEBUG=False, ALLOWED_HOSTS=["localhost"],
+                        LLM_CACHE_ENABLED=options["llm_cache"],
+                        OPENROUTER_RATE_LIMIT_ENABLED=options["rate_limits"],
+                        EMAIL_OUTBOX_SEND_IN_BACKGROUND=False):
+                    os.environ["OPENROUTER_BASE_URL"] = server.url
+                    openrouter_client.reset_client()
+                    application = get_asgi_application()
+                    for name in names:
+                        for level in levels:
+                            report["results"].append(self._run(name, level, options, application, server))
+            finally:
+                openrouter_client.reset_client()
+                close_old_connections()
+                teardown_databases(old_config, verbosity=0)
+
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output + "\n")
+            self.stdout.write(f"Wrote {len(report['results'])} results to {options['output']}")
+        else:
+            self.stdout.write(output)
+
+    def _run(self, name, level, options, application, server):
+        scenario = load.SCENARIOS[name]
+        specs = load.build_requests(scenario, level * options["requests_per_worker"])
+        calls = server.requests
+        if scenario.transport == "asgi":
+            elapsed, samples = load.run_asgi(application, scenario, specs, level)
+        else:
+            elapsed, samples = load.run_wsgi(scenario, specs, level)
+        result = {
+            "endpoint": name,
+            "method": scenario.method,
+            "transport": scenario.transport,
+            "concurrency": level,
+            **load.summarize(elapsed, samples),
+            "llm_calls": server.requests - calls,
+            "rss_mb": load.rss_mb(),
+            "peak_rss_mb": load.peak_rss_mb(),
+        }
+        latency = result["latency_ms"]
+        self.stderr.write(f"{name:>30} c={level:<3} {result['throughput_rps']:8.2f} req/s  "
+                          f"p50 {latency['p50']:8.1f} ms  p95 {latency['p95']:8.1f} ms  p99 {latency['p99']:8.1f} ms  "
+                          f"{result['ok']}/{result['requests']} ok  rss {result['rss_mb']} MiB")
+        return result
@@ -0,0 +1,66 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, check_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory
+
+from app.models import User
+from app.utils.passwords import LEGACY_SALT
+from app.views import LoginView
+
+EMAIL = "bench-login@example.com"
+PASSWORD = "bench-password-123"
+
+
+class Command(BaseCommand):
+    help = ("Measure logins/sec for one worker: the old fixed-salt comparison, LoginView with the "
+            "configured hasher, and hashing spread over threads. Nothing is written.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--logins", type=int, default=20)
+        parser.add_argument("--threads", type=int, default=4, help="Threads for the off-thread hashing run.")
+        parser.add_argument("--iterations", type=int, help="PBKDF2 iterations (PASSWORD_HASH_ITERATIONS).")
+
+    def _rate(self, label, count, seconds):
+        self.stdout.write(f"{label:>28}: {count / seconds:8.1f} logins/s  ({seconds / count * 1000:.1f} ms each)")
+
+    def handle(self, *args, **options):
+        count = options["logins"]
+        iterations = options["iterations"] or settings.PASSWORD_HASH_ITERATIONS
+        with override_settings(PASSWORD_HASH_ITERATIONS=iterations):
+            self.stdout.write(f"{count} logins, hasher {settings.PASSWORD_HASHERS[0].rsplit('.', 1)[-1]}, "
+                              f"{iterations} PBKDF2 iterations")
+
+            # What LoginView used to do: Django's stock PBKDF2 with the shared salt, compared as strings.
+            stock = PBKDF2PasswordHasher()
+            stock.iterations = iterations  # same cost as the new path, so only the login logic differs
+            legacy = stock.encode(PASSWORD, LEGACY_SALT)
+            start = time.perf_counter()
+            for _ in range(count):
+                assert stock.encode(PASSWORD, LEGACY_SALT) == legacy
+            self._rate("old fixed-salt compare", count, time.perf_counter() - start)
+
+            factory = APIRequestFactory()
+            view = LoginView.as_view()
+            with transaction.atomic():
+                User.objects.create(name="bench", email=EMAIL, password=legacy)
+                # The first login upgrades the legacy hash to the configured hasher.
+                view(factory.post("/api/v1/login", {"email": EMAIL, "password": PASSWORD}, format="json"))
+                start = time.perf_counter()
+                for _ in range(count):
+                    response = view(factory.post("/api/v1/login", {"email": EMAIL, "password": PASSWORD},
+                                                 format="json"))
+                    assert response.data["success"], response.data
+                self._rate("LoginView", count, time.perf_counter() - start)
+                encoded = User.objects.get(email=EMAIL).password
+                transaction.set_rollback(True)
+
+            threads = options["threads"]
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                assert all(executor.map(lambda _: check_password(PASSWORD, encoded), range(count)))
+            self._rate(f"check_password x{threads} threads", count, time.perf_counter() - start)
@@ -0,0 +1,75 @@
+import os
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from openai import OpenAI
+
+from app.benchmarks.fake_openrouter import FakeOpenRouterServer
+from app.utils import openrouter_client
+
+
+def _call(client, model="fake/model"):
+    client.chat.completions.create(
+        model=model,
+        messages=[{"role": "user", "content": "ping"}],
+        max_tokens=5,
+        timeout=openrouter_client.model_timeout(model),
+    )
+
+
+def _summary(samples):
+    samples = sorted(samples)
+    return {
+        "mean_ms": statistics.mean(samples) * 1000,
+        "p50_ms": samples[len(samples) // 2] * 1000,
+        "p95_ms": samples[int(len(samples) * 0.95) - 1] * 1000,
+    }
+
+
+class Command(BaseCommand):
+    help = "Compare per-call overhead of a fresh OpenAI client per call with the pooled keep-alive client."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--calls", type=int, default=200)
+        parser.add_argument("--url", help="OpenAI-compatible base URL; defaults to a local fake server.")
+
+    def handle(self, *args, **options):
+        calls = options["calls"]
+        server = None
+        if options["url"]:
+            url = options["url"]
+        else:
+            server = FakeOpenRouterServer().start()
+            url = server.url
+            os.environ.setdefault("OPENROUTER_API_KEY", "fake-key")
+        os.environ["OPENROUTER_BASE_URL"] = url
+        api_key = os.environ["OPENROUTER_API_KEY"]
+
+        try:
+            fresh = []
+            for _ in range(calls):
+                start = time.perf_counter()
+                _call(OpenAI(base_url=url, api_key=api_key))
+                fresh.append(time.perf_counter() - start)
+
+            openrouter_client.reset_client()
+            _call(openrouter_client.get_client())  # open the pooled connection once
+            pooled = []
+            for _ in range(calls):
+                start = time.perf_counter()
+                _call(openrouter_client.get_client())
+                pooled.append(time.perf_counter() - start)
+        finally:
+            openrouter_client.reset_client()
+            if server:
+                server.stop()
+
+        before, after = _summary(fresh), _summary(pooled)
+        self.stdout.write(f"{calls} calls against {url}")
+        for label, stats in (("fresh client per call", before), ("pooled client", after)):
+            self.stdout.write(
+                f"{label:>22}: mean {stats['mean_ms']:.2f} ms  p50 {stats['p50_ms']:.2f} ms  "
+                f"p95 {stats['p95_ms']:.2f} ms"
+            )
+        self.stdout.write(f"per-call overhead saved: {before['mean_ms'] - after['mean_ms']:.2f} ms")
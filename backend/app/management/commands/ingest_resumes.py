@@ -0,0 +1,41 @@
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app.utils.bulk_ingest import BulkIngestError, ingest_files, ingest_zip, list_pdf_dir
+from app.utils.canonical import canonical_role
+
+
+class Command(BaseCommand):
+    help = "Extract skills from every resume PDF in a ZIP file or directory and store them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="ZIP file or directory of PDFs.")
+        parser.add_argument("--role", default="", help="Target role for skill recommendations.")
+        parser.add_argument("--workers", type=int, help="Resumes in their LLM stage at once (BULK_LLM_WORKERS).")
+        parser.add_argument("--manifest", help="Write the per-file manifest as JSON to this path.")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        role = canonical_role(options["role"])
+        try:
+            if os.path.isdir(path):
+                result = ingest_files(list_pdf_dir(path), role, options["workers"])
+            elif os.path.isfile(path):
+                result = ingest_zip(path, role, options["workers"])
+            else:
+                raise CommandError(f"{path} does not exist")
+        except BulkIngestError as e:
+            raise CommandError(str(e))
+
+        if options["manifest"]:
+            with open(options["manifest"], "w") as f:
+                json.dump(result, f, indent=2, default=str)
+        for entry in result["results"]:
+            if entry["status"] == "failed":
+                self.stdout.write(self.style.WARNING(f"{entry['file']}: {entry['error']}"))
+        self.stdout.write(self.style.SUCCESS(
+            f"{result['files']} files: {result['created']} created, {result['duplicate']} duplicate, "
+            f"{result['failed']} failed in {result['elapsed_s']} s ({result['files_per_s']} files/s)"
+        ))
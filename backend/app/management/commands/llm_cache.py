@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from app.utils import llm_cache
+
+
+class Command(BaseCommand):
+    help = ("Clear the shared LLM response cache. Hit/miss counters are kept per worker process; "
+            "read them from GET /metrics (llm_cache_* and llm_singleflight_* gauges).")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clear", action="store_true", required=True, help="Remove every cached response.")
+
+    def handle(self, *args, **options):
+        llm_cache.clear()
+        self.stdout.write(self.style.SUCCESS("LLM cache cleared"))
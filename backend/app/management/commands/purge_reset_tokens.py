@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from app.utils.reset_tokens import purge_expired
+
+
+class Command(BaseCommand):
+    help = "Delete expired or used password reset tokens. Run it on a schedule (e.g. a daily cron job)."
+
+    def handle(self, *args, **options):
+        result = purge_expired()
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {result['tokens']} reset tokens and {result['used_tokens']} used-token records"
+        ))
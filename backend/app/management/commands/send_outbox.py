@@ -0,0 +1,30 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from app.utils.outbox import drain, seconds_until_due
+
+
+class Command(BaseCommand):
+    help = ("Send the emails waiting in the outbox over one mail connection per batch. "
+            "Use --loop to run as a dedicated sender when EMAIL_OUTBOX_SEND_IN_BACKGROUND is off.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch", type=int, default=getattr(settings, "EMAIL_OUTBOX_BATCH_SIZE", 50),
+                            help="Emails sent per connection.")
+        parser.add_argument("--loop", action="store_true", help="Keep running, sending emails as they fall due.")
+        parser.add_argument("--poll", type=float, default=getattr(settings, "EMAIL_OUTBOX_POLL_SECONDS", 60),
+                            help="With --loop, the longest wait between checks in seconds.")
+
+    def handle(self, *args, **options):
+        while True:
+            result = drain(options["batch"])
+            if result["claimed"] or not options["loop"]:
+                self.stdout.write(
+                    f"Sent {result['sent']}, retrying {result['retrying']}, failed {result['failed']}"
+                )
+            if not options["loop"]:
+                return
+            until_due = seconds_until_due()
+            time.sleep(options["poll"] if until_due is None else min(options["poll"], max(until_due, 1.0)))
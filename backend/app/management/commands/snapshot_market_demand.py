@@ -0,0 +1,30 @@
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from app.utils.canonical import canonical_skills
+from app.utils.market_snapshots import take_snapshot
+
+
+class Command(BaseCommand):
+    help = ("Store today's market demand analysis for the most common resume skills. "
+            "Run it on a schedule (e.g. a daily cron job); /skill-market-analysis serves from the latest snapshot.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=getattr(settings, "MARKET_SNAPSHOT_TOP_N", 50),
+                            help="Number of most frequent skills to snapshot.")
+        parser.add_argument("--skill", action="append", default=[], help="Extra skill to include (repeatable).")
+        parser.add_argument("--date", help="Snapshot date as YYYY-MM-DD (defaults to today).")
+
+    def handle(self, *args, **options):
+        snapshot_date = None
+        if options["date"]:
+            try:
+                snapshot_date = datetime.date.fromisoformat(options["date"])
+            except ValueError:
+                raise CommandError("--date must be YYYY-MM-DD")
+        result = take_snapshot(options["top"], snapshot_date, extra_skills=canonical_skills(options["skill"]))
+        self.stdout.write(self.style.SUCCESS(f"Stored {result['stored']} market snapshots for {result['date']}"))
+        if result["failed"]:
+            self.stdout.write(self.style.WARNING(f"Failed: {', '.join(result['failed'])}"))
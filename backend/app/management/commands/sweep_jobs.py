@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from app.utils.jobs import run_job, sweep_stale_jobs
+
+
+class Command(BaseCommand):
+    help = ("Fail (or with --requeue, run again) extraction jobs left queued or running by a worker that died, "
+            "and delete spooled uploads no live job uses. Run it at deploy time or on a schedule.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requeue", action="store_true",
+                            help="Run stale jobs whose upload is still on disk again, in this process.")
+        parser.add_argument("--older-than", type=float,
+                            default=getattr(settings, "EXTRACTION_JOB_STALE_SECONDS", 3600),
+                            help="Seconds without an update after which a job counts as stale.")
+
+    def handle(self, *args, **options):
+        result = sweep_stale_jobs(options["requeue"], options["older_than"])
+        for job_id in result["requeued"]:
+            run_job(job_id)
+        self.stdout.write(self.style.SUCCESS(
+            f"Requeued {len(result['requeued'])} jobs, failed {len(result['failed'])}, "
+            f"removed {len(result['removed_uploads'])} orphaned uploads"
+        ))
@@ -0,0 +1,52 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from .utils import metrics
+
+
+class ServerTimingMiddleware:
+    """Times each request: observes http_request_duration_seconds and adds a Server-Timing header.
+
+    The header lists the stages timed while the view ran (see metrics.timed)
+    and the total. For streamed responses it covers the time to the first byte.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        token = metrics.begin_request()
+        try:
+            response = self.get_response(request)
+        finally:
+            timings = metrics.end_request(token)
+        return self._finish(request, response, started, timings)
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        token = metrics.begin_request()
+        try:
+            response = await self.get_response(request)
+        finally:
+            timings = metrics.end_request(token)
+        return self._finish(request, response, started, timings)
+
+    def _finish(self, request, response, started, timings):
+        total = time.perf_counter() - started
+        match = getattr(request, "resolver_match", None)
+        metrics.observe("http_request_duration_seconds", total,
+                        route=match.route if match else "unmatched",
+                        method=request.method, status=response.status_code)
+        if getattr(settings, "SERVER_TIMING_ENABLED", True):
+            response["Server-Timing"] = metrics.server_timing_header(timings, total)
+        return response
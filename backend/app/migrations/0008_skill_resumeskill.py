@@ -0,0 +1,87 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:04
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def _split(value):
+    return [" ".join(s.split())[:120] for s in (value or "").split(",") if s.strip()]
+
+
+def backfill_resume_skills(apps, schema_editor):
+    """Create Skill/ResumeSkill rows from the comma-separated skill columns."""
+    Resume = apps.get_model('app', 'Resume')
+    Skill = apps.get_model('app', 'Skill')
+    ResumeSkill = apps.get_model('app', 'ResumeSkill')
+
+    rows = list(Resume.objects.values_list('id', 'extracted_skills', 'recommended_skills'))
+    names = {}
+    for _, extracted, recommended in rows:
+        for name in _split(extracted) + _split(recommended):
+            names.setdefault(name.lower(), name)
+    Skill.objects.bulk_create([Skill(name=name, key=key) for key, name in names.items()], ignore_conflicts=True)
+    skill_ids = dict(Skill.objects.values_list('key', 'id'))
+
+    links = []
+    for resume_id, extracted, recommended in rows:
+        extracted_keys = {s.lower() for s in _split(extracted)}
+        recommended_keys = {s.lower() for s in _split(recommended)}
+        for key in extracted_keys | recommended_keys:
+            links.append(ResumeSkill(
+                resume_id=resume_id,
+                skill_id=skill_ids[key],
+                is_extracted=key in extracted_keys,
+                is_recommended=key in recommended_keys,
+            ))
+    ResumeSkill.objects.bulk_create(links, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0007_resume_content_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=120)),
+                ('key', models.CharField(max_length=120, unique=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='resume',
+            name='role',
+            field=models.CharField(blank=True, db_index=True, max_length=120),
+        ),
+        migrations.CreateModel(
+            name='ResumeSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_extracted', models.BooleanField(default=False)),
+                ('is_recommended', models.BooleanField(default=False)),
+                ('resume', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='app.resume')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resume_links', to='app.skill')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='skills',
+            field=models.ManyToManyField(blank=True, related_name='resumes', through='app.ResumeSkill', to='app.skill'),
+        ),
+        migrations.AddIndex(
+            model_name='resumeskill',
+            index=models.Index(fields=['skill', 'is_extracted'], name='resumeskill_extracted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resumeskill',
+            index=models.Index(fields=['skill', 'is_recommended'], name='resumeskill_recommended_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='resumeskill',
+            constraint=models.UniqueConstraint(fields=('resume', 'skill'), name='unique_resume_skill'),
+        ),
+        migrations.RunPython(backfill_resume_skills, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0008_skill_resumeskill'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MarketSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('snapshot_date', models.DateField()),
+                ('name', models.CharField(max_length=120)),
+                ('data', models.JSONField()),
+                ('model', models.CharField(blank=True, max_length=120)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='market_snapshots', to='app.skill')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['snapshot_date'], name='marketsnapshot_date_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='marketsnapshot',
+            constraint=models.UniqueConstraint(fields=('skill', 'snapshot_date'), name='unique_market_snapshot'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0010_emailoutbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UsedResetToken',
+            fields=[
+                ('digest', models.CharField(max_length=32, primary_key=True, serialize=False)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='token',
+            index=models.Index(fields=['user_id', 'created_at'], name='token_user_created_idx'),
+        ),
+    ]
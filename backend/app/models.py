@@ -1,14 +1,123 @@
+import uuid
 from django.db import models
 
+class Skill(models.Model):
+    """A canonical skill name, shared by every resume that lists it."""
+    name = models.CharField(max_length=120)
+    key = models.CharField(max_length=120, unique=True)  # lowercased name, used for lookups
+
+    def __str__(self):
+        return self.name
+
 class Resume(models.Model):
     file_name = models.CharField(max_length=255, blank=True, null=True)
-    role = models.CharField(max_length=120, blank=True)
-    extracted_skills = models.TextField(blank=True, null=True)  # comma separated
+    role = models.CharField(max_length=120, blank=True, db_index=True)
+    extracted_skills = models.TextField(blank=True, null=True)  # comma separated, mirrors ResumeSkill rows
     recommended_skills = models.TextField(blank=True, null=True)
+    content_hash = models.CharField(max_length=64, unique=True, blank=True, null=True)  # sha256 of the uploaded PDF
+    skills = models.ManyToManyField(Skill, through="ResumeSkill", related_name="resumes", blank=True)
 
     def __str__(self):
         return f"Resume {self.id} - {self.role or 'NoRole'}"
 
+class ResumeSkill(models.Model):
+    """Links a resume to a skill it lists (extracted) or was advised to learn (recommended)."""
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name="skill_links")
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="resume_links")
+    is_extracted = models.BooleanField(default=False)
+    is_recommended = models.BooleanField(default=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["resume", "skill"], name="unique_resume_skill"),
+        ]
+        indexes = [
+            models.Index(fields=["skill", "is_extracted"], name="resumeskill_extracted_idx"),
+            models.Index(fields=["skill", "is_recommended"], name="resumeskill_recommended_idx"),
+        ]
+
+    def __str__(self):
+        return f"Resume {self.resume_id} - {self.skill_id}"
+
+class MarketSnapshot(models.Model):
+    """Precomputed market analysis for one skill on one day (see the snapshot_market_demand command)."""
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="market_snapshots")
+    snapshot_date = models.DateField()
+    name = models.CharField(max_length=120)  # skill name as returned by the model
+    data = models.JSONField()
+    model = models.CharField(max_length=120, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["skill", "snapshot_date"], name="unique_market_snapshot"),
+        ]
+        indexes = [
+            models.Index(fields=["snapshot_date"], name="marketsnapshot_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} - {self.snapshot_date}"
+
+class ExtractionJob(models.Model):
+    """A resume upload processed in the background; polled through its status endpoint."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (SUCCEEDED, "Succeeded"),
+        (FAILED, "Failed"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=QUEUED)
+    role = models.CharField(max_length=120, blank=True)
+    file_name = models.CharField(max_length=255, blank=True, null=True)
+    upload_path = models.CharField(max_length=500, blank=True)  # spooled upload, removed when the job ends
+    stages = models.JSONField(default=dict, blank=True)  # per-stage status and timings
+    result = models.JSONField(blank=True, null=True)
+    error = models.TextField(blank=True, null=True)
+    resume = models.ForeignKey(Resume, on_delete=models.SET_NULL, blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"ExtractionJob {self.id} - {self.status}"
+
+class EmailOutbox(models.Model):
+    """An email waiting to be sent; app.utils.outbox sends pending rows in batches."""
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (SENT, "Sent"),
+        (FAILED, "Failed"),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    html_body = models.TextField(blank=True, null=True)
+    from_email = models.CharField(max_length=255, blank=True, null=True)
+    to = models.JSONField(default=list)  # recipient addresses
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField()  # also pushed forward while a sender holds the row
+    last_error = models.TextField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="emailoutbox_due_idx"),
+        ]
+
+    def __str__(self):
+        return f"EmailOutbox {self.id} - {self.status}"
+
 class Token(models.Model):
     id = models.AutoField(primary_key=True)
     token = models.CharField(max_length=255)
@@ -17,6 +126,16 @@ class Token(models.Model):
     user_id = models.IntegerField()
     is_used = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user_id", "created_at"], name="token_user_created_idx"),
+        ]
+
+class UsedResetToken(models.Model):
+    """A redeemed signed reset token, kept until it would have expired anyway."""
+    digest = models.CharField(max_length=32, primary_key=True)  # truncated sha256 of the token
+    expires_at = models.DateTimeField(db_index=True)
+
 
 class User(models.Model):
     id = models.AutoField(primary_key=True)
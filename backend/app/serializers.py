@@ -1,10 +1,10 @@
 from rest_framework import serializers
-from .models import Resume, Token, User
+from .models import ExtractionJob, Resume, Token, User
 
 class ResumeSerializer(serializers.ModelSerializer):
     class Meta:
         model = Resume
-        fields = '__all__'
+        exclude = ['skills']
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
@@ -15,4 +15,12 @@ class UserSerializer(serializers.ModelSerializer):
 class TokenSerializer(serializers.ModelSerializer):
     class Meta:
         model = Token
-        fields = ["token", "created_at", "expires_at", "user_id", "is_used"]
\ No newline at end of file
+        fields = ["token", "created_at", "expires_at", "user_id", "is_used"]
+
+
+class ExtractionJobSerializer(serializers.ModelSerializer):
+    job_id = serializers.UUIDField(source="id", read_only=True)
+
+    class Meta:
+        model = ExtractionJob
+        fields = ["job_id", "status", "role", "file_name", "stages", "result", "error", "created_at", "updated_at"]
\ No newline at end of file
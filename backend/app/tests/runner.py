@@ -0,0 +1,22 @@
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class TestRunner(DiscoverRunner):
+    """DiscoverRunner with the file-based "llm" cache moved to a throwaway directory."""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._llm_cache_dir = tempfile.mkdtemp(prefix="llm-cache-test-")
+        llm = {**settings.CACHES["llm"], "LOCATION": self._llm_cache_dir}
+        self._llm_cache = override_settings(CACHES={**settings.CACHES, "llm": llm})
+        self._llm_cache.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._llm_cache.disable()
+        shutil.rmtree(self._llm_cache_dir, ignore_errors=True)
+        super().teardown_test_environment(**kwargs)
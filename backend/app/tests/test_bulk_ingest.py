@@ -0,0 +1,96 @@
+import io
+import os
+import shutil
+import tempfile
+import zipfile
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from app.benchmarks.sample_resumes import sample_resume
+from app.models import Resume
+from app.utils.bulk_ingest import BulkIngestError, ingest_files, ingest_zip, unpack_zip
+
+
+def _zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    buffer.seek(0)
+    return buffer
+
+
+class UnpackZipTests(TestCase):
+    def setUp(self):
+        self.target = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.target, ignore_errors=True)
+
+    @override_settings(PDF_MAX_BYTES=100)
+    def test_oversized_entries_are_reported_not_written(self):
+        files, failed = unpack_zip(_zip({"a.pdf": b"x" * 50, "b.pdf": b"x" * 500, "notes.txt": b"hi"}), self.target)
+
+        self.assertEqual([name for name, _ in files], ["a.pdf"])
+        self.assertEqual([entry["file"] for entry in failed], ["b.pdf"])
+        self.assertEqual(os.listdir(self.target), [os.path.basename(files[0][1])])
+
+    def test_not_a_zip(self):
+        with self.assertRaises(BulkIngestError):
+            unpack_zip(io.BytesIO(b"not a zip"), self.target)
+
+    @override_settings(BULK_MAX_FILES=1)
+    def test_too_many_files(self):
+        with self.assertRaises(BulkIngestError):
+            unpack_zip(_zip({"a.pdf": b"1", "b.pdf": b"2"}), self.target)
+
+
+@override_settings(PDF_WORKERS=1)
+@mock.patch("app.utils.bulk_ingest.record_resume")
+@mock.patch("app.utils.bulk_ingest.recommend_for_resume", return_value=["Docker"])
+@mock.patch("app.utils.bulk_ingest.extract_skills", return_value=["python"])
+class IngestTests(TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir, ignore_errors=True)
+
+    def _write(self, name, data):
+        path = os.path.join(self.dir, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return name, path
+
+    def test_duplicates_are_processed_once_and_progress_is_reported(self, extract, recommend, record):
+        files = [self._write("a.pdf", sample_resume(1)), self._write("b.pdf", sample_resume(1)),
+                 self._write("c.pdf", sample_resume(2))]
+        calls = []
+
+        result = ingest_files(files, "Backend", workers=2, progress=lambda done, total: calls.append((done, total)))
+
+        self.assertEqual([r["status"] for r in result["results"]], ["created", "duplicate", "created"])
+        self.assertEqual((result["created"], result["duplicate"], result["failed"]), (2, 1, 0))
+        self.assertEqual(extract.call_count, 2)
+        self.assertEqual(Resume.objects.count(), 2)
+        self.assertEqual(calls, [(1, 3), (2, 3), (3, 3)])
+
+        again = ingest_files(files[:1], "Backend")
+        self.assertEqual(again["results"][0]["status"], "duplicate")
+        self.assertEqual(again["results"][0]["resume_id"], result["results"][0]["resume_id"])
+
+    def test_unreadable_pdf_fails_only_that_file(self, extract, recommend, record):
+        files = [self._write("a.pdf", sample_resume(1)), self._write("broken.pdf", b"%PDF-1.4 garbage")]
+
+        result = ingest_files(files, "")
+
+        self.assertEqual([r["status"] for r in result["results"]], ["created", "failed"])
+        self.assertEqual(Resume.objects.count(), 1)
+
+    def test_ingest_zip_uses_and_removes_the_given_work_dir(self, extract, recommend, record):
+        work_dir = tempfile.mkdtemp(prefix="bulk-ingest-")
+        calls = []
+
+        result = ingest_zip(_zip({"a.pdf": sample_resume(1)}), "", progress=lambda *args: calls.append(args),
+                            work_dir=work_dir)
+
+        self.assertEqual(result["created"], 1)
+        self.assertEqual(calls[-1], (1, 1))
+        self.assertFalse(os.path.exists(work_dir))
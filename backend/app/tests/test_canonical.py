@@ -0,0 +1,29 @@
+from django.test import SimpleTestCase
+
+from app.utils.canonical import canonical_role, canonical_skill, canonical_skills
+
+
+class CanonicalTests(SimpleTestCase):
+    def test_aliases_and_case_map_to_one_name(self):
+        self.assertEqual(canonical_skill("reactjs"), "React")
+        self.assertEqual(canonical_skill("React.js"), "React")
+        self.assertEqual(canonical_skill("Golang"), "Go")
+        self.assertEqual(canonical_skills(["python", "Python", "PYTHON", "k8s", ""]), ["Python", "Kubernetes"])
+
+    def test_near_identical_typos_are_fixed(self):
+        self.assertEqual(canonical_skill("kubernets"), "Kubernetes")
+
+    def test_distinct_names_are_not_merged(self):
+        for name in ("NestJS", "Nest.js", "Reactive", "Scalar", "TensorFlow Lite"):
+            with self.subTest(name=name):
+                self.assertEqual(canonical_skill(name), name)
+        self.assertNotEqual(canonical_skill("Nest.js"), canonical_skill("Next.js"))
+        self.assertNotEqual(canonical_skill("Reactive"), "React Native")
+        self.assertNotEqual(canonical_skill("Scalar"), "Scala")
+        self.assertNotEqual(canonical_skill("TensorFlow Lite"), "TensorFlow")
+
+    def test_roles_are_never_fuzzed(self):
+        self.assertEqual(canonical_role("Project Manager"), "Project Manager")
+        self.assertEqual(canonical_role("Product Manager"), "Product Manager")
+        self.assertEqual(canonical_role("Produt Manager"), "Produt Manager")
+        self.assertEqual(canonical_role("SDE"), "Software Engineer")
@@ -0,0 +1,66 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from app.models import Resume
+from app.utils import cooccurrence
+from app.utils.cooccurrence import CooccurrenceModel
+from app.utils.skill_index import set_resume_skills
+
+RESUMES = [
+    ("Data Engineer", ["Python", "Spark", "SQL"], ["Airflow"]),
+    ("Data Engineer", ["Python", "Spark", "Kafka"], ["Airflow"]),
+    ("Data Engineer", ["Python", "SQL"], []),
+    ("Frontend Developer", ["JavaScript", "React"], ["TypeScript"]),
+]
+
+
+def _counts(model):
+    return (dict(model.skill_counts), {k: dict(v) for k, v in model.pair_counts.items() if v},
+            dict(model.role_counts), {k: dict(v) for k, v in model.role_skill_counts.items()})
+
+
+class CooccurrenceModelTests(TestCase):
+    def setUp(self):
+        for role, extracted, recommended in RESUMES:
+            set_resume_skills(Resume.objects.create(role=role), extracted, recommended)
+        cooccurrence.reset_model()
+        self.addCleanup(cooccurrence.reset_model)
+
+    def test_incremental_counts_match_a_rebuild(self):
+        incremental = CooccurrenceModel()
+        for role, extracted, recommended in RESUMES:
+            incremental.add_resume(role, extracted, recommended)
+
+        self.assertEqual(_counts(incremental), _counts(CooccurrenceModel.from_db()))
+
+    def test_recommend_ranks_role_and_pair_evidence(self):
+        model = CooccurrenceModel.from_db()
+
+        self.assertTrue(model.knows_role("Data Engineer"))
+        self.assertFalse(model.knows_role("Frontend Developer"))
+        # SQL: 2/3 + (2/6 + 1/4); Kafka: 1/3 + (1/6 + 1/4); Airflow: 2/3 from the role alone.
+        self.assertEqual(model.recommend(["python", "spark"], "Data Engineer", limit=3), ["SQL", "Kafka", "Airflow"])
+
+    def test_cold_start_role_returns_none(self):
+        self.assertIsNone(cooccurrence.recommend(["JavaScript"], "Frontend Developer"))
+
+    def test_recorded_resumes_reach_the_loaded_model(self):
+        cooccurrence.get_model()
+        for _ in range(2):
+            cooccurrence.record_resume("Frontend Developer", ["JavaScript", "React"], ["TypeScript"])
+
+        self.assertEqual(cooccurrence.recommend(["JavaScript"], "Frontend Developer", limit=2),
+                         ["React", "TypeScript"])
+
+    @mock.patch("app.views.recommend_skills", return_value=["Rust", "Python"])
+    def test_endpoint_falls_back_to_the_llm_for_unknown_roles(self, recommend_skills):
+        known = self.client.post("/api/v1/skill-recommend", {"skills": ["Python"], "role": "Data Engineer"},
+                                 content_type="application/json").json()
+        unknown = self.client.post("/api/v1/skill-recommend", {"skills": ["Python"], "role": "Astronaut"},
+                                   content_type="application/json").json()
+
+        self.assertEqual(known["strategy"], "cooccurrence")
+        self.assertNotIn("Python", known["recommended_skills"])
+        self.assertEqual(unknown, {"recommended_skills": ["Rust"], "strategy": "llm"})
+        recommend_skills.assert_called_once()
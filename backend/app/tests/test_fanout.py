@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from app.utils.fanout import afan_out, fan_out
+
+
+class FanOutTests(SimpleTestCase):
+    def test_results_by_item_with_failures_as_none(self):
+        def func(item):
+            if item == "bad":
+                raise ValueError("boom")
+            return item.upper()
+
+        self.assertEqual(fan_out(func, ["a", "bad", "b", "a"]), {"a": "A", "bad": None, "b": "B"})
+
+    def test_at_most_max_workers_run_at_once(self):
+        lock = threading.Lock()
+        running, peak = [0], [0]
+
+        def func(item):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return item
+
+        results = fan_out(func, range(8), max_workers=3)
+
+        self.assertEqual(results, {i: i for i in range(8)})
+        self.assertEqual(peak[0], 3)
+
+    def test_overrunning_call_is_dropped_without_holding_up_the_rest(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def func(item):
+            if item == "slow":
+                release.wait(5)
+            return item
+
+        started = time.monotonic()
+        results = fan_out(func, ["slow", "a", "b"], max_workers=3, timeout=0.2)
+
+        self.assertEqual(results, {"slow": None, "a": "a", "b": "b"})
+        self.assertLess(time.monotonic() - started, 2)
+
+    def test_deadline_starts_when_a_call_starts(self):
+        def func(item):
+            time.sleep(0.1)
+            return item
+
+        # Queued behind each other, the calls take longer than one timeout in total.
+        self.assertEqual(fan_out(func, [1, 2, 3, 4], max_workers=1, timeout=0.3), {1: 1, 2: 2, 3: 3, 4: 4})
+
+
+class AsyncFanOutTests(SimpleTestCase):
+    def test_cap_deadline_and_failures(self):
+        running, peak = [0], [0]
+
+        async def func(item):
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            try:
+                if item == "bad":
+                    raise ValueError("boom")
+                await asyncio.sleep(5 if item == "slow" else 0.05)
+                return item
+            finally:
+                running[0] -= 1
+
+        results = asyncio.run(afan_out(func, ["slow", "a", "bad", "b", "c"], max_workers=2, timeout=0.3))
+
+        self.assertEqual(results, {"slow": None, "a": "a", "bad": None, "b": "b", "c": "c"})
+        self.assertEqual(peak[0], 2)
@@ -0,0 +1,93 @@
+import asyncio
+import threading
+
+from django.test import SimpleTestCase, override_settings
+
+from app.utils import hedging, latency
+
+
+@override_settings(LLM_HEDGE_ENABLED=True, LLM_HEDGE_DEFAULT_DELAY=0.05, LLM_HEDGE_MIN_SAMPLES=1000)
+class HedgedCallTests(SimpleTestCase):
+    def setUp(self):
+        latency.reset()
+        self.addCleanup(latency.reset)
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+    def test_slow_model_is_hedged_and_cancelled_without_a_latency_sample(self):
+        cancelled = threading.Event()
+
+        def call(model, attempt):
+            if model == "slow":
+                attempt.on_cancel(cancelled.set)
+                self.release.wait(5)
+                return "late"
+            return "fast answer"
+
+        self.assertEqual(hedging.hedged_call(["slow", "fast"], call), ("fast answer", "fast"))
+        self.assertTrue(cancelled.wait(1))
+        self.assertEqual(latency.percentile("slow", 50), None)
+        self.assertIsNotNone(latency.percentile("fast", 50))
+
+    def test_invalid_or_failed_answers_fall_back_along_the_chain(self):
+        calls = []
+
+        def call(model, attempt):
+            calls.append(model)
+            if model == "broken":
+                raise RuntimeError("upstream 500")
+            return {"invalid": "not json", "good": '{"ok": true}'}[model]
+
+        with self.assertLogs("app.utils.hedging", "WARNING"):
+            text, model = hedging.hedged_call(["broken", "invalid", "good"], call, valid=lambda t: t.startswith("{"))
+
+        self.assertEqual((text, model), ('{"ok": true}', "good"))
+        self.assertEqual(calls, ["broken", "invalid", "good"])
+
+    def test_every_model_failing(self):
+        self.assertEqual(hedging.hedged_call(["a", "b"], lambda model, attempt: ""), ("", None))
+
+    @override_settings(LLM_HEDGE_ENABLED=False)
+    def test_without_hedging_a_slow_model_is_waited_for(self):
+        calls = []
+
+        def call(model, attempt):
+            calls.append(model)
+            self.release.wait(0.2)
+            return model
+
+        self.assertEqual(hedging.hedged_call(["first", "second"], call), ("first", "first"))
+        self.assertEqual(calls, ["first"])
+
+    def test_async_hedge_cancels_the_loser(self):
+        cancelled = []
+
+        async def call(model):
+            if model == "slow":
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(model)
+                    raise
+            return f"{model} answer"
+
+        self.assertEqual(asyncio.run(hedging.ahedged_call(["slow", "fast"], call)), ("fast answer", "fast"))
+        self.assertEqual(cancelled, ["slow"])
+        self.assertIsNone(latency.percentile("slow", 50))
+
+
+class HedgeDelayTests(SimpleTestCase):
+    def setUp(self):
+        latency.reset()
+        self.addCleanup(latency.reset)
+
+    @override_settings(LLM_HEDGE_MIN_SAMPLES=3, LLM_HEDGE_DEFAULT_DELAY=15.0, LLM_HEDGE_MIN_DELAY=1.0,
+                       LLM_HEDGE_PERCENTILE=95)
+    def test_uses_p95_once_enough_samples_exist(self):
+        self.assertEqual(hedging.hedge_delay("m"), 15.0)
+        for seconds in (0.1, 0.2, 0.3):
+            latency.record("m", seconds)
+        self.assertEqual(hedging.hedge_delay("m"), 1.0)
+        for seconds in (4.0, 5.0, 6.0):
+            latency.record("m", seconds)
+        self.assertGreater(hedging.hedge_delay("m"), 4.0)
@@ -0,0 +1,142 @@
+import os
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from app.models import ExtractionJob, Resume
+from app.utils import jobs
+
+
+def _touch(path, age):
+    if not os.path.exists(path):
+        open(path, "wb").close()
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+class JobTestCase(TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir, ignore_errors=True)
+        settings_patch = override_settings(EXTRACTION_JOB_UPLOAD_DIR=self.dir)
+        settings_patch.enable()
+        self.addCleanup(settings_patch.disable)
+
+    def _job(self, status, age=0, **fields):
+        job = ExtractionJob.objects.create(status=status, **fields)
+        ExtractionJob.objects.filter(pk=job.pk).update(updated_at=timezone.now() - timedelta(seconds=age))
+        return job
+
+
+class SweepTests(JobTestCase):
+    def test_stale_jobs_are_requeued_or_failed(self):
+        upload = _touch(os.path.join(self.dir, "resume-a.pdf"), 0)
+        with_upload = self._job(ExtractionJob.RUNNING, age=7200, upload_path=upload,
+                                stages={"extract_skills": {"status": "running"}})
+        without_upload = self._job(ExtractionJob.RUNNING, age=7200, upload_path=os.path.join(self.dir, "gone.pdf"))
+        fresh = self._job(ExtractionJob.RUNNING, age=10)
+
+        result = jobs.sweep_stale_jobs(requeue=True)
+
+        self.assertEqual(result["requeued"], [with_upload.pk])
+        self.assertEqual(result["failed"], [without_upload.pk])
+        with_upload.refresh_from_db()
+        self.assertEqual(with_upload.status, ExtractionJob.QUEUED)
+        self.assertEqual(with_upload.stages["extract_skills"], {"status": "pending"})
+        fresh.refresh_from_db()
+        self.assertEqual(fresh.status, ExtractionJob.RUNNING)
+
+    def test_without_requeue_stale_jobs_fail_and_lose_their_upload(self):
+        upload = _touch(os.path.join(self.dir, "resume-a.pdf"), 0)
+        job = self._job(ExtractionJob.QUEUED, age=7200, upload_path=upload)
+
+        result = jobs.sweep_stale_jobs()
+
+        self.assertEqual(result["failed"], [job.pk])
+        self.assertFalse(os.path.exists(upload))
+
+    def test_orphans_are_removed_but_live_uploads_and_work_dirs_kept(self):
+        orphan = _touch(os.path.join(self.dir, "resume-orphan.zip"), 7200)
+        recent = _touch(os.path.join(self.dir, "resume-recent.pdf"), 10)
+        live_upload = _touch(os.path.join(self.dir, "resume-live.zip"), 7200)
+        live_dir = tempfile.mkdtemp(prefix="bulk-ingest-", dir=self.dir)
+        dead_dir = tempfile.mkdtemp(prefix="bulk-ingest-", dir=self.dir)
+        other = _touch(os.path.join(self.dir, "unrelated.pdf"), 7200)
+        for path in (live_dir, dead_dir):
+            _touch(path, 7200)
+        self._job(ExtractionJob.RUNNING, upload_path=live_upload,
+                  stages={jobs.BULK_STAGE: {"status": "running", "work_dir": live_dir}})
+
+        removed = jobs.sweep_stale_jobs()["removed_uploads"]
+
+        self.assertCountEqual(removed, [orphan, dead_dir])
+        for path in (recent, live_upload, live_dir, other):
+            self.assertTrue(os.path.exists(path), path)
+
+
+@mock.patch("app.utils.jobs.connection")
+@mock.patch("app.utils.jobs.close_old_connections")
+class RunJobTests(JobTestCase):
+    def test_bulk_job_records_progress_and_its_work_dir(self, close_old, connection):
+        upload = _touch(os.path.join(self.dir, "resume-bulk.zip"), 0)
+        job = self._job(ExtractionJob.QUEUED, upload_path=upload, stages={jobs.BULK_STAGE: {"status": "pending"}})
+        seen = {}
+
+        def ingest(path, role, progress, work_dir):
+            progress(1, 2)
+            seen["row"] = ExtractionJob.objects.get(pk=job.pk)
+            seen["removed"] = jobs._remove_orphaned_uploads(0)
+            return {"files": 2, "created": 2, "results": []}
+
+        with mock.patch("app.utils.jobs.ingest_zip", side_effect=ingest):
+            jobs.run_job(job.pk)
+
+        stage = seen["row"].stages[jobs.BULK_STAGE]
+        self.assertEqual((stage["files_done"], stage["files_total"]), (1, 2))
+        self.assertTrue(stage["work_dir"].startswith(os.path.join(self.dir, "bulk-ingest-")))
+        self.assertNotIn(stage["work_dir"], seen["removed"])
+        job.refresh_from_db()
+        self.assertEqual(job.status, ExtractionJob.SUCCEEDED)
+        self.assertEqual(job.result["created"], 2)
+        self.assertFalse(os.path.exists(upload))
+
+    def test_extraction_job_records_stages_and_result(self, close_old, connection):
+        upload = _touch(os.path.join(self.dir, "resume-one.pdf"), 0)
+        job = self._job(ExtractionJob.QUEUED, upload_path=upload, stages={"extract_skills": {"status": "pending"}})
+        resume = Resume.objects.create(role="")
+
+        def pipeline(file_obj, role, filename, progress):
+            progress("extract_skills", "started")
+            progress("extract_skills", "done")
+            return {"data": {"id": resume.id}}
+
+        with mock.patch("app.utils.jobs.run_resume_pipeline", side_effect=pipeline):
+            jobs.run_job(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ExtractionJob.SUCCEEDED)
+        self.assertEqual(job.resume_id, resume.id)
+        self.assertEqual(job.stages["extract_skills"]["status"], "done")
+        self.assertIn("duration_ms", job.stages["extract_skills"])
+
+    def test_failed_extraction_marks_the_running_stage(self, close_old, connection):
+        upload = _touch(os.path.join(self.dir, "resume-one.pdf"), 0)
+        job = self._job(ExtractionJob.QUEUED, upload_path=upload)
+
+        def pipeline(file_obj, role, filename, progress):
+            progress("extract_skills", "started")
+            raise jobs.PipelineError("Could not extract text from PDF")
+
+        with mock.patch("app.utils.jobs.run_resume_pipeline", side_effect=pipeline):
+            jobs.run_job(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ExtractionJob.FAILED)
+        self.assertEqual(job.error, "Could not extract text from PDF")
+        self.assertEqual(job.stages["extract_skills"]["status"], "failed")
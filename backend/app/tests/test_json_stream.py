@@ -0,0 +1,55 @@
+from django.test import SimpleTestCase
+
+from app.utils.json_stream import SkillObjectStream, loads_lenient
+
+
+class LoadsLenientTests(SimpleTestCase):
+    def test_ignores_prose_fences_and_trailing_commas(self):
+        text = 'Here you go:\n```json\n{"skills": ["Go", "Rust",],}\n```'
+        self.assertEqual(loads_lenient(text), ({"skills": ["Go", "Rust"]}, True))
+
+    def test_accepts_raw_newlines_in_strings(self):
+        self.assertEqual(loads_lenient('{"x": "line\nbreak"}'), ({"x": "line\nbreak"}, True))
+
+    def test_closes_a_cut_off_payload_after_its_last_complete_value(self):
+        value, complete = loads_lenient('{"skills": [{"name": "Go"}, {"name": "Ru')
+        self.assertEqual(value, {"skills": [{"name": "Go"}]})
+        self.assertFalse(complete)
+
+    def test_max_depth_drops_half_written_members(self):
+        text = '{"skills": {"Go": {"level": "high"}, "Rust": {"level": "low", "why": "sys'
+        value, complete = loads_lenient(text, max_depth=2)
+        self.assertEqual(value, {"skills": {"Go": {"level": "high"}}})
+        self.assertFalse(complete)
+
+    def test_root_selects_object_or_array(self):
+        self.assertEqual(loads_lenient('x [1, 2] {"a": 1}', root=list), ([1, 2], True))
+        self.assertEqual(loads_lenient("[1, 2]"), (None, False))
+        self.assertEqual(loads_lenient("no json here"), (None, False))
+
+
+class SkillObjectStreamTests(SimpleTestCase):
+    def feed(self, stream, *chunks):
+        return [list(stream.feed(chunk)) for chunk in chunks]
+
+    def test_yields_each_member_as_soon_as_it_closes(self):
+        stream = SkillObjectStream()
+        yielded = self.feed(
+            stream,
+            'Sure!\n```json\n{"roadmap": {"Py',
+            'thon": {"steps": ["basics", "{not a brace}"]}, "Go": {"st',
+            'eps": []}}}',
+        )
+        self.assertEqual(yielded, [[], [("Python", {"steps": ["basics", "{not a brace}"]})], [("Go", {"steps": []})]])
+        self.assertTrue(stream.complete)
+
+    def test_cut_off_member_is_never_yielded(self):
+        stream = SkillObjectStream()
+        yielded = self.feed(stream, '{"skills": {"Go": {"demand": "high"}, "Rust": {"demand": "lo')
+        self.assertEqual(yielded, [[("Go", {"demand": "high"})]])
+        self.assertFalse(stream.complete)
+
+    def test_escaped_quotes_in_keys_and_values(self):
+        stream = SkillObjectStream()
+        yielded = self.feed(stream, '{"r": {"C\\"#": {"note": "say \\"hi\\" }"}}}')
+        self.assertEqual(yielded, [[('C"#', {"note": 'say "hi" }'})]])
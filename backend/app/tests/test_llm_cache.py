@@ -0,0 +1,51 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, override_settings
+
+from app.utils import llm_cache
+
+
+class LLMCacheTests(SimpleTestCase):
+    def setUp(self):
+        llm_cache.clear()
+
+    def test_key_depends_on_model_prompt_and_params(self):
+        key = llm_cache.make_key("m", "prompt", temperature=0.2, max_tokens=100)
+
+        self.assertEqual(key, llm_cache.make_key("m", "prompt", max_tokens=100, temperature=0.2))
+        self.assertTrue(key.startswith(llm_cache.KEY_PREFIX + ":"))
+        self.assertNotEqual(key, llm_cache.make_key("other", "prompt", temperature=0.2, max_tokens=100))
+        self.assertNotEqual(key, llm_cache.make_key("m", "prompt", temperature=0.7, max_tokens=100))
+
+    def test_get_set_and_stats(self):
+        before = llm_cache.stats()
+
+        self.assertIs(llm_cache.get("k"), llm_cache.MISS)
+        llm_cache.set("k", "", None)
+        self.assertEqual(llm_cache.get("k"), "")
+
+        after = llm_cache.stats()
+        self.assertEqual(after["hits"] - before["hits"], 1)
+        self.assertEqual(after["misses"] - before["misses"], 1)
+
+    def test_ttl_zero_is_not_stored(self):
+        llm_cache.set("k", "value", 0)
+
+        self.assertIs(llm_cache.get("k"), llm_cache.MISS)
+
+    def test_disabled_cache_neither_reads_nor_writes(self):
+        llm_cache.set("k", "old", None)
+        with override_settings(LLM_CACHE_ENABLED=False):
+            self.assertIs(llm_cache.get("k"), llm_cache.MISS)
+            llm_cache.set("k", "new", None)
+        self.assertEqual(llm_cache.get("k"), "old")
+
+    def test_command_clears_the_cache(self):
+        llm_cache.set("k", "value", None)
+
+        call_command("llm_cache", "--clear", stdout=StringIO())
+
+        self.assertIs(llm_cache.get("k"), llm_cache.MISS)
+        with self.assertRaises(CommandError):
+            call_command("llm_cache", stdout=StringIO())
@@ -0,0 +1,56 @@
+import datetime
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from app.models import MarketSnapshot
+from app.utils.market_snapshots import latest_snapshots, skill_history, take_snapshot
+from app.utils.skill_index import get_or_create_skills
+
+
+class MarketSnapshotTests(TestCase):
+    def setUp(self):
+        skills = get_or_create_skills(["Python", "Go"])
+        today = timezone.localdate()
+        for skill, age, demand in [("python", 0, "high"), ("python", 3, "medium"), ("python", 200, "low"),
+                                   ("go", 30, "medium")]:
+            MarketSnapshot.objects.create(skill=skills[skill], name=skills[skill].name,
+                                          snapshot_date=today - datetime.timedelta(days=age),
+                                          data={"demand": demand})
+
+    def test_latest_snapshots_returns_the_newest_recent_entry(self):
+        found = latest_snapshots(["Python", "Go"])
+
+        self.assertEqual(list(found), ["python"])
+        self.assertEqual(found["python"]["data"], {"demand": "high"})
+
+    def test_skill_history_is_oldest_first_within_days(self):
+        history = skill_history("Python", days=90)
+
+        self.assertEqual([row["data"]["demand"] for row in history], ["medium", "high"])
+
+    def test_history_endpoint(self):
+        response = self.client.get("/api/v1/skill-market-analysis/history", {"skill": "python", "days": 365})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["skill"], "python")
+        self.assertEqual([row["data"]["demand"] for row in response.json()["history"]], ["low", "medium", "high"])
+
+    def test_history_endpoint_validates_parameters(self):
+        self.assertEqual(self.client.get("/api/v1/skill-market-analysis/history").status_code, 400)
+        response = self.client.get("/api/v1/skill-market-analysis/history", {"skill": "go", "days": "soon"})
+        self.assertEqual(response.status_code, 400)
+
+
+class TakeSnapshotTests(TestCase):
+    def test_stores_the_cached_market_entry_for_each_skill(self):
+        entries = {"python": {"name": "Python", "data": {"demand": "high"}}, "go": None}
+
+        with mock.patch("app.utils.market_snapshots.get_skill_entry",
+                        side_effect=lambda task, skill: entries[skill]) as get_entry:
+            result = take_snapshot(0, extra_skills=["Python", "Go"])
+
+        self.assertEqual({call.args[0] for call in get_entry.call_args_list}, {"market"})
+        self.assertEqual((result["stored"], result["failed"]), (1, ["go"]))
+        self.assertEqual(MarketSnapshot.objects.get().data, {"demand": "high"})
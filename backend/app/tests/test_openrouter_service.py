@@ -0,0 +1,35 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from app.utils import llm_cache
+from app.utils.openrouter_service import stream_skill_entries
+
+
+def _stream(*chunks):
+    return mock.patch("app.utils.openrouter_service.stream_openrouter", return_value=iter(chunks))
+
+
+@override_settings(LLM_CACHE_ENABLED=True)
+class StreamSkillEntriesTests(SimpleTestCase):
+    def setUp(self):
+        llm_cache.clear()
+
+    @mock.patch("app.utils.openrouter_service.get_skill_entry")
+    def test_streamed_objects_are_cached_only_under_the_skill_they_name(self, get_entry):
+        with _stream('{"roadmap": {"Python": {"steps": [1]}, ', '"Kotlin": {"steps": [2]}, "Go": {"steps": [3]}}}'):
+            entries = list(stream_skill_entries("roadmap", ["python", "golang"]))
+        self.assertEqual(entries, [{"name": "Python", "data": {"steps": [1]}}, {"name": "Go", "data": {"steps": [3]}}])
+        get_entry.assert_not_called()
+
+        with _stream() as stream:
+            cached = list(stream_skill_entries("roadmap", ["python", "golang"]))
+        self.assertEqual(cached, entries)
+        stream.assert_not_called()
+
+    @mock.patch("app.utils.openrouter_service.get_skill_entry", return_value={"name": "Rust", "data": {}})
+    def test_skills_the_stream_skipped_are_generated_on_their_own(self, get_entry):
+        with _stream('{"roadmap": {"Python": {"steps": []}, "Java": {"steps": []}}}'):
+            entries = list(stream_skill_entries("roadmap", ["python", "rust"]))
+        self.assertEqual([entry["name"] for entry in entries], ["Python", "Rust"])
+        get_entry.assert_called_once_with("roadmap", "rust")
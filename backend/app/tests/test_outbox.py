@@ -0,0 +1,116 @@
+import datetime
+import os
+from unittest import mock
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from app.models import EmailOutbox
+from app.utils import outbox
+
+
+class FlakyBackend(EmailBackend):
+    """locmem backend that rejects mail to bad@example.com."""
+
+    def send_messages(self, messages):
+        if any("bad@example.com" in message.to for message in messages):
+            raise RuntimeError("550 mailbox unavailable")
+        return super().send_messages(messages)
+
+
+class ClosedBackend(EmailBackend):
+    def open(self):
+        raise ConnectionRefusedError("connection refused")
+
+
+@override_settings(EMAIL_OUTBOX_SEND_IN_BACKGROUND=False, EMAIL_HOST_USER="noreply@example.com",
+                   EMAIL_OUTBOX_MAX_ATTEMPTS=2, EMAIL_OUTBOX_RETRY_BASE=60)
+class OutboxTests(TestCase):
+    def _due_again(self):
+        EmailOutbox.objects.update(next_attempt_at=timezone.now())
+
+    def test_pending_rows_are_sent_and_marked(self):
+        outbox.enqueue_email("Hi", "text", ["a@example.com"], html_body="<p>text</p>")
+        outbox.enqueue_email("Hi", "text", ["b@example.com"])
+
+        self.assertEqual(outbox.send_pending(), {"claimed": 2, "sent": 2, "retrying": 0, "failed": 0})
+        self.assertEqual([m.to for m in mail.outbox], [["a@example.com"], ["b@example.com"]])
+        self.assertEqual(mail.outbox[0].alternatives, [("<p>text</p>", "text/html")])
+        self.assertEqual(mail.outbox[0].from_email, "noreply@example.com")
+        self.assertEqual(set(EmailOutbox.objects.values_list("status", flat=True)), {EmailOutbox.SENT})
+        self.assertEqual(outbox.send_pending()["claimed"], 0)
+
+    @override_settings(EMAIL_BACKEND="app.tests.test_outbox.FlakyBackend")
+    def test_a_bad_recipient_fails_only_its_row_then_gives_up(self):
+        outbox.enqueue_email("Hi", "text", ["bad@example.com"])
+        outbox.enqueue_email("Hi", "text", ["good@example.com"])
+
+        with self.assertLogs("app.utils.outbox", "WARNING"):
+            self.assertEqual(outbox.send_pending(), {"claimed": 2, "sent": 1, "retrying": 1, "failed": 0})
+        bad = EmailOutbox.objects.get(to=["bad@example.com"])
+        self.assertEqual((bad.status, bad.attempts), (EmailOutbox.PENDING, 1))
+        self.assertIn("550", bad.last_error)
+        self.assertGreater(bad.next_attempt_at, timezone.now() + datetime.timedelta(seconds=50))
+        self.assertEqual(outbox.send_pending()["claimed"], 0)
+
+        self._due_again()
+        with self.assertLogs("app.utils.outbox", "WARNING") as logs:
+            self.assertEqual(outbox.send_pending(), {"claimed": 1, "sent": 0, "retrying": 0, "failed": 1})
+        self.assertIn("giving up", logs.output[0])
+        self.assertEqual(EmailOutbox.objects.get(pk=bad.pk).status, EmailOutbox.FAILED)
+
+    @override_settings(EMAIL_BACKEND="app.tests.test_outbox.ClosedBackend")
+    def test_unreachable_server_retries_the_whole_batch(self):
+        outbox.enqueue_email("Hi", "text", ["a@example.com"])
+        outbox.enqueue_email("Hi", "text", ["b@example.com"])
+
+        with self.assertLogs("app.utils.outbox", "WARNING"):
+            self.assertEqual(outbox.send_pending(), {"claimed": 2, "sent": 0, "retrying": 2, "failed": 0})
+        self.assertEqual(set(EmailOutbox.objects.values_list("attempts", flat=True)), {1})
+
+    def test_claimed_rows_are_leased(self):
+        outbox.enqueue_email("Hi", "text", ["a@example.com"])
+
+        self.assertEqual(len(outbox._claim(10)), 1)
+        self.assertEqual(outbox._claim(10), [])
+        self.assertGreater(outbox.seconds_until_due(), 200)
+
+    def test_drain_sends_every_batch(self):
+        for i in range(5):
+            outbox.enqueue_email("Hi", "text", [f"{i}@example.com"])
+
+        self.assertEqual(outbox.drain(limit=2)["sent"], 5)
+        self.assertIsNone(outbox.seconds_until_due())
+
+    @override_settings(EMAIL_OUTBOX_RETRY_MAX=300)
+    def test_retry_delay_doubles_up_to_the_cap(self):
+        self.assertEqual([outbox.retry_delay(n) for n in range(1, 5)], [60, 120, 240, 300])
+
+
+class SenderTests(TestCase):
+    @override_settings(EMAIL_OUTBOX_SEND_IN_BACKGROUND=True, EMAIL_HOST_USER="noreply@example.com")
+    def test_enqueue_wakes_the_sender_after_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            outbox.enqueue_email("Hi", "text", ["a@example.com"])
+
+        self.assertEqual(callbacks, [outbox.wake_sender])
+
+    @override_settings(EMAIL_OUTBOX_SEND_IN_BACKGROUND=True)
+    @mock.patch("app.utils.outbox.wake_sender")
+    def test_start_sender_runs_once_per_process(self, wake_sender):
+        with mock.patch("app.utils.outbox._sender_pid", None):
+            outbox.start_sender()
+        with mock.patch("app.utils.outbox._sender_pid", os.getpid()):
+            outbox.start_sender()
+
+        wake_sender.assert_called_once_with()
+
+    @override_settings(EMAIL_OUTBOX_SEND_IN_BACKGROUND=False)
+    @mock.patch("app.utils.outbox.wake_sender")
+    def test_no_background_sender_when_disabled(self, wake_sender):
+        with mock.patch("app.utils.outbox._sender_pid", None):
+            outbox.start_sender()
+
+        wake_sender.assert_not_called()
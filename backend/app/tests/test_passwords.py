@@ -0,0 +1,53 @@
+from django.contrib.auth.hashers import identify_hasher
+from django.test import TestCase, override_settings
+
+from app.hashers import ConfigurablePBKDF2PasswordHasher
+from app.models import User
+from app.utils.passwords import LEGACY_SALT, hash_password, needs_rehash, verify_password
+
+
+@override_settings(PASSWORD_HASH_ITERATIONS=1000)
+class RehashOnLoginTests(TestCase):
+    def _user(self, encoded):
+        return User.objects.create(name="A", email="a@example.com", password=encoded)
+
+    def test_current_hash_is_left_alone(self):
+        user = self._user(hash_password("secret"))
+        stored = user.password
+
+        self.assertFalse(needs_rehash(stored))
+        self.assertTrue(verify_password(user, "secret"))
+        self.assertEqual(User.objects.get().password, stored)
+
+    def test_shared_salt_and_old_cost_are_upgraded(self):
+        hasher = ConfigurablePBKDF2PasswordHasher()
+        for encoded in (hasher.encode("secret", LEGACY_SALT, iterations=1000),
+                        hasher.encode("secret", "freshsalt", iterations=500)):
+            User.objects.all().delete()
+            user = self._user(encoded)
+
+            self.assertTrue(needs_rehash(encoded))
+            self.assertTrue(verify_password(user, "secret"))
+            stored = User.objects.get().password
+            self.assertEqual(user.password, stored)
+            self.assertFalse(needs_rehash(stored))
+            self.assertEqual(identify_hasher(stored).decode(stored)["iterations"], 1000)
+
+    def test_wrong_password_does_not_rehash(self):
+        encoded = ConfigurablePBKDF2PasswordHasher().encode("secret", LEGACY_SALT, iterations=1000)
+        user = self._user(encoded)
+
+        self.assertFalse(verify_password(user, "wrong"))
+        self.assertEqual(User.objects.get().password, encoded)
+
+    def test_login_upgrades_a_legacy_hash(self):
+        self._user(ConfigurablePBKDF2PasswordHasher().encode("secret", LEGACY_SALT, iterations=1000))
+
+        response = self.client.post("/api/v1/login", {"email": "a@example.com", "password": "secret"},
+                                    content_type="application/json")
+        unknown = self.client.post("/api/v1/login", {"email": "b@example.com", "password": "secret"},
+                                   content_type="application/json")
+
+        self.assertTrue(response.json()["success"])
+        self.assertFalse(unknown.json()["success"])
+        self.assertFalse(needs_rehash(User.objects.get().password))
@@ -0,0 +1,89 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase, override_settings
+
+from app.utils import rate_limiter
+from app.utils.fanout import fan_out
+from app.utils.rate_limiter import BACKGROUND, BULK, INTERACTIVE, ModelScheduler, QueueTimeout
+
+
+def _wait_for_queue(scheduler, depth):
+    deadline = time.monotonic() + 2
+    while scheduler.snapshot()["queue_depth"] < depth:
+        if time.monotonic() > deadline:
+            raise AssertionError(f"queue never reached {depth}")
+        time.sleep(0.005)
+
+
+class ModelLimitsTests(SimpleTestCase):
+    @override_settings(OPENROUTER_RATE_LIMITS={}, OPENROUTER_FREE_RPM=20, OPENROUTER_RATE_LIMIT_PROCESSES=1)
+    def test_only_free_models_are_limited_by_default(self):
+        self.assertEqual(rate_limiter.model_limits("vendor/model:free"), {"rpm": 20, "burst": 20})
+        self.assertIsNone(rate_limiter.model_limits("vendor/model"))
+
+    @override_settings(OPENROUTER_RATE_LIMITS={"paid": {"rpm": 120, "burst": 2}}, OPENROUTER_FREE_RPM=20,
+                       OPENROUTER_RATE_LIMIT_PROCESSES=4)
+    def test_limits_are_split_across_processes(self):
+        self.assertEqual(rate_limiter.model_limits("paid"), {"rpm": 30, "burst": 1.0})
+        self.assertEqual(rate_limiter.model_limits("x:free"), {"rpm": 5, "burst": 5})
+
+    @override_settings(OPENROUTER_RATE_LIMIT_ENABLED=False)
+    def test_disabled(self):
+        self.assertIsNone(rate_limiter.model_limits("vendor/model:free"))
+
+
+class ModelSchedulerTests(SimpleTestCase):
+    def test_waiting_calls_are_served_by_priority_then_arrival(self):
+        scheduler = ModelScheduler("m", rpm=1200, burst=1)
+        scheduler.acquire(INTERACTIVE, timeout=1)
+        scheduler.pause(0.2)
+        order = []
+
+        def call(level, name):
+            scheduler.acquire(level, timeout=5)
+            order.append(name)
+
+        threads = []
+        for depth, (level, name) in enumerate([(BACKGROUND, "background"), (BULK, "bulk-1"),
+                                               (BULK, "bulk-2"), (INTERACTIVE, "interactive")], 1):
+            threads.append(threading.Thread(target=call, args=(level, name)))
+            threads[-1].start()
+            _wait_for_queue(scheduler, depth)
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(order, ["interactive", "bulk-1", "bulk-2", "background"])
+        self.assertEqual(scheduler.snapshot()["max_queue_depth"], 4)
+
+    def test_timeout_leaves_the_queue(self):
+        scheduler = ModelScheduler("m", rpm=6, burst=1)
+        scheduler.acquire(INTERACTIVE, timeout=1)
+
+        with self.assertRaises(QueueTimeout):
+            scheduler.acquire(INTERACTIVE, timeout=0.05)
+
+        snapshot = scheduler.snapshot()
+        self.assertEqual((snapshot["timeouts"], snapshot["queue_depth"]), (1, 0))
+
+    def test_pause_holds_calls_until_retry_after(self):
+        scheduler = ModelScheduler("m", rpm=6000, burst=5)
+        scheduler.pause(0.2)
+
+        self.assertGreaterEqual(scheduler.acquire(INTERACTIVE, timeout=1), 0.15)
+        self.assertEqual(scheduler.snapshot()["throttled"], 1)
+
+
+class PriorityTests(SimpleTestCase):
+    def test_priority_follows_fanned_out_calls(self):
+        with rate_limiter.priority(BULK):
+            levels = fan_out(lambda _: rate_limiter.current_priority(), [1, 2])
+        self.assertEqual(levels, {1: BULK, 2: BULK})
+        self.assertEqual(rate_limiter.current_priority(), INTERACTIVE)
+
+    def test_retry_after_header(self):
+        error = SimpleNamespace(response=SimpleNamespace(headers={"retry-after": "2.5"}))
+        self.assertEqual(rate_limiter.retry_after_seconds(error), 2.5)
+        self.assertIsNone(rate_limiter.retry_after_seconds(ValueError()))
+        self.assertGreaterEqual(rate_limiter.backoff_delay(0, retry_after=7), 7)
@@ -0,0 +1,51 @@
+import datetime
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from app.models import Token, User
+from app.utils.passwords import hash_password
+from app.utils.reset_tokens import EXPIRED, INVALID, VALID, issue_reset_token, redeem_reset_token
+
+
+class ResetTokenTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(name="A", email="a@example.com", password=hash_password("old-password"))
+
+    def test_signed_token_works_once(self):
+        token = issue_reset_token(self.user)
+        self.assertEqual(redeem_reset_token(self.user.id, token), VALID)
+        self.assertEqual(redeem_reset_token(self.user.id, token), INVALID)
+
+    def test_signed_token_dies_when_the_password_changes(self):
+        token = issue_reset_token(self.user)
+        User.objects.filter(pk=self.user.pk).update(password=hash_password("new-password"))
+        self.assertEqual(redeem_reset_token(self.user.id, token), INVALID)
+
+    def test_signed_token_is_bound_to_its_user(self):
+        other = User.objects.create(name="B", email="b@example.com", password=hash_password("x"))
+        self.assertEqual(redeem_reset_token(other.id, issue_reset_token(self.user)), INVALID)
+
+    def test_signed_token_expires(self):
+        token = issue_reset_token(self.user)
+        with override_settings(RESET_TOKEN_MAX_AGE=-1):
+            self.assertEqual(redeem_reset_token(self.user.id, token), EXPIRED)
+
+    def test_malformed_tokens_are_invalid(self):
+        for token in (None, "", 123, ["a"], "not:a:signed:token"):
+            with self.subTest(token=token):
+                self.assertEqual(redeem_reset_token(self.user.id, token), INVALID)
+
+    @override_settings(RESET_TOKEN_MODE="stored")
+    def test_stored_token_works_once_and_only_the_newest(self):
+        first = issue_reset_token(self.user)
+        second = issue_reset_token(self.user)
+        self.assertEqual(redeem_reset_token(self.user.id, first), INVALID)
+        self.assertEqual(redeem_reset_token(self.user.id, second), VALID)
+        self.assertEqual(redeem_reset_token(self.user.id, second), INVALID)
+
+    @override_settings(RESET_TOKEN_MODE="stored")
+    def test_stored_token_expires(self):
+        token = issue_reset_token(self.user)
+        Token.objects.filter(token=token).update(expires_at=timezone.now() - datetime.timedelta(seconds=1))
+        self.assertEqual(redeem_reset_token(self.user.id, token), EXPIRED)
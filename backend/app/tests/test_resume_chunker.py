@@ -0,0 +1,65 @@
+from django.test import SimpleTestCase
+
+from app.utils.resume_chunker import CHARS_PER_TOKEN, chunk_resume, split_sections, strip_boilerplate
+
+RESUME = """Jane Doe
+jane.doe@example.com | +1 (555) 123-4567 | linkedin.com/in/janedoe
+Page 1 of 2
+Experience
+Backend Engineer, Acme 2019 - 2021, 2021-2023
+Built Django services and PostgreSQL schemas.
+Jane Doe - Resume
+Skills
+Python, Docker, Kubernetes
+Jane Doe - Resume
+Languages
+Python, Go
+Hobbies
+Chess, hiking
+References
+Available on request
+2
+"""
+
+
+class StripBoilerplateTests(SimpleTestCase):
+    def test_contact_details_and_page_numbers_go_dates_stay(self):
+        text = strip_boilerplate(RESUME)
+
+        for gone in ("jane.doe@example.com", "555", "linkedin", "Page 1"):
+            self.assertNotIn(gone, text)
+        self.assertIn("2019 - 2021, 2021-2023", text)
+        self.assertNotIn("\n2\n", f"\n{text}\n")
+
+    def test_repeated_lines_keep_their_first_occurrence(self):
+        self.assertEqual(strip_boilerplate(RESUME).count("Jane Doe - Resume"), 1)
+
+    def test_repeated_headings_are_kept(self):
+        text = strip_boilerplate("Skills\nPython\nProjects\nA\nSkills\nGo")
+
+        self.assertEqual(text.count("Skills"), 2)
+
+
+class ChunkResumeTests(SimpleTestCase):
+    def test_sections(self):
+        headings = [heading for heading, _ in split_sections(strip_boilerplate(RESUME))]
+
+        self.assertEqual(headings, ["", "experience", "skills", "languages", "hobbies", "references"])
+
+    def test_drops_skill_free_sections_but_keeps_languages(self):
+        text = "\n\n".join(chunk_resume(RESUME, max_tokens=1000))
+
+        self.assertIn("Languages\nPython, Go", text)
+        self.assertIn("Skills\nPython, Docker, Kubernetes", text)
+        self.assertNotIn("Chess", text)
+        self.assertNotIn("Available on request", text)
+
+    def test_chunks_respect_the_token_budget(self):
+        body = "\n".join(f"Project {i}: built a service with Python and Redis" for i in range(100))
+
+        chunks = chunk_resume(f"Projects\n{body}\nSkills\nPython", max_tokens=100)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) <= 100 * CHARS_PER_TOKEN for chunk in chunks))
+        self.assertTrue(all(chunk.startswith(("Projects\n", "Skills\n")) for chunk in chunks))
+        self.assertEqual(sum(chunk.count("Project ") for chunk in chunks), 100)
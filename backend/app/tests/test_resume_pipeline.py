@@ -0,0 +1,50 @@
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+from app.benchmarks.sample_resumes import sample_resume
+from app.models import Resume, ResumeSkill
+from app.utils.resume_pipeline import _save_resume, run_resume_pipeline
+
+
+def _upload(seed):
+    return SimpleUploadedFile(f"resume_{seed}.pdf", sample_resume(seed), content_type="application/pdf")
+
+
+@override_settings(PDF_WORKERS=1)
+@mock.patch("app.utils.resume_pipeline.record_resume")
+class ResumePipelineTests(TestCase):
+    @mock.patch("app.utils.resume_pipeline.recommend_for_resume", side_effect=[["Docker"], ["Airflow", "Spark"]])
+    @mock.patch("app.utils.resume_pipeline.extract_skills", return_value=["python", "Django"])
+    def test_same_pdf_reuses_skills_and_leaves_the_stored_row_alone(self, extract, recommend, record):
+        first = run_resume_pipeline(_upload(1), "Software Engineer")
+        links = set(ResumeSkill.objects.values_list("skill__name", "is_extracted", "is_recommended"))
+        second = run_resume_pipeline(_upload(1), "Data Engineer")
+
+        self.assertFalse(first["duplicate"])
+        self.assertTrue(second["duplicate"])
+        self.assertEqual(second["extracted_skills"], ["Python", "Django"])
+        self.assertEqual(second["recommended_skills"], ["Airflow", "Spark"])
+        self.assertEqual(first["data"]["id"], second["data"]["id"])
+        self.assertEqual(extract.call_count, 1)
+
+        resume = Resume.objects.get()
+        self.assertEqual((resume.role, resume.recommended_skills), ("Software Engineer", "Docker"))
+        self.assertEqual(set(ResumeSkill.objects.values_list("skill__name", "is_extracted", "is_recommended")), links)
+        record.assert_called_once_with("Software Engineer", ["Python", "Django"], ["Docker"])
+
+    @mock.patch("app.utils.resume_pipeline.recommend_for_resume", return_value=[])
+    @mock.patch("app.utils.resume_pipeline.extract_skills", return_value=["Go"])
+    def test_different_pdfs_are_stored_separately(self, extract, recommend, record):
+        run_resume_pipeline(_upload(1), "")
+        result = run_resume_pipeline(_upload(2), "")
+        self.assertFalse(result["duplicate"])
+        self.assertEqual(Resume.objects.count(), 2)
+        self.assertEqual(extract.call_count, 2)
+
+    def test_a_row_stored_concurrently_is_kept(self, record):
+        stored = Resume.objects.create(content_hash="abc", role="First", extracted_skills="Go")
+        resume, outcome = _save_resume("abc", None, role="Second", extracted_skills="Rust")
+        self.assertEqual((resume.pk, outcome), (stored.pk, "kept"))
+        self.assertEqual(Resume.objects.get().role, "First")
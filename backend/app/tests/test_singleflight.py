@@ -0,0 +1,101 @@
+import os
+import threading
+import time
+
+from django.test import SimpleTestCase, override_settings
+
+from app.utils import llm_cache, singleflight
+
+
+@override_settings(LLM_SINGLEFLIGHT_SHARED=False)
+class SingleflightTests(SimpleTestCase):
+    def test_concurrent_callers_share_one_call(self):
+        release = threading.Event()
+        started = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "leader"
+
+        leader = threading.Thread(target=singleflight.do, args=("sf-share", slow))
+        leader.start()
+        started.wait(5)
+        results = []
+        waiting = singleflight.stats()["coalesced_local"]
+        follower = threading.Thread(target=lambda: results.append(singleflight.do("sf-share", slow)))
+        follower.start()
+        deadline = time.monotonic() + 5
+        while singleflight.stats()["coalesced_local"] == waiting and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        leader.join()
+        follower.join()
+        self.assertEqual(results, ["leader"])
+        self.assertEqual(len(calls), 1)
+
+    @override_settings(LLM_SINGLEFLIGHT_WAIT=0.1)
+    def test_wait_timeout_calls_directly_instead_of_returning_none(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def stuck():
+            started.set()
+            release.wait(5)
+            return "late"
+
+        leader = threading.Thread(target=singleflight.do, args=("sf-timeout", stuck))
+        leader.start()
+        started.wait(5)
+        try:
+            self.assertEqual(singleflight.do("sf-timeout", lambda: "own"), "own")
+        finally:
+            release.set()
+            leader.join()
+
+
+class SharedSingleflightTests(SimpleTestCase):
+    def setUp(self):
+        llm_cache.clear()
+        self.cache = llm_cache.backend()
+
+    def test_lock_file_admits_one_holder_until_released(self):
+        self.assertTrue(singleflight._acquire(self.cache, "sf:lock:a", 60))
+        self.assertFalse(singleflight._acquire(self.cache, "sf:lock:a", 60))
+        self.assertTrue(singleflight._held(self.cache, "sf:lock:a", 60))
+        singleflight._release(self.cache, "sf:lock:a")
+        self.assertFalse(singleflight._held(self.cache, "sf:lock:a", 60))
+        self.assertTrue(singleflight._acquire(self.cache, "sf:lock:a", 60))
+        singleflight._release(self.cache, "sf:lock:a")
+
+    def test_stale_lock_of_a_crashed_holder_is_taken_over(self):
+        self.assertTrue(singleflight._acquire(self.cache, "sf:lock:b", 60))
+        old = time.time() - 120
+        os.utime(singleflight._lock_path(self.cache, "sf:lock:b"), (old, old))
+        self.assertTrue(singleflight._acquire(self.cache, "sf:lock:b", 60))
+        singleflight._release(self.cache, "sf:lock:b")
+
+    def test_uncacheable_results_are_not_published(self):
+        self.assertEqual(singleflight.do("fresh", lambda: "text", cache_ttl=0), "text")
+        self.assertIsNone(self.cache.get(f"{singleflight.RESULT_PREFIX}:fresh"))
+        self.assertEqual(singleflight.do("cached", lambda: "text"), "text")
+        self.assertEqual(self.cache.get(f"{singleflight.RESULT_PREFIX}:cached"), "text")
+
+    @override_settings(LLM_SINGLEFLIGHT_WAIT=5)
+    def test_follower_in_another_worker_gets_the_published_result(self):
+        lock_key = f"{singleflight.LOCK_PREFIX}:shared"
+        self.assertTrue(singleflight._acquire(self.cache, lock_key, 60))
+
+        def leader():
+            time.sleep(0.2)
+            self.cache.set(f"{singleflight.RESULT_PREFIX}:shared", "from leader", 60)
+            singleflight._release(self.cache, lock_key)
+
+        thread = threading.Thread(target=leader)
+        thread.start()
+        try:
+            self.assertEqual(singleflight._shared_do("shared", lambda: "own", None), "from leader")
+        finally:
+            thread.join()
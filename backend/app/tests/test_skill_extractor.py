@@ -0,0 +1,43 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from app.utils.canonical import canonical_skill
+from app.utils.skill_extractor import extract_skills, extract_skills_local
+
+PROSE = ("I react quickly to feedback and excel at teamwork. Assembly line experience. Oops, networking events. "
+         "Guard rails. Rust-proofing. 5 ml. Dart board. Jest aside, I use Flask of coffee. Postman delivered. "
+         "Cypress trees. Go to the store.")
+
+
+class LocalSkillMatcherTests(SimpleTestCase):
+    def test_ordinary_english_is_not_a_skill(self):
+        self.assertEqual(extract_skills_local(PROSE), ["Teamwork"])
+
+    def test_skills_are_found_through_unambiguous_names_and_aliases(self):
+        text = ("Skills: Python, ReactJS, MS Excel, Rust programming, x86 assembly, OOP, Ruby on Rails, C++, "
+                "Golang, Docker, k8s, CI/CD, Machine Learning")
+        self.assertEqual(extract_skills_local(text), [
+            "Python", "React", "Excel", "Rust", "Assembly", "Object-Oriented Programming", "Ruby on Rails", "C++",
+            "Go", "Docker", "Kubernetes", "CI/CD", "Machine Learning",
+        ])
+
+    def test_matches_sit_on_word_boundaries(self):
+        self.assertEqual(extract_skills_local("JavaScript and Javanese"), ["JavaScript"])
+
+    def test_prose_only_aliases_still_canonicalize_input(self):
+        self.assertEqual(canonical_skill("ML"), "Machine Learning")
+        self.assertEqual(canonical_skill("Rails"), "Ruby on Rails")
+
+
+class ExtractSkillsTests(SimpleTestCase):
+    @override_settings(SKILL_EXTRACTION_MODE="hybrid")
+    @mock.patch("app.utils.skill_extractor.extract_skills_llm", return_value=["React", "docker", "Rust"])
+    def test_hybrid_adds_llm_skills_the_matcher_missed(self, llm):
+        self.assertEqual(extract_skills("Python and Docker. I react fast."), ["Python", "Docker", "React", "Rust"])
+        llm.assert_called_once()
+
+    @mock.patch("app.utils.skill_extractor.extract_skills_llm")
+    def test_local_mode_makes_no_llm_call(self, llm):
+        self.assertEqual(extract_skills("Python", mode="local"), ["Python"])
+        llm.assert_not_called()
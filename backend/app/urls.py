@@ -1,17 +1,28 @@
 from django.urls import path
 from .views import (
     ResumeSkillExtractionView, 
+    ExtractionJobStatusView,
+    BulkResumeIngestView,
     RegistrationView, 
     LoginView, 
     ForgotPasswordView, 
     ResetPasswordView,
     SkillRoadmapView,
+    SkillRoadmapStreamView,
     SkillMarketAnalysisView,
+    SkillMarketAnalysisStreamView,
+    SkillMarketHistoryView,
     SkillRecommendView,
+    AsyncResumeSkillExtractionView,
+    AsyncSkillRoadmapView,
+    AsyncSkillMarketAnalysisView,
+    AsyncSkillRecommendView,
 )
 
 urlpatterns = [
     path('extract-skills', ResumeSkillExtractionView.as_view(), name='extract_skills'),
+    path('extract-skills/bulk', BulkResumeIngestView.as_view(), name='extract_skills_bulk'),
+    path('extract-skills/jobs/<uuid:job_id>', ExtractionJobStatusView.as_view(), name='extraction_job_status'),
     path('register', RegistrationView.as_view(), name='register'),
     path('login', LoginView.as_view(), name='login'),
     path('forgotPassword', ForgotPasswordView.as_view(), name='forgotPassword'),
@@ -19,4 +30,12 @@ urlpatterns = [
     path('skill-roadmap', SkillRoadmapView.as_view(), name='skill_roadmap'),
     path('skill-recommend', SkillRecommendView.as_view(), name='skill_recommend'),
     path('skill-market-analysis', SkillMarketAnalysisView.as_view(), name='skill_market_analysis'),
+    path('skill-market-analysis/history', SkillMarketHistoryView.as_view(), name='skill_market_history'),
+    path('skill-roadmap/stream', SkillRoadmapStreamView.as_view(), name='skill_roadmap_stream'),
+    path('skill-market-analysis/stream', SkillMarketAnalysisStreamView.as_view(), name='skill_market_analysis_stream'),
+    # Native async versions of the LLM-bound endpoints; serve them with an ASGI server.
+    path('async/extract-skills', AsyncResumeSkillExtractionView.as_view(), name='async_extract_skills'),
+    path('async/skill-roadmap', AsyncSkillRoadmapView.as_view(), name='async_skill_roadmap'),
+    path('async/skill-recommend', AsyncSkillRecommendView.as_view(), name='async_skill_recommend'),
+    path('async/skill-market-analysis', AsyncSkillMarketAnalysisView.as_view(), name='async_skill_market_analysis'),
 ]
\ No newline at end of file
@@ -0,0 +1,257 @@
+import contextvars
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+
+from ..models import Resume
+from . import rate_limiter
+from .canonical import canonical_skills
+from .cooccurrence import record_resume
+from .resume_pipeline import recommend_for_resume
+from .skill_extractor import PDFTooLargeError, extract_skills, submit_pdf_text
+from .skill_index import add_resume_skills
+
+logger = logging.getLogger(__name__)
+
+
+class BulkIngestError(Exception):
+    """The batch itself is unusable (not a ZIP, no PDFs, too many files); maps to a 400 response."""
+
+
+def _sha256_path(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _max_files() -> int:
+    return getattr(settings, "BULK_MAX_FILES", 500)
+
+
+def _copy_capped(src, dst, limit: int) -> bool:
+    """Copy at most limit bytes from src to dst; False if src holds more."""
+    copied = 0
+    for chunk in iter(lambda: src.read(64 * 1024), b""):
+        copied += len(chunk)
+        if copied > limit:
+            return False
+        dst.write(chunk)
+    return True
+
+
+def unpack_zip(zip_file, target_dir: str) -> Tuple[List[Tuple[str, str]], List[Dict[str, Any]]]:
+    """Write the PDFs in a ZIP (path or file object) to target_dir.
+
+    Returns (name, path) pairs and a failed manifest entry for every PDF
+    larger than PDF_MAX_BYTES. The size in the ZIP header can be forged, so
+    copying also stops once an entry has decompressed past the limit.
+    """
+    max_bytes = getattr(settings, "PDF_MAX_BYTES", 10 * 1024 * 1024)
+    try:
+        archive = zipfile.ZipFile(zip_file)
+    except zipfile.BadZipFile:
+        raise BulkIngestError("Upload is not a valid ZIP file")
+    files = []
+    failed = []
+    too_large = f"PDF is larger than {max_bytes} bytes"
+    with archive:
+        entries = [info for info in archive.infolist()
+                   if not info.is_dir() and info.filename.lower().endswith(".pdf")
+                   and not info.filename.startswith("__MACOSX/")]
+        if len(entries) > _max_files():
+            raise BulkIngestError(f"ZIP holds {len(entries)} PDFs; the limit is {_max_files()}")
+        for index, info in enumerate(entries):
+            if info.file_size > max_bytes:
+                failed.append({"file": info.filename, "status": "failed", "error": too_large})
+                continue
+            path = os.path.join(target_dir, f"{index:05d}.pdf")
+            try:
+                with archive.open(info) as src, open(path, "wb") as dst:
+                    error = None if _copy_capped(src, dst, max_bytes) else too_large
+            except (zipfile.BadZipFile, zlib.error, NotImplementedError, RuntimeError) as e:
+                # Corrupt, encrypted or unsupported entry.
+                error = f"Could not unpack PDF: {e}"
+            if error:
+                os.remove(path)
+                failed.append({"file": info.filename, "status": "failed", "error": error})
+                continue
+            files.append((info.filename, path))
+    return files, failed
+
+
+def list_pdf_dir(directory: str) -> List[Tuple[str, str]]:
+    """(name, path) pairs for the PDFs directly inside directory."""
+    files = [
+        (name, os.path.join(directory, name))
+        for name in sorted(os.listdir(directory))
+        if name.lower().endswith(".pdf") and os.path.isfile(os.path.join(directory, name))
+    ]
+    if len(files) > _max_files():
+        raise BulkIngestError(f"Directory holds {len(files)} PDFs; the limit is {_max_files()}")
+    return files
+
+
+def _analyze(name: str, text_future, role: str) -> Dict[str, Any]:
+    """LLM stage for one file: waits for its parsed text, then extracts and recommends skills."""
+    started = time.monotonic()
+    try:
+        text = text_future.result()
+    except PDFTooLargeError as e:
+        return {"file": name, "status": "failed", "error": str(e)}
+    except Exception as e:
+        return {"file": name, "status": "failed", "error": f"Could not read PDF: {e}"}
+    if not text.strip():
+        return {"file": name, "status": "failed", "error": "Could not extract text from PDF"}
+    extracted = canonical_skills(extract_skills(text))
+    recommended = recommend_for_resume(extracted, role)
+    return {
+        "file": name,
+        "status": "created",
+        "extracted_skills": extracted,
+        "recommended_skills": recommended,
+        "duration_ms": round((time.monotonic() - started) * 1000),
+    }
+
+
+def _store(results: List[Dict[str, Any]], hashes: Dict[str, str], role: str) -> None:
+    """Insert Resume and ResumeSkill rows for the created results and set their resume_id."""
+    created = [r for r in results if r["status"] == "created"]
+    if not created:
+        return
+    resumes = [
+        Resume(
+            file_name=os.path.basename(r["file"])[:255],
+            role=role,
+            content_hash=hashes[r["file"]],
+            extracted_skills=", ".join(r["extracted_skills"]),
+            recommended_skills=", ".join(r["recommended_skills"]) or None,
+        )
+        for r in created
+    ]
+    try:
+        with transaction.atomic():
+            Resume.objects.bulk_create(resumes, batch_size=500)
+    except IntegrityError:
+        # A concurrent upload stored one of these PDFs meanwhile; insert one by one.
+        stored = set(Resume.objects.filter(content_hash__in=[r.content_hash for r in resumes])
+                     .values_list("content_hash", flat=True))
+        for resume, result in zip(resumes, created):
+            if resume.content_hash in stored:
+                result["status"] = "duplicate"
+                continue
+            try:
+                with transaction.atomic():
+                    resume.save()
+            except IntegrityError:
+                # Stored by yet another upload since the lookup above.
+                result["status"] = "duplicate"
+    kept = [(resume, r) for resume, r in zip(resumes, created) if r["status"] == "created"]
+    add_resume_skills((resume, r["extracted_skills"], r["recommended_skills"]) for resume, r in kept)
+    for resume, result in kept:
+        result["resume_id"] = resume.id
+        record_resume(role, result["extracted_skills"], result["recommended_skills"])
+
+
+def ingest_files(files: List[Tuple[str, str]], role: str = "", workers: Optional[int] = None,
+                 failed: Optional[List[Dict[str, Any]]] = None,
+                 progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+    """Process (name, path) PDFs as one batch and return a per-file manifest.
+
+    failed holds entries already rejected (e.g. oversized ZIP members); they
+    are reported first. PDFs already stored (same bytes) are reported as
+    duplicates without being processed. The rest are parsed on the PDF process pool while up to
+    workers files (settings.BULK_LLM_WORKERS) are in their LLM stage at once;
+    the resulting rows are written with bulk_create.
+
+    progress(done, total) is called once the duplicates are known and again
+    as each remaining file finishes.
+    """
+    failed = list(failed or [])
+    if not files and not failed:
+        raise BulkIngestError("No PDF files found")
+    workers = workers or getattr(settings, "BULK_LLM_WORKERS", 8)
+    started = time.monotonic()
+
+    hashes = {name: _sha256_path(path) for name, path in files}
+    stored = dict(Resume.objects.filter(content_hash__in=set(hashes.values())).values_list("content_hash", "id"))
+    manifest: List[Dict[str, Any]] = []
+    todo: List[Tuple[str, str]] = []
+    seen = set()
+    for name, path in files:
+        content_hash = hashes[name]
+        if content_hash in stored or content_hash in seen:
+            manifest.append({"file": name, "status": "duplicate", "resume_id": stored.get(content_hash)})
+            continue
+        seen.add(content_hash)
+        todo.append((name, path))
+    if progress:
+        progress(len(manifest), len(files))
+
+    # Parsing runs ahead on the process pool; the thread pool bounds the LLM stage.
+    parsing = [(name, submit_pdf_text(path)) for name, path in todo]
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="bulk-ingest") as executor, \
+            rate_limiter.priority(rate_limiter.BULK):
+        # LLM calls for the batch queue behind interactive requests on rate-limited models.
+        futures = {executor.submit(contextvars.copy_context().run, _analyze, name, future, role): name
+                   for name, future in parsing}
+        results = []
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"Bulk ingestion of {name} failed: {e}")
+                results.append({"file": name, "status": "failed", "error": str(e)})
+            if progress:
+                progress(len(manifest) + len(results), len(files))
+
+    _store(results, hashes, role)
+    order = {name: index for index, (name, _) in enumerate(files)}
+    manifest = failed + sorted(manifest + results, key=lambda r: order[r["file"]])
+    elapsed = time.monotonic() - started
+    counts = {status: sum(1 for r in manifest if r["status"] == status)
+              for status in ("created", "duplicate", "failed")}
+    return {
+        "files": len(manifest),
+        **counts,
+        "elapsed_s": round(elapsed, 3),
+        "files_per_s": round(len(manifest) / elapsed, 2) if elapsed else None,
+        "results": manifest,
+    }
+
+
+def make_work_dir() -> str:
+    """Create a bulk-ingest-* directory under EXTRACTION_JOB_UPLOAD_DIR (or the system tempdir)."""
+    upload_dir = getattr(settings, "EXTRACTION_JOB_UPLOAD_DIR", None)
+    if upload_dir:
+        os.makedirs(upload_dir, exist_ok=True)
+    return tempfile.mkdtemp(prefix="bulk-ingest-", dir=upload_dir)
+
+
+def ingest_zip(zip_file, role: str = "", workers: Optional[int] = None,
+               progress: Optional[Callable[[int, int], None]] = None,
+               work_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Unpack a ZIP of PDFs and ingest them; see ingest_files for progress.
+
+    The PDFs go to work_dir (a new make_work_dir() if not given), which is
+    removed afterwards. Callers that pass it can record it first so the job
+    sweeper knows the directory is in use.
+    """
+    work_dir = work_dir or make_work_dir()
+    try:
+        files, failed = unpack_zip(zip_file, work_dir)
+        return ingest_files(files, role, workers, failed, progress=progress)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
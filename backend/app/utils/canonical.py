@@ -0,0 +1,105 @@
+import difflib
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from .skill_taxonomy import ROLES, SKILLS
+
+# Seniority words kept in front of a canonical role, e.g. "sr sde" -> "Senior Software Engineer".
+SENIORITY = {
+    "senior": "Senior", "sr": "Senior", "junior": "Junior", "jr": "Junior", "lead": "Lead",
+    "principal": "Principal", "staff": "Staff", "associate": "Associate", "intern": "Intern",
+    "trainee": "Trainee", "entry level": "Entry Level", "graduate": "Graduate",
+}
+
+# Fuzzy matching only fixes near-identical typos ("kubernets"): distinct names such as
+# "NestJS"/"Next.js" or "Scalar"/"Scala" are only a few characters apart.
+FUZZY_MIN_LENGTH = 5
+FUZZY_CUTOFF = 0.92
+
+
+def _squash(text: str) -> str:
+    """Lookup key: lowercase with spaces, dots, hyphens and underscores removed ("Node.js" -> "nodejs")."""
+    return re.sub(r"[\s.\-_]+", "", text.lower())
+
+
+def _clean(text) -> str:
+    return " ".join(str(text).split())
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """True if b is a with at most one character inserted, deleted or replaced."""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    for i, (x, y) in enumerate(zip(a, b)):
+        if x != y:
+            return a[i + 1:] == b[i + 1:] if len(a) == len(b) else a[i:] == b[i + 1:]
+    return True
+
+
+class AliasIndex:
+    """Exact alias lookup by squashed key, optionally with a fallback for near-identical typos."""
+
+    def __init__(self, entries: Dict[str, List[str]], fuzzy: bool = True):
+        self.fuzzy = fuzzy
+        self._lookup: Dict[str, str] = {}
+        for canonical, aliases in entries.items():
+            for name in [canonical, *aliases]:
+                self._lookup.setdefault(_squash(name), canonical)
+        self._keys = sorted(self._lookup)
+
+    @lru_cache(maxsize=4096)
+    def find(self, text: str) -> Optional[str]:
+        key = _squash(text)
+        if not key:
+            return None
+        if key in self._lookup:
+            return self._lookup[key]
+        if self.fuzzy and len(key) >= FUZZY_MIN_LENGTH:
+            for close in difflib.get_close_matches(key, self._keys, n=3, cutoff=FUZZY_CUTOFF):
+                if len(close) == len(key) or _within_one_edit(key, close):
+                    return self._lookup[close]
+        return None
+
+
+@lru_cache(maxsize=1)
+def _indexes() -> Tuple[AliasIndex, AliasIndex]:
+    """Skill and role indexes, built once per process; role names are never fuzzed
+    ("Project Manager" and "Product Manager" are different jobs)."""
+    return AliasIndex(SKILLS), AliasIndex(ROLES, fuzzy=False)
+
+
+def canonical_skill(name) -> str:
+    """Canonical display name for a skill ("JS", "java script" -> "JavaScript"); unknown skills are tidied only."""
+    cleaned = _clean(name)
+    return _indexes()[0].find(cleaned) or cleaned
+
+
+def canonical_skills(names) -> List[str]:
+    """Canonicalize a list of skills, dropping blanks and duplicates while keeping order."""
+    seen, result = set(), []
+    for name in names or []:
+        if not name or not isinstance(name, str):
+            continue
+        skill = canonical_skill(name)
+        if skill and skill.lower() not in seen:
+            seen.add(skill.lower())
+            result.append(skill)
+    return result
+
+
+def canonical_role(role) -> str:
+    """Canonical target role ("SDE" -> "Software Engineer"), keeping a seniority prefix."""
+    cleaned = _clean(role or "")
+    if not cleaned:
+        return ""
+    prefix = ""
+    lowered = cleaned.lower()
+    for word, label in SENIORITY.items():
+        if lowered.startswith(word + " ") or lowered.startswith(word + ". "):
+            prefix = label + " "
+            cleaned = cleaned[len(word):].lstrip(". ")
+            break
+    return prefix + (_indexes()[1].find(cleaned) or cleaned)
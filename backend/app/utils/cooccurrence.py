@@ -0,0 +1,163 @@
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from itertools import groupby
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db.models import Count
+
+from ..models import ResumeSkill
+from .canonical import canonical_role
+
+logger = logging.getLogger(__name__)
+
+STRATEGIES = ("cooccurrence", "llm")
+
+
+def _key(text: str) -> str:
+    return " ".join(text.split()).lower()
+
+
+def _role_key(role: str) -> str:
+    return _key(canonical_role(role))
+
+
+class CooccurrenceModel:
+    """Sparse skill-by-skill and role-by-skill co-occurrence counts over stored resumes.
+
+    Counts are dicts of Counters keyed by lowercased skill name, so only pairs
+    that actually occur take memory. Skill pairs come from each resume's
+    extracted skills; role rows count every skill (extracted or recommended)
+    attached to resumes targeting that role.
+    """
+
+    def __init__(self):
+        self.names: Dict[str, str] = {}
+        self.skill_counts: Counter = Counter()
+        self.pair_counts: Dict[str, Counter] = defaultdict(Counter)
+        self.role_counts: Counter = Counter()
+        self.role_skill_counts: Dict[str, Counter] = defaultdict(Counter)
+        self.built_at = 0.0
+
+    @classmethod
+    def from_db(cls) -> "CooccurrenceModel":
+        model = cls()
+        # Role-by-skill counts are aggregated in SQL (raw roles; merged under their canonical form).
+        role_rows = (
+            ResumeSkill.objects
+            .values("resume__role", "skill__name")
+            .annotate(n=Count("resume_id", distinct=True))
+        )
+        for row in role_rows.iterator():
+            name = row["skill__name"]
+            model.names.setdefault(_key(name), name)
+            model.role_skill_counts[_role_key(row["resume__role"] or "")][_key(name)] += row["n"]
+        for row in ResumeSkill.objects.values("resume__role").annotate(n=Count("resume_id", distinct=True)):
+            model.role_counts[_role_key(row["resume__role"] or "")] += row["n"]
+
+        links = (
+            ResumeSkill.objects
+            .filter(is_extracted=True)
+            .order_by("resume_id")
+            .values_list("resume_id", "skill__name")
+        )
+        for _, rows in groupby(links.iterator(), key=lambda row: row[0]):
+            model._add_skills([name for _, name in rows])
+        model.built_at = time.monotonic()
+        return model
+
+    def _add_skills(self, skills: List[str]) -> None:
+        keys = []
+        for name in skills:
+            key = _key(name)
+            if key and key not in keys:
+                self.names.setdefault(key, name)
+                keys.append(key)
+        for key in keys:
+            self.skill_counts[key] += 1
+            pairs = self.pair_counts[key]
+            for other in keys:
+                if other != key:
+                    pairs[other] += 1
+
+    def add_resume(self, role: str, extracted: Iterable[str], recommended: Iterable[str] = ()) -> None:
+        """Fold one newly stored resume into the counts."""
+        extracted = list(extracted or [])
+        self._add_skills(extracted)
+        role_key = _role_key(role or "")
+        self.role_counts[role_key] += 1
+        role_row = self.role_skill_counts[role_key]
+        for key in {_key(s) for s in [*extracted, *(recommended or [])] if s}:
+            role_row[key] += 1
+
+    def knows_role(self, role: str) -> bool:
+        minimum = getattr(settings, "SKILL_RECOMMEND_MIN_ROLE_RESUMES", 3)
+        return self.role_counts.get(_role_key(role or ""), 0) >= minimum
+
+    def recommend(self, skills: List[str], role: str, limit: int = 5) -> List[str]:
+        """Skills most associated with the role and with the candidate's skills, best first.
+
+        Each candidate scores P(candidate | role) plus the mean of
+        P(candidate | skill) over the candidate's known skills.
+        """
+        owned = {_key(s) for s in skills if s}
+        scores: Counter = Counter()
+        role_key = _role_key(role or "")
+        role_total = self.role_counts.get(role_key, 0)
+        if role_total:
+            for key, count in self.role_skill_counts.get(role_key, {}).items():
+                scores[key] += count / role_total
+        known = [key for key in owned if self.skill_counts.get(key)]
+        for key in known:
+            total = self.skill_counts[key] * len(known)
+            for other, count in self.pair_counts[key].items():
+                scores[other] += count / total
+        ranked = sorted(
+            (key for key in scores if key not in owned),
+            key=lambda key: (-scores[key], key),
+        )
+        return [self.names[key] for key in ranked[:limit]]
+
+
+_lock = threading.Lock()
+_model: Optional[CooccurrenceModel] = None
+
+
+def get_model() -> CooccurrenceModel:
+    """The process-wide model, rebuilt from the database every SKILL_RECOMMEND_REBUILD_SECONDS."""
+    global _model
+    max_age = getattr(settings, "SKILL_RECOMMEND_REBUILD_SECONDS", 3600)
+    model = _model
+    if model is not None and time.monotonic() - model.built_at < max_age:
+        return model
+    with _lock:
+        if _model is None or time.monotonic() - _model.built_at >= max_age:
+            started = time.monotonic()
+            _model = CooccurrenceModel.from_db()
+            logger.info(f"Built skill co-occurrence model over {len(_model.skill_counts)} skills "
+                        f"in {(time.monotonic() - started) * 1000:.1f} ms")
+        return _model
+
+
+def reset_model() -> None:
+    global _model
+    with _lock:
+        _model = None
+
+
+def record_resume(role: str, extracted: Iterable[str], recommended: Iterable[str] = ()) -> None:
+    """Incrementally add a newly stored resume to the loaded model (no-op if none is loaded yet)."""
+    with _lock:
+        if _model is not None:
+            _model.add_resume(role, extracted, recommended)
+
+
+def recommend(skills: List[str], role: str, limit: int = 5) -> Optional[List[str]]:
+    """Co-occurrence recommendations, or None when the role has too few resumes (cold start)."""
+    model = get_model()
+    with _lock:
+        if not model.knows_role(role):
+            return None
+        return model.recommend(skills, role, limit)
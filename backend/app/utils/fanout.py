@@ -0,0 +1,95 @@
+import asyncio
+import contextvars
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+def fanout_enabled() -> bool:
+    return getattr(settings, "LLM_FANOUT_ENABLED", True)
+
+
+def fan_out(func: Callable[[Any], Any], items: Iterable[Hashable],
+            max_workers: Optional[int] = None, timeout: Optional[float] = None) -> Dict[Any, Any]:
+    """Run func(item) for every item on a bounded thread pool and collect the results.
+
+    At most max_workers calls run at once. Each call gets its own deadline of
+    timeout seconds from the moment it starts; calls that overrun (or raise)
+    are reported as None and their results are discarded if they finish later.
+    """
+    items = list(dict.fromkeys(items))
+    if not items:
+        return {}
+    if max_workers is None:
+        max_workers = getattr(settings, "LLM_FANOUT_MAX_WORKERS", 4)
+    if timeout is None:
+        timeout = getattr(settings, "LLM_FANOUT_CALL_TIMEOUT", 60)
+
+    started: Dict[Any, float] = {}
+
+    def run(item):
+        started[item] = time.monotonic()
+        return func(item)
+
+    results: Dict[Any, Any] = {item: None for item in items}
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))),
+                                  thread_name_prefix="llm-fanout")
+    try:
+        # Each task runs in its own copy of the caller's context so context
+        # variables (request-scoped settings, priorities) follow the work.
+        pending = {executor.submit(contextvars.copy_context().run, run, item): item for item in items}
+        while pending:
+            now = time.monotonic()
+            running = [started[item] for item in pending.values() if item in started]
+            wait_for = min(start + timeout for start in running) - now if running else timeout
+            done, _ = wait(pending, timeout=max(wait_for, 0.01), return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                try:
+                    results[item] = future.result()
+                except Exception as e:
+                    logger.warning(f"Fan-out call for {item!r} failed: {e}")
+            now = time.monotonic()
+            for future, item in list(pending.items()):
+                if item in started and now - started[item] >= timeout:
+                    logger.warning(f"Fan-out call for {item!r} exceeded {timeout}s deadline")
+                    future.cancel()
+                    pending.pop(future)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+async def afan_out(func: Callable[[Any], Awaitable[Any]], items: Iterable[Hashable],
+                   max_workers: Optional[int] = None, timeout: Optional[float] = None) -> Dict[Any, Any]:
+    """fan_out() for coroutines: at most max_workers of the func(item) coroutines run at once.
+
+    Each call's timeout starts when it gets a slot; calls that overrun or
+    raise are reported as None.
+    """
+    items = list(dict.fromkeys(items))
+    if not items:
+        return {}
+    if max_workers is None:
+        max_workers = getattr(settings, "LLM_FANOUT_MAX_WORKERS", 4)
+    if timeout is None:
+        timeout = getattr(settings, "LLM_FANOUT_CALL_TIMEOUT", 60)
+    slots = asyncio.Semaphore(max(1, max_workers))
+
+    async def run(item):
+        async with slots:
+            try:
+                return await asyncio.wait_for(func(item), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Fan-out call for {item!r} exceeded {timeout}s deadline")
+            except Exception as e:
+                logger.warning(f"Fan-out call for {item!r} failed: {e}")
+            return None
+
+    results = await asyncio.gather(*(run(item) for item in items))
+    return dict(zip(items, results))
@@ -0,0 +1,204 @@
+import asyncio
+import contextvars
+import logging
+import queue
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+from . import latency
+
+logger = logging.getLogger(__name__)
+
+_stats_lock = threading.Lock()
+_stats = {"calls": 0, "hedged": 0, "fallbacks": 0, "failed": 0, "wins": {}}
+
+
+class Attempt:
+    """One model's attempt within a hedged call; the winner cancels the others."""
+
+    def __init__(self, model: str):
+        self.model = model
+        self.started = time.monotonic()
+        self.finished = False
+        self.cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._closers: List[Callable[[], None]] = []
+
+    def on_cancel(self, close: Callable[[], None]) -> None:
+        """Register close() (e.g. closing the HTTP stream) to run on cancel, or now if already cancelled."""
+        with self._lock:
+            if not self.cancelled.is_set():
+                self._closers.append(close)
+                return
+        _quietly(close)
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled.set()
+            closers, self._closers = self._closers, []
+        for close in closers:
+            _quietly(close)
+
+
+def _quietly(fn: Callable[[], None]) -> None:
+    try:
+        fn()
+    except Exception:
+        pass
+
+
+def hedge_enabled() -> bool:
+    return getattr(settings, "LLM_HEDGE_ENABLED", True)
+
+
+def hedge_delay(model: str) -> float:
+    """How long to give model before hedging: its recent p95 latency, within configured bounds.
+
+    Until LLM_HEDGE_MIN_SAMPLES calls have been seen, LLM_HEDGE_DEFAULT_DELAY is used.
+    """
+    p95 = latency.percentile(
+        model,
+        getattr(settings, "LLM_HEDGE_PERCENTILE", 95),
+        min_samples=getattr(settings, "LLM_HEDGE_MIN_SAMPLES", 20),
+    )
+    if p95 is None:
+        return getattr(settings, "LLM_HEDGE_DEFAULT_DELAY", 15.0)
+    return max(getattr(settings, "LLM_HEDGE_MIN_DELAY", 1.0), p95)
+
+
+def _count(name: str, model: Optional[str] = None) -> None:
+    with _stats_lock:
+        if model is None:
+            _stats[name] += 1
+        else:
+            _stats[name][model] = _stats[name].get(model, 0) + 1
+
+
+def stats() -> Dict[str, object]:
+    with _stats_lock:
+        return {**_stats, "wins": dict(_stats["wins"])}
+
+
+def hedged_call(models: List[str], call: Callable[[str, Attempt], str],
+                valid: Callable[[str], bool] = bool) -> Tuple[str, Optional[str]]:
+    """Run call(model, attempt) along a fallback chain and return (text, winning model).
+
+    The first model starts right away. If it has not produced a valid answer
+    within hedge_delay(model), the next model in the chain is started in
+    parallel (a hedge); if an attempt fails or returns something invalid,
+    the next one starts immediately (a fallback). The first valid answer wins
+    and every other attempt is cancelled. With hedging disabled the chain is
+    only walked on failure. Returns ("", None) when every model fails.
+    """
+    _count("calls")
+    results: "queue.Queue[Tuple[Attempt, str, float]]" = queue.Queue()
+    attempts: List[Attempt] = []
+    hedging = hedge_enabled() and len(models) > 1
+
+    def launch(model: str) -> float:
+        attempt = Attempt(model)
+        attempts.append(attempt)
+
+        def run():
+            try:
+                text = call(model, attempt)
+            except Exception as e:
+                logger.warning(f"{model} attempt failed: {e}")
+                text = ""
+            attempt.finished = True
+            results.put((attempt, text, time.monotonic() - attempt.started))
+
+        thread = threading.Thread(target=contextvars.copy_context().run, args=(run,),
+                                  name=f"llm-hedge-{model}", daemon=True)
+        thread.start()
+        return time.monotonic() + hedge_delay(model) if hedging else float("inf")
+
+    next_index = 1
+    hedge_at = launch(models[0])
+    pending = 1
+    while pending:
+        wait = None
+        if next_index < len(models) and hedge_at != float("inf"):
+            wait = max(0.0, hedge_at - time.monotonic())
+        try:
+            attempt, text, elapsed = results.get(timeout=wait)
+        except queue.Empty:
+            logger.info(f"{attempts[-1].model} is slow; hedging with {models[next_index]}")
+            _count("hedged")
+            hedge_at = launch(models[next_index])
+            next_index += 1
+            pending += 1
+            continue
+
+        pending -= 1
+        if text and valid(text):
+            latency.record(attempt.model, elapsed)
+            _count("wins", attempt.model)
+            for other in attempts:
+                if not other.finished:
+                    # Its latency is unknown, only bounded below; recording the bound would skew its p95.
+                    other.cancel()
+            return text, attempt.model
+
+        latency.record_failure(attempt.model)
+        if next_index < len(models):
+            _count("fallbacks")
+            hedge_at = launch(models[next_index])
+            next_index += 1
+            pending += 1
+    _count("failed")
+    return "", None
+
+
+async def ahedged_call(models: List[str], call: Callable[[str], Awaitable[str]],
+                       valid: Callable[[str], bool] = bool) -> Tuple[str, Optional[str]]:
+    """hedged_call() for coroutines: each attempt is a task, and losing tasks are cancelled outright."""
+    _count("calls")
+    hedging = hedge_enabled() and len(models) > 1
+    running: Dict[asyncio.Future, Tuple[str, float]] = {}
+
+    def launch(model: str) -> float:
+        started = time.monotonic()
+        running[asyncio.ensure_future(call(model))] = (model, started)
+        return started + hedge_delay(model) if hedging else float("inf")
+
+    next_index = 1
+    hedge_at = launch(models[0])
+    try:
+        while running:
+            wait = None
+            if next_index < len(models) and hedge_at != float("inf"):
+                wait = max(0.0, hedge_at - time.monotonic())
+            done, _ = await asyncio.wait(running, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                logger.info(f"{models[next_index - 1]} is slow; hedging with {models[next_index]}")
+                _count("hedged")
+                hedge_at = launch(models[next_index])
+                next_index += 1
+                continue
+
+            for task in done:
+                model, started = running.pop(task)
+                try:
+                    text = task.result()
+                except Exception as e:
+                    logger.warning(f"{model} attempt failed: {e}")
+                    text = ""
+                if text and valid(text):
+                    latency.record(model, time.monotonic() - started)
+                    _count("wins", model)
+                    # Losers are cancelled in the finally below without a latency sample.
+                    return text, model
+                latency.record_failure(model)
+                if next_index < len(models):
+                    _count("fallbacks")
+                    hedge_at = launch(models[next_index])
+                    next_index += 1
+        _count("failed")
+        return "", None
+    finally:
+        for task in running:
+            task.cancel()
@@ -0,0 +1,244 @@
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.utils import timezone
+
+from ..models import ExtractionJob
+from . import rate_limiter
+from .bulk_ingest import BulkIngestError, ingest_zip, make_work_dir
+from .resume_pipeline import PipelineError, STAGES, run_resume_pipeline
+
+logger = logging.getLogger(__name__)
+
+BULK_STAGE = "bulk_ingest"
+
+_lock = threading.Lock()
+_executor = None
+_executor_pid = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Process-local worker pool; rebuilt after fork so each gunicorn worker owns its threads."""
+    global _executor, _executor_pid
+    with _lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "EXTRACTION_JOB_WORKERS", 2),
+                thread_name_prefix="extraction-job",
+            )
+            _executor_pid = os.getpid()
+    return _executor
+
+
+def _spool_upload(file_obj, suffix: str = ".pdf") -> str:
+    upload_dir = getattr(settings, "EXTRACTION_JOB_UPLOAD_DIR", None)
+    if upload_dir:
+        os.makedirs(upload_dir, exist_ok=True)
+    fd, path = tempfile.mkstemp(prefix="resume-", suffix=suffix, dir=upload_dir)
+    try:
+        file_obj.seek(0)
+    except Exception:
+        pass
+    with os.fdopen(fd, "wb") as out:
+        if hasattr(file_obj, "chunks"):
+            for chunk in file_obj.chunks():
+                out.write(chunk)
+        else:
+            shutil.copyfileobj(file_obj, out)
+    return path
+
+
+def enqueue_extraction(file_obj, role: str) -> ExtractionJob:
+    """Spool the upload to disk, record a queued job and hand it to the worker pool."""
+    job = ExtractionJob.objects.create(
+        role=role,
+        file_name=getattr(file_obj, "name", None),
+        upload_path=_spool_upload(file_obj),
+        stages={stage: {"status": "pending"} for stage in STAGES},
+    )
+    _get_executor().submit(run_extraction_job, job.pk)
+    return job
+
+
+def enqueue_bulk_ingest(file_obj, role: str) -> ExtractionJob:
+    """Spool a ZIP of resumes to disk and queue it; the job's result is the bulk manifest."""
+    if not zipfile.is_zipfile(file_obj):
+        raise BulkIngestError("Upload is not a valid ZIP file")
+    job = ExtractionJob.objects.create(
+        role=role,
+        file_name=getattr(file_obj, "name", None),
+        upload_path=_spool_upload(file_obj, suffix=".zip"),
+        stages={BULK_STAGE: {"status": "pending"}},
+    )
+    _get_executor().submit(run_bulk_job, job.pk)
+    return job
+
+
+def _remove_upload(job_id) -> None:
+    try:
+        path = ExtractionJob.objects.filter(pk=job_id).values_list("upload_path", flat=True).first()
+        if path and os.path.exists(path):
+            os.remove(path)
+    except Exception as e:
+        logger.warning(f"Could not remove spooled upload for job {job_id}: {e}")
+
+
+def run_bulk_job(job_id) -> None:
+    """Ingest a queued ZIP of resumes and store the per-file manifest as the job's result."""
+    close_old_connections()
+    try:
+        job = ExtractionJob.objects.get(pk=job_id)
+        started = timezone.now()
+        # The unpack dir is recorded first so the sweeper leaves it alone while the job runs.
+        stages = {BULK_STAGE: {"status": "running", "started_at": started.isoformat(), "work_dir": make_work_dir()}}
+        ExtractionJob.objects.filter(pk=job_id).update(status=ExtractionJob.RUNNING, stages=stages, updated_at=started)
+
+        def progress(done, total):
+            stages[BULK_STAGE].update(files_done=done, files_total=total)
+            ExtractionJob.objects.filter(pk=job_id).update(stages=stages, updated_at=timezone.now())
+
+        try:
+            manifest = ingest_zip(job.upload_path, job.role, progress=progress,
+                                  work_dir=stages[BULK_STAGE]["work_dir"])
+        except Exception as e:
+            if not isinstance(e, BulkIngestError):
+                logger.exception(f"Bulk ingest job {job_id} failed")
+            stages[BULK_STAGE]["status"] = "failed"
+            ExtractionJob.objects.filter(pk=job_id).update(
+                status=ExtractionJob.FAILED, stages=stages, error=str(e), updated_at=timezone.now()
+            )
+            return
+
+        now = timezone.now()
+        stages[BULK_STAGE].update(status="done", finished_at=now.isoformat(),
+                                  duration_ms=round((now - started).total_seconds() * 1000))
+        ExtractionJob.objects.filter(pk=job_id).update(
+            status=ExtractionJob.SUCCEEDED, stages=stages, result=manifest, updated_at=now
+        )
+    finally:
+        _remove_upload(job_id)
+        connection.close()
+
+
+def run_extraction_job(job_id) -> None:
+    """Run the resume pipeline for a queued job, recording per-stage progress on the row."""
+    close_old_connections()
+    try:
+        job = ExtractionJob.objects.get(pk=job_id)
+        stages = job.stages or {}
+        ExtractionJob.objects.filter(pk=job_id).update(status=ExtractionJob.RUNNING, updated_at=timezone.now())
+
+        def progress(stage, state):
+            now = timezone.now()
+            entry = stages.setdefault(stage, {})
+            if state == "started":
+                entry.update(status="running", started_at=now.isoformat())
+            elif state == "skipped":
+                entry.update(status="skipped")
+            else:
+                entry.update(status="done", finished_at=now.isoformat())
+                started = entry.get("started_at")
+                if started:
+                    elapsed = now - timezone.datetime.fromisoformat(started)
+                    entry["duration_ms"] = round(elapsed.total_seconds() * 1000)
+            ExtractionJob.objects.filter(pk=job_id).update(stages=stages, updated_at=now)
+
+        try:
+            with open(job.upload_path, "rb") as file_obj, rate_limiter.priority(rate_limiter.BACKGROUND):
+                result = run_resume_pipeline(file_obj, job.role, filename=job.file_name, progress=progress)
+        except Exception as e:
+            if not isinstance(e, PipelineError):
+                logger.exception(f"Extraction job {job_id} failed")
+            for entry in stages.values():
+                if entry.get("status") == "running":
+                    entry["status"] = "failed"
+            ExtractionJob.objects.filter(pk=job_id).update(
+                status=ExtractionJob.FAILED, stages=stages, error=str(e), updated_at=timezone.now()
+            )
+            return
+
+        ExtractionJob.objects.filter(pk=job_id).update(
+            status=ExtractionJob.SUCCEEDED,
+            result=result,
+            resume_id=result["data"]["id"],
+            updated_at=timezone.now(),
+        )
+    finally:
+        _remove_upload(job_id)
+        connection.close()
+
+
+def _stale_seconds() -> float:
+    return getattr(settings, "EXTRACTION_JOB_STALE_SECONDS", 3600)
+
+
+def run_job(job_id) -> None:
+    """Run a queued job of either kind in the calling thread."""
+    stages = ExtractionJob.objects.filter(pk=job_id).values_list("stages", flat=True).first() or {}
+    (run_bulk_job if BULK_STAGE in stages else run_extraction_job)(job_id)
+
+
+def sweep_stale_jobs(requeue: bool = False, older_than: Optional[float] = None) -> Dict[str, List]:
+    """Settle jobs whose worker died: queued or running rows not updated for EXTRACTION_JOB_STALE_SECONDS.
+
+    With requeue, jobs whose spooled upload is still on disk go back to
+    queued and their ids are returned for the caller to run; the rest are
+    marked failed. Spooled uploads that no live job refers to are deleted.
+    """
+    older_than = _stale_seconds() if older_than is None else older_than
+    cutoff = timezone.now() - timedelta(seconds=older_than)
+    requeued, failed = [], []
+    stale = ExtractionJob.objects.filter(
+        status__in=[ExtractionJob.QUEUED, ExtractionJob.RUNNING], updated_at__lt=cutoff
+    ).values_list("id", "updated_at", "upload_path", "stages")
+    for job_id, updated_at, path, stages in stale:
+        # Only if no other sweep (or a late worker) touched the row since it was read.
+        row = ExtractionJob.objects.filter(pk=job_id, updated_at=updated_at)
+        if requeue and path and os.path.exists(path):
+            stages = ({BULK_STAGE: {"status": "pending"}} if BULK_STAGE in (stages or {})
+                      else {stage: {"status": "pending"} for stage in STAGES})
+            if row.update(status=ExtractionJob.QUEUED, stages=stages, updated_at=timezone.now()):
+                requeued.append(job_id)
+        elif row.update(status=ExtractionJob.FAILED, updated_at=timezone.now(),
+                        error="The job was interrupted before it finished"):
+            failed.append(job_id)
+            _remove_upload(job_id)
+    return {"requeued": requeued, "failed": failed, "removed_uploads": _remove_orphaned_uploads(older_than)}
+
+
+def _remove_orphaned_uploads(older_than: float) -> List[str]:
+    """Delete spooled uploads and bulk unpack dirs older than older_than seconds that no live job uses."""
+    upload_dir = getattr(settings, "EXTRACTION_JOB_UPLOAD_DIR", None) or tempfile.gettempdir()
+    if not os.path.isdir(upload_dir):
+        return []
+    live = set()
+    for path, stages in (ExtractionJob.objects.filter(status__in=[ExtractionJob.QUEUED, ExtractionJob.RUNNING])
+                         .values_list("upload_path", "stages")):
+        live.add(path)
+        live.add(((stages or {}).get(BULK_STAGE) or {}).get("work_dir"))
+    cutoff = time.time() - older_than
+    removed = []
+    for entry in os.scandir(upload_dir):
+        spooled = entry.name.startswith("resume-") and entry.name.endswith((".pdf", ".zip")) and entry.is_file()
+        unpacked = entry.name.startswith("bulk-ingest-") and entry.is_dir()
+        try:
+            if not (spooled or unpacked) or entry.path in live or entry.stat().st_mtime > cutoff:
+                continue
+            if unpacked:
+                shutil.rmtree(entry.path)
+            else:
+                os.remove(entry.path)
+            removed.append(entry.path)
+        except OSError as e:
+            logger.warning(f"Could not remove {entry.path}: {e}")
+    return removed
@@ -0,0 +1,175 @@
+import json
+import logging
+from typing import Any, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# strict=False lets raw newlines and tabs through inside strings, which models often emit.
+_decoder = json.JSONDecoder(strict=False)
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+def loads_lenient(text: str, root: type = dict, max_depth: Optional[int] = None) -> Tuple[Any, bool]:
+    """Parse the first JSON object (root=dict) or array (root=list) in LLM output.
+
+    Returns (value, complete); value is None when nothing usable is found.
+    Prose or ``` fences around the payload are ignored and trailing commas
+    dropped. A payload cut off mid-way (e.g. at max_tokens) is cut back to
+    its last complete value nested at most max_depth levels deep and closed,
+    with complete=False: max_depth=2 keeps only whole members of
+    {"root": {...}}, so a half-written skill object is left out.
+    """
+    start = text.find("{" if root is dict else "[")
+    if start < 0:
+        return None, False
+    try:
+        value, _ = _decoder.raw_decode(text, start)
+        return value, True
+    except ValueError:
+        pass
+    repaired, complete = _repair(text, start, max_depth)
+    if repaired is None:
+        return None, False
+    try:
+        value, _ = _decoder.raw_decode(repaired)
+    except ValueError:
+        return None, False
+    return value, complete
+
+
+def _drop_trailing_comma(out: List[str]) -> None:
+    i = len(out) - 1
+    while i >= 0 and out[i].isspace():
+        i -= 1
+    if i >= 0 and out[i] == ",":
+        del out[i]
+
+
+def _repair(text: str, start: int, max_depth: Optional[int]) -> Tuple[Optional[str], bool]:
+    """The bracketed payload at text[start] without trailing commas, closed after its last
+    complete value if it is cut off; (None, False) if no value was completed."""
+    out: List[str] = []
+    stack: List[str] = []
+    expect_key: List[bool] = []  # per open container: the next string is an object key
+    in_string = escaped = is_key = False
+    safe = None  # (len(out), open containers) after the last complete value shallow enough to keep
+
+    def mark():
+        nonlocal safe
+        if max_depth is None or len(stack) <= max_depth:
+            safe = (len(out), tuple(stack))
+
+    for char in text[start:]:
+        if in_string:
+            out.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+                if not is_key:
+                    mark()
+            continue
+        if char == '"':
+            in_string = True
+            is_key = expect_key[-1]
+        elif char in "{[":
+            stack.append(char)
+            expect_key.append(char == "{")
+        elif char in "}]":
+            _drop_trailing_comma(out)
+            out.append(_CLOSERS[stack.pop()])
+            expect_key.pop()
+            if not stack:
+                return "".join(out), True
+            mark()
+            continue
+        elif char == ",":
+            mark()
+            expect_key[-1] = stack[-1] == "{"
+        elif char == ":":
+            expect_key[-1] = False
+        out.append(char)
+
+    if safe is None:
+        return None, False
+    length, still_open = safe
+    out = out[:length]
+    _drop_trailing_comma(out)
+    return "".join(out) + "".join(_CLOSERS[c] for c in reversed(still_open)), False
+
+
+class SkillObjectStream:
+    """Incremental parser for LLM output shaped like {"<root>": {"Skill": {...}, ...}}.
+
+    Feed it text as it arrives; feed() yields (skill_name, value) for every
+    member of the root object as soon as that member's closing brace arrives.
+    Leading prose or ``` fences before the first "{" are skipped.
+    """
+
+    def __init__(self):
+        self._buffer = []
+        self._pos = 0
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._string_start: Optional[int] = None
+        self._last_string: Optional[str] = None
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+
+    def _text(self, start: int, end: int) -> str:
+        return "".join(self._buffer[start:end])
+
+    def feed(self, chunk: str) -> Iterator[Tuple[str, Any]]:
+        for char in chunk:
+            self._buffer.append(char)
+            i = self._pos
+            self._pos += 1
+
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 2 and self._value_start is None:
+                        try:
+                            self._last_string = json.loads(self._text(self._string_start, i + 1))
+                        except ValueError:
+                            self._last_string = self._text(self._string_start + 1, i)
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char == ":" and self._depth == 2 and self._value_start is None:
+                self._key = self._last_string
+            elif char in "{[":
+                if self._depth == 2 and self._value_start is None:
+                    self._value_start = i
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 2 and self._value_start is not None:
+                    raw = self._text(self._value_start, i + 1)
+                    self._value_start = None
+                    value, _ = loads_lenient(raw, dict if raw.startswith("{") else list)
+                    if value is None:
+                        logger.warning(f"Skipping malformed streamed object for {self._key!r}")
+                    else:
+                        yield self._key, value
+
+    @property
+    def complete(self) -> bool:
+        """True once the outermost object has been closed."""
+        return self._started and self._depth == 0
@@ -0,0 +1,54 @@
+import threading
+from collections import deque
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+_lock = threading.Lock()
+_samples: Dict[str, deque] = {}
+_failures: Dict[str, int] = {}
+
+
+def record(model: str, seconds: float) -> None:
+    """Record the duration of a successful call to model."""
+    window = getattr(settings, "LLM_LATENCY_WINDOW", 200)
+    with _lock:
+        samples = _samples.get(model)
+        if samples is None or samples.maxlen != window:
+            samples = _samples[model] = deque(samples or (), maxlen=window)
+        samples.append(seconds)
+
+
+def record_failure(model: str) -> None:
+    with _lock:
+        _failures[model] = _failures.get(model, 0) + 1
+
+
+def percentile(model: str, pct: float, min_samples: int = 1) -> Optional[float]:
+    """The pct-th percentile of model's recent call durations, or None with fewer than min_samples."""
+    with _lock:
+        samples = sorted(_samples.get(model) or ())
+    if len(samples) < max(1, min_samples):
+        return None
+    index = min(len(samples) - 1, max(0, round(pct / 100 * len(samples)) - 1))
+    return samples[index]
+
+
+def stats() -> Dict[str, Dict[str, Any]]:
+    """Per-model sample count, failures and p50/p95 latency (seconds) for this process."""
+    with _lock:
+        models = set(_samples) | set(_failures)
+    result = {}
+    for model in sorted(models):
+        with _lock:
+            count = len(_samples.get(model) or ())
+            failures = _failures.get(model, 0)
+        result[model] = {"samples": count, "failures": failures,
+                         "p50_s": percentile(model, 50), "p95_s": percentile(model, 95)}
+    return result
+
+
+def reset() -> None:
+    with _lock:
+        _samples.clear()
+        _failures.clear()
@@ -0,0 +1,84 @@
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "llm:v1"
+
+# Per-process counters: the file cache has no atomic increment and may cull them.
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+# Sentinel so callers can distinguish "not cached" from a cached empty value.
+MISS = object()
+
+
+def backend():
+    """The Django cache backing the LLM cache (also used for cross-worker coordination)."""
+    return caches[getattr(settings, "LLM_CACHE_ALIAS", "llm")]
+
+
+def cache_enabled() -> bool:
+    return getattr(settings, "LLM_CACHE_ENABLED", True)
+
+
+def make_key(model: str, prompt: str, **params: Any) -> str:
+    """Content-addressed key for a completion request: sha256 of (model, prompt, params)."""
+    payload = json.dumps({"model": model, "prompt": prompt, "params": params}, sort_keys=True)
+    return f"{KEY_PREFIX}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def get(key: str) -> Any:
+    """Return the cached value for key, or MISS. Records hit/miss stats."""
+    if not cache_enabled():
+        return MISS
+    try:
+        value = backend().get(key, MISS)
+    except Exception as e:
+        logger.warning(f"LLM cache read failed: {e}")
+        return MISS
+    _count("hits" if value is not MISS else "misses")
+    return value
+
+
+def set(key: str, value: Any, ttl: Optional[int]) -> None:
+    """Store value under key. ttl=None keeps it until evicted, ttl=0 skips caching."""
+    if not cache_enabled() or ttl == 0:
+        return
+    try:
+        backend().set(key, value, timeout=ttl)
+    except Exception as e:
+        logger.warning(f"LLM cache write failed: {e}")
+
+
+# Async variants for coroutines; cache backends may touch disk, so they run on a worker thread.
+aget = sync_to_async(get, thread_sensitive=False)
+aset = sync_to_async(set, thread_sensitive=False)
+
+
+def stats() -> Dict[str, Any]:
+    """Hit/miss counters of this process (GET /metrics serves them per worker)."""
+    with _stats_lock:
+        hits, misses = _stats["hits"], _stats["misses"]
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total, 4) if total else 0.0,
+    }
+
+
+def clear() -> None:
+    backend().clear()
@@ -0,0 +1,110 @@
+import datetime
+import logging
+from typing import Any, Dict, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+
+from ..models import MarketSnapshot
+from . import rate_limiter
+from .fanout import fan_out
+from .openrouter_async import aanalyze_market_demand
+from .openrouter_service import MARKET_MODEL, analyze_market_demand, get_skill_entry
+from .skill_index import get_or_create_skills, top_skills
+
+logger = logging.getLogger(__name__)
+
+
+def latest_snapshots(skills: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Newest snapshot entry ({"name", "data"}) per lowercased skill, if recent enough.
+
+    Snapshots older than settings.MARKET_SNAPSHOT_MAX_AGE_DAYS are ignored.
+    """
+    keys = [s.lower() for s in skills]
+    max_age = getattr(settings, "MARKET_SNAPSHOT_MAX_AGE_DAYS", 7)
+    cutoff = timezone.localdate() - datetime.timedelta(days=max_age)
+    rows = (
+        MarketSnapshot.objects
+        .filter(skill__key__in=keys, snapshot_date__gte=cutoff)
+        .order_by("skill_id", "-snapshot_date")
+        .values_list("skill__key", "name", "data")
+    )
+    found: Dict[str, Dict[str, Any]] = {}
+    for key, name, data in rows:
+        found.setdefault(key, {"name": name, "data": data})
+    return found
+
+
+def market_analysis(skills: List[str]) -> Dict[str, Any]:
+    """Market analysis for skills, served from snapshots where possible.
+
+    Only skills without a recent snapshot are generated live.
+    """
+    snapshots = latest_snapshots(skills)
+    missing = [s for s in skills if s.lower() not in snapshots]
+    live = analyze_market_demand(missing).get("skills", {}) if missing else {}
+    return _combine(snapshots, live)
+
+
+async def amarket_analysis(skills: List[str]) -> Dict[str, Any]:
+    """market_analysis() for async views."""
+    snapshots = await sync_to_async(latest_snapshots)(skills)
+    missing = [s for s in skills if s.lower() not in snapshots]
+    live = (await aanalyze_market_demand(missing)).get("skills", {}) if missing else {}
+    return _combine(snapshots, live)
+
+
+def _combine(snapshots: Dict[str, Dict[str, Any]], live: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    entries = {entry["name"]: entry["data"] for entry in snapshots.values()}
+    entries.update(live or {})
+    return {"skills": entries}
+
+
+def take_snapshot(top_n: int, snapshot_date: Optional[datetime.date] = None,
+                  extra_skills: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Generate and store today's (or snapshot_date's) analysis for the top_n most common skills.
+
+    Skills are ranked by the number of resumes they were extracted from.
+    Entries come from the per-skill LLM cache when it holds one, so a run
+    never repeats a generation made within the market cache TTL. Existing
+    rows for the same day are replaced.
+    """
+    snapshot_date = snapshot_date or timezone.localdate()
+    names = [name for name, _ in top_skills(top_n)] + list(extra_skills or [])
+    skills = get_or_create_skills(names)
+    with rate_limiter.priority(rate_limiter.BACKGROUND):
+        results = fan_out(lambda skill: get_skill_entry("market", skill), list(skills))
+
+    rows = [
+        MarketSnapshot(
+            skill=skills[key],
+            snapshot_date=snapshot_date,
+            name=entry["name"],
+            data=entry["data"],
+            model=MARKET_MODEL,
+        )
+        for key, entry in results.items() if entry
+    ]
+    MarketSnapshot.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["skill", "snapshot_date"],
+        update_fields=["name", "data", "model"],
+    )
+    failed = sorted(key for key, entry in results.items() if not entry)
+    if failed:
+        logger.warning(f"Market snapshot missing {len(failed)} skills: {', '.join(failed)}")
+    return {"date": snapshot_date, "stored": len(rows), "failed": failed}
+
+
+def skill_history(skill: str, days: int = 90) -> List[Dict[str, Any]]:
+    """Stored snapshots for one skill over the last days, oldest first."""
+    cutoff = timezone.localdate() - datetime.timedelta(days=days)
+    rows = (
+        MarketSnapshot.objects
+        .filter(skill__key=skill.lower(), snapshot_date__gte=cutoff)
+        .order_by("snapshot_date")
+        .values("snapshot_date", "data")
+    )
+    return list(rows)
@@ -0,0 +1,179 @@
+import contextvars
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+
+from . import hedging, latency, llm_cache, rate_limiter, singleflight
+
+# Upper bounds (seconds); LLM calls routinely take tens of seconds.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+HISTOGRAMS = {
+    "http_request_duration_seconds": "Time to produce a response, by route, method and status.",
+    "stage_duration_seconds": "Time spent in one request stage (pdf_parse, llm_<task>, db_read, db_write).",
+    "openrouter_request_duration_seconds": "One completion request to OpenRouter, by model and outcome.",
+}
+COUNTERS = {
+    "openrouter_tokens_total": "Tokens OpenRouter reported using, by model and type (prompt or completion).",
+    "llm_parse_failures_total": "LLM responses that could not be parsed, by task.",
+    "llm_partial_responses_total": "Cut-off LLM responses whose complete items were salvaged, by task.",
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+_lock = threading.Lock()
+_histograms: Dict[str, Dict[Labels, List[float]]] = {name: {} for name in HISTOGRAMS}
+_counters: Dict[str, Dict[Labels, float]] = {name: {} for name in COUNTERS}
+# Stage timings of the request being served, for its Server-Timing header. The list
+# is shared by reference, so threads started with a copy of the context add to it.
+_timings: contextvars.ContextVar = contextvars.ContextVar("server_timings", default=None)
+
+
+def _buckets() -> Tuple[float, ...]:
+    return tuple(getattr(settings, "METRICS_BUCKETS", DEFAULT_BUCKETS))
+
+
+def _labels(labels: Dict[str, object]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def observe(name: str, seconds: float, **labels) -> None:
+    """Add one observation to histogram name."""
+    buckets = _buckets()
+    key = _labels(labels)
+    with _lock:
+        series = _histograms[name].get(key)
+        if series is None:
+            # A count per bucket (the last one for values past every bound), then the sum.
+            series = _histograms[name][key] = [0.0] * (len(buckets) + 2)
+        series[bisect_left(buckets, seconds)] += 1
+        series[-1] += seconds
+
+
+def inc(name: str, amount: float = 1, **labels) -> None:
+    """Add amount to counter name."""
+    key = _labels(labels)
+    with _lock:
+        _counters[name][key] = _counters[name].get(key, 0) + amount
+
+
+def record_timing(name: str, seconds: float) -> None:
+    """Add a Server-Timing entry to the current request, if one is being timed."""
+    timings = _timings.get()
+    if timings is not None:
+        timings.append((name, seconds))
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """Time the block as stage: observed in stage_duration_seconds and reported in Server-Timing."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        observe("stage_duration_seconds", elapsed, stage=stage)
+        record_timing(stage, elapsed)
+
+
+def begin_request() -> contextvars.Token:
+    return _timings.set([])
+
+
+def end_request(token: contextvars.Token) -> List[Tuple[str, float]]:
+    """Stop collecting timings for the current request and return them."""
+    timings = _timings.get() or []
+    _timings.reset(token)
+    return list(timings)
+
+
+def server_timing_header(timings: List[Tuple[str, float]], total: float) -> str:
+    """Format timings as a Server-Timing header; repeated stages (e.g. fanned-out LLM calls) are summed."""
+    merged: Dict[str, List[float]] = {}
+    for name, seconds in timings:
+        entry = merged.setdefault(name, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+    parts = []
+    for name, (seconds, count) in merged.items():
+        part = f"{name};dur={seconds * 1000:.1f}"
+        if count > 1:
+            part += f';desc="{count} calls"'
+        parts.append(part)
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _stat_gauges() -> Dict[str, Dict[Labels, float]]:
+    """The existing stats() dicts of the LLM helpers, flattened into gauges."""
+    gauges: Dict[str, Dict[Labels, float]] = {}
+
+    def add(prefix: str, values: Dict[str, object], **labels) -> None:
+        for key, value in values.items():
+            if isinstance(value, dict):
+                for model, count in value.items():
+                    add(prefix, {key: count}, model=model, **labels)
+            elif isinstance(value, (int, float)):
+                gauges.setdefault(f"{prefix}_{key}", {})[_labels(labels)] = value
+
+    for model, values in rate_limiter.stats().items():
+        add("openrouter_rate_limit", values, model=model)
+    for model, values in latency.stats().items():
+        add("llm_latency", values, model=model)
+    add("llm_hedge", hedging.stats())
+    add("llm_cache", llm_cache.stats())
+    add("llm_singleflight", singleflight.stats())
+    return gauges
+
+
+def render() -> str:
+    """All metrics of this process in the Prometheus text exposition format."""
+    buckets = _buckets()
+    with _lock:
+        histograms = {name: {key: list(series) for key, series in values.items()}
+                      for name, values in _histograms.items()}
+        counters = {name: dict(values) for name, values in _counters.items()}
+
+    lines = []
+    for name, values in histograms.items():
+        lines += [f"# HELP {name} {HISTOGRAMS[name]}", f"# TYPE {name} histogram"]
+        for key, series in sorted(values.items()):
+            cumulative = 0.0
+            for bound, count in zip(buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                lines.append(f"{name}_bucket{_format_labels(key, ('le', le))} {_format_value(cumulative)}")
+            lines.append(f"{name}_sum{_format_labels(key)} {_format_value(series[-1])}")
+            lines.append(f"{name}_count{_format_labels(key)} {_format_value(cumulative)}")
+    for name, values in counters.items():
+        lines += [f"# HELP {name} {COUNTERS[name]}", f"# TYPE {name} counter"]
+        lines += [f"{name}{_format_labels(key)} {_format_value(value)}" for key, value in sorted(values.items())]
+    for name, values in sorted(_stat_gauges().items()):
+        lines.append(f"# TYPE {name} gauge")
+        lines += [f"{name}{_format_labels(key)} {_format_value(value)}" for key, value in sorted(values.items())]
+    return "\n".join(lines) + "\n"
+
+
+def reset() -> None:
+    with _lock:
+        for values in list(_histograms.values()) + list(_counters.values()):
+            values.clear()
@@ -0,0 +1,133 @@
+"""Async counterparts of the openrouter_service calls, for the async views.
+
+They share prompts, parsing, caching, rate limits and fallback chains with
+the sync functions, but talk to OpenRouter through an httpx.AsyncClient, so
+a waiting generation holds a socket and a coroutine instead of a thread.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+
+from . import hedging, llm_cache, metrics, rate_limiter, singleflight
+from .fanout import afan_out, fanout_enabled
+from .openrouter_client import get_async_client, model_timeout
+from .openrouter_service import (
+    EXTRACTION_MODEL, RECOMMENDATION_MODEL, SKILL_TASKS, _DEFAULT_TTL, _cache_params, _cache_ttl,
+    _extraction_prompt, _has_json_root, _message_text, _observe_request, _parse_recommendations, _parse_skill_entry,
+    _parse_skill_list, _recommendation_prompt, _retryable, _skill_cache_key, _unique_skills, llm_stage, model_chain,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def acall_openrouter(prompt: str, model: str, max_tokens: int = 1000, temperature: float = 0.7,
+                           cache_ttl: Optional[int] = _DEFAULT_TTL, task: Optional[str] = None,
+                           valid: Callable[[str], bool] = bool) -> str:
+    """call_openrouter() for coroutines: same cache, single-flight and fallback chain semantics."""
+    cache_key, cache_ttl = _cache_params(prompt, model, max_tokens, temperature, cache_ttl)
+    with metrics.timed(llm_stage(task)):
+        if cache_ttl != 0:
+            cached = await llm_cache.aget(cache_key)
+            if cached is not llm_cache.MISS:
+                return cached
+
+        chain = model_chain(task, model) if task else [model]
+
+        async def generate():
+            if len(chain) > 1:
+                text, _ = await hedging.ahedged_call(
+                    chain, lambda m: _acomplete(prompt, m, max_tokens, temperature), valid)
+            else:
+                text = await _acomplete(prompt, model, max_tokens, temperature)
+            if text:
+                await llm_cache.aset(cache_key, text, cache_ttl)
+            return text
+
+        return await singleflight.ado(cache_key, generate, cache_ttl)
+
+
+async def _acreate_completion(model: str, **kwargs):
+    """_create_completion() for coroutines, through the same rate-limit schedulers."""
+    client = get_async_client()
+    max_retries = getattr(settings, "OPENROUTER_MAX_RETRIES", 3)
+    for attempt in range(max_retries + 1):
+        await rate_limiter.aacquire(model)
+        try:
+            return await client.chat.completions.create(model=model, timeout=model_timeout(model), **kwargs)
+        except Exception as e:
+            retry_after = rate_limiter.retry_after_seconds(e) or 0
+            if (not _retryable(e) or attempt == max_retries
+                    or retry_after > getattr(settings, "OPENROUTER_QUEUE_TIMEOUT", 30)):
+                raise
+            await rate_limiter.await_before_retry(model, attempt, e)
+
+
+async def _acomplete(prompt: str, model: str, max_tokens: int, temperature: float) -> str:
+    # Not streamed: a losing hedged attempt is stopped by cancelling its task.
+    started = time.perf_counter()
+    try:
+        response = await _acreate_completion(
+            model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        _observe_request(model, started, "ok", getattr(response, "usage", None))
+        return _message_text(response)
+    except asyncio.CancelledError:
+        _observe_request(model, started, "cancelled")
+        raise
+    except Exception as e:
+        _observe_request(model, started, "error")
+        logger.warning(f"Error calling OpenRouter with model {model}: {e}")
+        return ""
+
+
+async def aextract_skills_from_resume(resume_text: str, known_skills: Optional[List[str]] = None) -> List[str]:
+    response = await acall_openrouter(_extraction_prompt(resume_text, known_skills), EXTRACTION_MODEL,
+                                      max_tokens=400, temperature=0.0, cache_ttl=_cache_ttl("extraction"),
+                                      task="extraction")
+    return _parse_skill_list(response)
+
+
+async def arecommend_skills(existing_skills: List[str], role: str) -> List[str]:
+    response = await acall_openrouter(_recommendation_prompt(existing_skills, role), RECOMMENDATION_MODEL,
+                                      max_tokens=200, temperature=0.3, cache_ttl=_cache_ttl("recommendation"),
+                                      task="recommendation")
+    return _parse_recommendations(response, existing_skills)
+
+
+async def aget_skill_entry(task: str, skill: str) -> Optional[Dict[str, Any]]:
+    """get_skill_entry() for coroutines."""
+    key = _skill_cache_key(task, skill)
+    entry = await llm_cache.aget(key)
+    if entry is llm_cache.MISS:
+        model, build_prompt, root, max_tokens, temperature = SKILL_TASKS[task]
+        response = await acall_openrouter(build_prompt([skill]), model, max_tokens=max_tokens,
+                                          temperature=temperature, cache_ttl=0, task=task,
+                                          valid=_has_json_root(root))
+        entry = _parse_skill_entry(task, skill, response)
+        if entry:
+            await llm_cache.aset(key, entry, _cache_ttl(task))
+    return entry
+
+
+async def _acollect_skill_entries(task: str, skills: List[str]) -> Dict[str, Any]:
+    skills = _unique_skills(skills)
+    results = await afan_out(lambda skill: aget_skill_entry(task, skill), skills,
+                             max_workers=None if fanout_enabled() else 1)
+    entries = [results.get(skill) for skill in skills]
+    return {entry["name"]: entry["data"] for entry in entries if entry}
+
+
+async def agenerate_skill_roadmap(skills: List[str]) -> Dict[str, Any]:
+    """generate_skill_roadmap() for coroutines."""
+    return {"roadmap": await _acollect_skill_entries("roadmap", skills)}
+
+
+async def aanalyze_market_demand(skills: List[str]) -> Dict[str, Any]:
+    """analyze_market_demand() for coroutines; skills are always analyzed (and cached) one per call."""
+    return {"skills": await _acollect_skill_entries("market", skills)}
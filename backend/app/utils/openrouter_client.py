@@ -0,0 +1,113 @@
+import asyncio
+import os
+import threading
+import weakref
+
+import httpx
+from django.conf import settings
+from openai import AsyncOpenAI, OpenAI
+
+DEFAULT_BASE_URL = "https://openrouter.ai/api/v1"
+
+_lock = threading.Lock()
+_client = None
+_client_pid = None
+# Async clients per event loop: an httpx.AsyncClient's connections belong to the loop that opened them.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = weakref.WeakKeyDictionary()
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def base_url() -> str:
+    return os.environ.get("OPENROUTER_BASE_URL") or _setting("OPENROUTER_BASE_URL", DEFAULT_BASE_URL)
+
+
+def _limits(max_connections: int) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=_setting("OPENROUTER_POOL_MAX_KEEPALIVE", 10),
+        keepalive_expiry=_setting("OPENROUTER_KEEPALIVE_EXPIRY", 60.0),
+    )
+
+
+def _build_http_client() -> httpx.Client:
+    limits = _limits(_setting("OPENROUTER_POOL_MAX_CONNECTIONS", 20))
+    return httpx.Client(limits=limits, timeout=model_timeout(None))
+
+
+def _api_key() -> str:
+    api_key = os.environ.get("OPENROUTER_API_KEY")
+    if not api_key:
+        raise RuntimeError("Set OPENROUTER_API_KEY in env to use OpenRouter calls")
+    return api_key
+
+
+def _build_client() -> OpenAI:
+    # Retries are handled by openrouter_service through the rate-limit scheduler.
+    return OpenAI(base_url=base_url(), api_key=_api_key(), http_client=_build_http_client(), max_retries=0)
+
+
+def get_client() -> OpenAI:
+    """Process-wide OpenAI client whose httpx connection pool is reused across calls.
+
+    The client is rebuilt when the process id changes, so gunicorn workers
+    forked from a master that already created one never share its sockets.
+    """
+    global _client, _client_pid
+    pid = os.getpid()
+    if _client is None or _client_pid != pid:
+        with _lock:
+            if _client is None or _client_pid != pid:
+                _client = _build_client()
+                _client_pid = pid
+    return _client
+
+
+def get_async_client() -> AsyncOpenAI:
+    """AsyncOpenAI client for the running event loop, pooling up to OPENROUTER_ASYNC_MAX_CONNECTIONS.
+
+    An idle connection costs a socket rather than a thread, so the async pool
+    can be much larger than the sync one.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        http_client = httpx.AsyncClient(limits=_limits(_setting("OPENROUTER_ASYNC_MAX_CONNECTIONS", 500)),
+                                        timeout=model_timeout(None))
+        client = _async_clients[loop] = AsyncOpenAI(base_url=base_url(), api_key=_api_key(),
+                                                    http_client=http_client, max_retries=0)
+    return client
+
+
+def reset_client() -> None:
+    """Drop the pooled clients; the next get_client()/get_async_client() builds fresh ones."""
+    global _client, _client_pid
+    with _lock:
+        client, pid = _client, _client_pid
+        _client, _client_pid = None, None
+        # Their connections can only be closed from their own loops; let them be collected.
+        _async_clients.clear()
+    # A client inherited over fork shares the parent's sockets; just forget it.
+    if client is not None and pid == os.getpid():
+        client.close()
+
+
+def _after_fork_in_child() -> None:
+    global _client, _client_pid, _lock
+    _client, _client_pid = None, None
+    _async_clients.clear()
+    _lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def model_timeout(model) -> httpx.Timeout:
+    """Connect/read timeouts for model, from settings.OPENROUTER_MODEL_TIMEOUTS or the defaults."""
+    connect = _setting("OPENROUTER_CONNECT_TIMEOUT", 5.0)
+    read = _setting("OPENROUTER_READ_TIMEOUT", 60.0)
+    read = _setting("OPENROUTER_MODEL_TIMEOUTS", {}).get(model, read)
+    return httpx.Timeout(read, connect=connect)
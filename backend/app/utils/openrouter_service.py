@@ -1,60 +1,264 @@
 import os
-import json
-from openai import OpenAI
-from typing import List, Dict, Any
+import logging
+import time
+from django.conf import settings
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
+from openai import InternalServerError, RateLimitError
+
+from . import hedging, llm_cache, metrics, rate_limiter, singleflight
+from .canonical import canonical_skill
+from .json_stream import SkillObjectStream, loads_lenient
+from .openrouter_client import get_client, model_timeout
+from .fanout import fan_out, fanout_enabled
+
+logger = logging.getLogger(__name__)
 
 def _get_openrouter_client():
-    api_key = os.environ.get("OPENROUTER_API_KEY")
-    if not api_key:
-        raise RuntimeError("Set OPENROUTER_API_KEY in env to use OpenRouter calls")
-    return OpenAI(base_url="https://openrouter.ai/api/v1", api_key=api_key)
+    return get_client()
 
 EXTRACTION_MODEL = "mistralai/mistral-7b-instruct:free"  # Fast, good for extraction
 ROADMAP_MODEL = "meta-llama/llama-3.2-3b-instruct:free"  # Better for structured content
 MARKET_MODEL = "openai/gpt-oss-20b:free" # Best for analysis and insights
 RECOMMENDATION_MODEL = "mistralai/mistral-7b-instruct:free"  # Good for recommendations
 
-def call_openrouter(prompt: str, model: str, max_tokens: int = 1000, temperature: float = 0.7) -> str:
-    """Generic function to call OpenRouter with any model."""
+# Fallback chains per task, tried (and hedged) in order after the task's own model.
+MODEL_CHAINS = {
+    "extraction": [EXTRACTION_MODEL, ROADMAP_MODEL],
+    "recommendation": [RECOMMENDATION_MODEL, ROADMAP_MODEL],
+    "roadmap": [ROADMAP_MODEL, EXTRACTION_MODEL],
+    "market": [MARKET_MODEL, ROADMAP_MODEL],
+}
+
+# How long (seconds) each task's responses stay cached; None keeps them until evicted.
+# Override per task with settings.LLM_CACHE_TTLS.
+CACHE_TTLS = {
+    "extraction": None,
+    "recommendation": 60 * 60 * 24,
+    "roadmap": 60 * 60 * 24 * 7,
+    "market": 60 * 60 * 6,
+}
+
+_DEFAULT_TTL = object()
+
+def _cache_ttl(task: str) -> Optional[int]:
+    ttls = {**CACHE_TTLS, **getattr(settings, "LLM_CACHE_TTLS", {})}
+    return ttls.get(task)
+
+def model_chain(task: Optional[str], model: str) -> List[str]:
+    """model followed by the task's fallback models (settings.LLM_MODEL_CHAINS overrides MODEL_CHAINS)."""
+    chain = getattr(settings, "LLM_MODEL_CHAINS", {}).get(task) or MODEL_CHAINS.get(task) or []
+    return [model] + [m for m in chain if m != model]
+
+def _cache_params(prompt: str, model: str, max_tokens: int, temperature: float, cache_ttl) -> Tuple[str, Optional[int]]:
+    """(cache key, ttl) for a completion request; see call_openrouter for the TTL rules."""
+    if cache_ttl is _DEFAULT_TTL:
+        cache_ttl = None if temperature == 0 else getattr(settings, "LLM_CACHE_DEFAULT_TTL", 60 * 60)
+    return llm_cache.make_key(model, prompt, max_tokens=max_tokens, temperature=temperature), cache_ttl
+
+def call_openrouter(prompt: str, model: str, max_tokens: int = 1000, temperature: float = 0.7,
+                    cache_ttl: Optional[int] = _DEFAULT_TTL, task: Optional[str] = None,
+                    valid: Callable[[str], bool] = bool) -> str:
+    """Generic function to call OpenRouter with any model.
+
+    Responses are cached by (model, prompt, max_tokens, temperature). Deterministic
+    (temperature 0) calls are kept indefinitely unless cache_ttl says otherwise;
+    cache_ttl=0 bypasses the cache.
+
+    With a task, the call runs along the task's fallback chain: a model that
+    fails or returns text valid() rejects is followed by the next one, and a
+    slow one is hedged past its p95 latency (see hedging.hedged_call).
+    The whole call is timed as the llm_<task> stage (see metrics.timed).
+    """
+    cache_key, cache_ttl = _cache_params(prompt, model, max_tokens, temperature, cache_ttl)
+    with metrics.timed(llm_stage(task)):
+        if cache_ttl != 0:
+            cached = llm_cache.get(cache_key)
+            if cached is not llm_cache.MISS:
+                return cached
+
+        chain = model_chain(task, model) if task else [model]
+
+        def generate():
+            if len(chain) > 1:
+                text, _ = hedging.hedged_call(
+                    chain, lambda m, attempt: _complete_stream(prompt, m, max_tokens, temperature, attempt), valid)
+            else:
+                text = _complete(prompt, model, max_tokens, temperature)
+            if text:
+                llm_cache.set(cache_key, text, cache_ttl)
+            return text
+
+        # Identical requests already in flight (here or in another worker) share one generation.
+        return singleflight.do(cache_key, generate, cache_ttl)
+
+def llm_stage(task: Optional[str]) -> str:
+    return f"llm_{task}" if task else "llm"
+
+def _observe_request(model: str, started: float, outcome: str, usage=None) -> None:
+    """Record one upstream request (queueing and retries included) and the tokens it reported."""
+    metrics.observe("openrouter_request_duration_seconds", time.perf_counter() - started,
+                    model=model, outcome=outcome)
+    if usage is None:
+        return
+    for kind in ("prompt", "completion"):
+        key = f"{kind}_tokens"
+        count = usage.get(key) if isinstance(usage, dict) else getattr(usage, key, None)
+        if count:
+            metrics.inc("openrouter_tokens_total", count, model=model, type=kind)
+
+def _parse_failed(task: str, response: str) -> None:
+    # An empty response is a failed call, not a parse failure.
+    if response:
+        metrics.inc("llm_parse_failures_total", task=task)
+
+def _salvaged(task: str, count: int) -> None:
+    metrics.inc("llm_partial_responses_total", task=task)
+    logger.info(f"Salvaged {count} items from a cut-off {task} response")
+
+def _retryable(error: Exception) -> bool:
+    return isinstance(error, (RateLimitError, InternalServerError))
+
+def _create_completion(model: str, **kwargs):
+    """Create a chat completion through the model's rate-limit scheduler.
+
+    429s and 5xx responses are retried up to OPENROUTER_MAX_RETRIES times with
+    Retry-After-aware exponential backoff; a Retry-After longer than
+    OPENROUTER_QUEUE_TIMEOUT gives up right away.
+    """
     client = _get_openrouter_client()
+    max_retries = getattr(settings, "OPENROUTER_MAX_RETRIES", 3)
+    for attempt in range(max_retries + 1):
+        rate_limiter.acquire(model)
+        try:
+            return client.chat.completions.create(model=model, timeout=model_timeout(model), **kwargs)
+        except Exception as e:
+            retry_after = rate_limiter.retry_after_seconds(e) or 0
+            if (not _retryable(e) or attempt == max_retries
+                    or retry_after > getattr(settings, "OPENROUTER_QUEUE_TIMEOUT", 30)):
+                raise
+            rate_limiter.wait_before_retry(model, attempt, e)
+
+def _message_text(response) -> str:
+    text = response.choices[0].message.content or ""
+    if isinstance(text, bytes):
+        text = text.decode("utf-8", errors="ignore")
+    return text.strip()
+
+def _complete(prompt: str, model: str, max_tokens: int, temperature: float) -> str:
+    started = time.perf_counter()
+    try:
+        response = _create_completion(
+            model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        _observe_request(model, started, "ok", getattr(response, "usage", None))
+        return _message_text(response)
+    except Exception as e:
+        _observe_request(model, started, "error")
+        logger.warning(f"Error calling OpenRouter with model {model}: {e}")
+        return ""
+
+def _complete_stream(prompt: str, model: str, max_tokens: int, temperature: float,
+                     attempt: hedging.Attempt) -> str:
+    """Like _complete, but streamed so a hedged attempt can be cancelled mid-generation."""
+    started = time.perf_counter()
+    usage = None
     try:
-        response = client.chat.completions.create(
-            model=model,
+        stream = _create_completion(
+            model,
             messages=[{"role": "user", "content": prompt}],
             max_tokens=max_tokens,
             temperature=temperature,
+            stream=True,
         )
-        text = response.choices[0].message.content
-        if isinstance(text, bytes):
-            text = text.decode("utf-8", errors="ignore")
-        return text.strip()
+        attempt.on_cancel(stream.response.close)
+        parts = []
+        for chunk in stream:
+            if attempt.cancelled.is_set():
+                _observe_request(model, started, "cancelled", usage)
+                return ""
+            # OpenRouter reports usage on the final chunk.
+            usage = getattr(chunk, "usage", None) or usage
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        _observe_request(model, started, "ok", usage)
+        return "".join(parts).strip()
     except Exception as e:
-        print(f"Error calling OpenRouter with model {model}: {str(e)}")
+        if attempt.cancelled.is_set():
+            _observe_request(model, started, "cancelled", usage)
+        else:
+            _observe_request(model, started, "error", usage)
+            logger.warning(f"Error calling OpenRouter with model {model}: {e}")
         return ""
 
-def extract_skills_from_resume(resume_text: str) -> List[str]:
-    """Extract skills from resume using Mistral 7B."""
-    prompt = (
+def stream_openrouter(prompt: str, model: str, max_tokens: int = 1000, temperature: float = 0.7) -> Iterator[str]:
+    """Yield the completion text for prompt piece by piece as OpenRouter streams it."""
+    started = time.perf_counter()
+    usage = None
+    try:
+        stream = _create_completion(
+            model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+        )
+        for chunk in stream:
+            usage = getattr(chunk, "usage", None) or usage
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+        _observe_request(model, started, "ok", usage)
+    except Exception as e:
+        _observe_request(model, started, "error", usage)
+        logger.warning(f"Error streaming from OpenRouter with model {model}: {e}")
+
+def _extraction_prompt(resume_text: str, known_skills: Optional[List[str]]) -> str:
+    known = ""
+    if known_skills:
+        known = (
+            f"These skills were already identified, do NOT repeat them: {', '.join(known_skills)}\n"
+            "Return only skills that are missing from that list (an empty array if there are none).\n"
+        )
+    return (
         "You are an expert recruiter. Extract only the candidate's relevant technical and professional skills "
         "from the following resume text. Return ONLY a JSON array of skill names (no explanation, no extra text).\n"
-        "Example format: [\"Python\", \"SQL\", \"Project Management\"]\n\n"
+        "Example format: [\"Python\", \"SQL\", \"Project Management\"]\n"
+        f"{known}\n"
         f"Resume:\n{resume_text}\n\nSkills (JSON array only):"
     )
-    
-    response = call_openrouter(prompt, EXTRACTION_MODEL, max_tokens=400, temperature=0.0)
-    
-    try:
-        skills = json.loads(response)
-        if isinstance(skills, list):
-            return [s.strip() for s in skills if isinstance(s, str) and s.strip()]
-    except:
+
+def _parse_list(task: str, response: str) -> Optional[List[str]]:
+    """The strings of the JSON array in response (whole ones only, if it was cut off), or None."""
+    items, complete = loads_lenient(response, list)
+    if not isinstance(items, list):
+        _parse_failed(task, response)
+        return None
+    items = [s.strip() for s in items if isinstance(s, str) and s.strip()]
+    if not complete:
+        _salvaged(task, len(items))
+    return items
+
+def _parse_skill_list(response: str) -> List[str]:
+    skills = _parse_list("extraction", response)
+    if skills is None and "[" not in response:
+        # No array at all: the model answered with a plain comma-separated list.
         return [s.strip() for s in response.split(",") if s.strip()]
-    
-    return []
+    return skills or []
 
-def recommend_skills(existing_skills: List[str], role: str) -> List[str]:
-    """Recommend additional skills using Mistral 7B."""
-    prompt = (
+def extract_skills_from_resume(resume_text: str, known_skills: Optional[List[str]] = None) -> List[str]:
+    """Extract skills from resume using Mistral 7B.
+
+    known_skills (already found locally) are listed in the prompt so the
+    model only returns the remaining ones.
+    """
+    response = call_openrouter(_extraction_prompt(resume_text, known_skills), EXTRACTION_MODEL, max_tokens=400,
+                               temperature=0.0, cache_ttl=_cache_ttl("extraction"), task="extraction")
+    return _parse_skill_list(response)
+
+def _recommendation_prompt(existing_skills: List[str], role: str) -> str:
+    return (
         "You are an expert career advisor. Given a candidate's existing skills and target role, "
         "recommend only upto 5 additional high-impact skills that will significantly increase their hireability.\n\n"
         "Rules:\n"
@@ -63,26 +267,58 @@ def recommend_skills(existing_skills: List[str], role: str) -> List[str]:
         "- Consider the seniority level in the role\n"
         "- Prioritize tools, frameworks, and technologies\n"
         "- Return ONLY a JSON array of skill names\n\n"
-        f"Existing skills: {', '.join(existing_skills)}\n"
+        f"Existing skills: {', '.join(sorted(existing_skills, key=str.lower))}\n"
         f"Target role: {role}\n\n"
         "Recommended skills (JSON array only):"
     )
-    
-    response = call_openrouter(prompt, RECOMMENDATION_MODEL, max_tokens=200, temperature=0.3)
-    
-    try:
-        recs = json.loads(response)
-        if isinstance(recs, list):
-            existing_lower = {s.lower() for s in existing_skills}
-            return [r.strip() for r in recs if isinstance(r, str) and r.strip().lower() not in existing_lower]
-    except:
-        return []
-    
-    return []
-
-def generate_skill_roadmap(skills: List[str]) -> Dict[str, Any]:
-    """Generate learning roadmap using Llama 3.2."""
-    prompt = f"""Create a detailed learning roadmap for these skills: {', '.join(skills)}
+
+def _parse_recommendations(response: str, existing_skills: List[str]) -> List[str]:
+    existing_lower = {s.lower() for s in existing_skills}
+    return [r for r in _parse_list("recommendation", response) or [] if r.lower() not in existing_lower]
+
+def recommend_skills(existing_skills: List[str], role: str) -> List[str]:
+    """Recommend additional skills using Mistral 7B."""
+    response = call_openrouter(_recommendation_prompt(existing_skills, role), RECOMMENDATION_MODEL, max_tokens=200,
+                               temperature=0.3, cache_ttl=_cache_ttl("recommendation"), task="recommendation")
+    return _parse_recommendations(response, existing_skills)
+
+def _skill_members(response: str, root: str) -> Tuple[Dict[str, Any], bool]:
+    """({skill: data} under root, complete) from a {"<root>": {...}} response.
+
+    A response cut off mid-way still yields every skill object that was
+    finished; see json_stream.loads_lenient.
+    """
+    data, complete = loads_lenient(response, dict, max_depth=2)
+    members = data.get(root) if isinstance(data, dict) else None
+    return (members if isinstance(members, dict) else {}), complete
+
+def _has_json_root(root: str) -> Callable[[str], bool]:
+    """Validator for hedged calls: the response holds at least one whole skill object under root.
+
+    Cut-off responses with some complete skills pass, so they are served
+    (and cached) instead of being generated again by a fallback model.
+    """
+    def valid(response: str) -> bool:
+        return bool(_skill_members(response, root)[0])
+    return valid
+
+def _normalize_skill(skill: str) -> str:
+    return " ".join(str(skill).split()).lower()
+
+def _unique_skills(skills: List[str]) -> List[str]:
+    seen = []
+    for skill in skills:
+        key = _normalize_skill(skill)
+        if key and key not in seen:
+            seen.append(key)
+    return seen
+
+# Per-skill generations are small enough to fit comfortably in these budgets.
+ROADMAP_MAX_TOKENS_PER_SKILL = 1200
+MARKET_MAX_TOKENS_PER_SKILL = 700
+
+def _roadmap_prompt(skills: List[str]) -> str:
+    return f"""Create a detailed learning roadmap for these skills: {', '.join(skills)}
 
 For EACH skill, provide:
 1. Three levels: Beginner, Intermediate, Advanced
@@ -128,27 +364,8 @@ Return ONLY valid JSON in this EXACT format:
 
 IMPORTANT: Return ONLY the JSON object, no markdown, no explanations."""
 
-    response = call_openrouter(prompt, ROADMAP_MODEL, max_tokens=2500, temperature=0.7)
-    
-    try:
-        cleaned = response.strip()
-        if cleaned.startswith("```json"):
-            cleaned = cleaned[7:]
-        if cleaned.startswith("```"):
-            cleaned = cleaned[3:]
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3]
-        cleaned = cleaned.strip()
-        
-        return json.loads(cleaned)
-    except Exception as e:
-        print(f"Failed to parse roadmap JSON: {e}")
-        print(f"Response was: {response[:500]}")
-        return {"roadmap": {}}
-
-def analyze_market_demand(skills: List[str]) -> Dict[str, Any]:
-    """Analyze market demand using Gemma 2."""
-    prompt = f"""Analyze the current job market for these skills: {', '.join(skills)}
+def _market_prompt(skills: List[str]) -> str:
+    return f"""Analyze the current job market for these skills: {', '.join(skills)}
 
 For EACH skill, provide:
 1. Market demand score (1-10 scale)
@@ -174,20 +391,136 @@ Return ONLY valid JSON in this EXACT format:
 
 IMPORTANT: Return ONLY the JSON object, no markdown, no explanations."""
 
-    response = call_openrouter(prompt, MARKET_MODEL, max_tokens=2000, temperature=0.5)
-    
-    try:
-        cleaned = response.strip()
-        if cleaned.startswith("```json"):
-            cleaned = cleaned[7:]
-        if cleaned.startswith("```"):
-            cleaned = cleaned[3:]
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3]
-        cleaned = cleaned.strip()
-        
-        return json.loads(cleaned)
-    except Exception as e:
-        print(f"Failed to parse market analysis JSON: {e}")
-        print(f"Response was: {response[:500]}")
-        return {"skills": {}}
\ No newline at end of file
+# task -> (model, prompt builder, top-level JSON key, max_tokens per skill, temperature)
+SKILL_TASKS = {
+    "roadmap": (ROADMAP_MODEL, _roadmap_prompt, "roadmap", ROADMAP_MAX_TOKENS_PER_SKILL, 0.7),
+    "market": (MARKET_MODEL, _market_prompt, "skills", MARKET_MAX_TOKENS_PER_SKILL, 0.5),
+}
+
+def _skill_cache_key(task: str, skill: str) -> str:
+    model, build_prompt, _, _, _ = SKILL_TASKS[task]
+    return llm_cache.make_key(model, build_prompt([skill]), kind=f"skill_{task}")
+
+def _generate_skill_entry(task: str, skill: str) -> Optional[Dict[str, Any]]:
+    """Generate one normalized skill's section for task as {"name": ..., "data": ...}."""
+    model, build_prompt, root, max_tokens, temperature = SKILL_TASKS[task]
+    response = call_openrouter(build_prompt([skill]), model, max_tokens=max_tokens,
+                               temperature=temperature, cache_ttl=0, task=task, valid=_has_json_root(root))
+    return _parse_skill_entry(task, skill, response)
+
+def _parse_skill_entry(task: str, skill: str, response: str) -> Optional[Dict[str, Any]]:
+    entries, complete = _skill_members(response, SKILL_TASKS[task][2])
+    if not entries:
+        _parse_failed(task, response)
+        if response:
+            logger.warning(f"Failed to parse {task} JSON for {skill}; response was: {response[:500]}")
+        return None
+    if not complete:
+        _salvaged(task, len(entries))
+    name, data = next(iter(entries.items()))
+    return {"name": name, "data": data}
+
+def get_skill_entry(task: str, skill: str) -> Optional[Dict[str, Any]]:
+    """Return the cached section for a normalized skill, generating it on a miss."""
+    key = _skill_cache_key(task, skill)
+    entry = llm_cache.get(key)
+    if entry is llm_cache.MISS:
+        entry = _generate_skill_entry(task, skill)
+        if entry:
+            llm_cache.set(key, entry, _cache_ttl(task))
+    return entry
+
+def _skill_keys(skill: str) -> set:
+    return {_normalize_skill(skill), _normalize_skill(canonical_skill(skill))}
+
+def _match_skill(name: str, skills: List[str]) -> Optional[str]:
+    """The requested skill a generated object named name answers, or None."""
+    keys = _skill_keys(name)
+    return next((skill for skill in skills if keys & _skill_keys(skill)), None)
+
+def stream_skill_entries(task: str, skills: List[str]) -> Iterator[Dict[str, Any]]:
+    """Yield {"name": ..., "data": ...} per skill as soon as each one is available.
+
+    Cached skills come first. The rest share one streamed generation whose
+    skill objects are parsed and yielded (and cached) the moment they close;
+    any skill the stream did not deliver is generated on its own at the end.
+    A streamed object is only kept when its name is one of the requested
+    skills (after canonicalization), so one skill's data is never cached
+    under another's key.
+    """
+    missing = []
+    for skill in _unique_skills(skills):
+        entry = llm_cache.get(_skill_cache_key(task, skill))
+        if entry is llm_cache.MISS or not entry:
+            missing.append(skill)
+        else:
+            yield entry
+    if not missing:
+        return
+
+    model, build_prompt, _, max_tokens, temperature = SKILL_TASKS[task]
+    parser = SkillObjectStream()
+    for text in stream_openrouter(build_prompt(missing), model, max_tokens=max_tokens * len(missing),
+                                  temperature=temperature):
+        for name, data in parser.feed(text):
+            if not missing or not name or not isinstance(data, dict):
+                continue
+            skill = _match_skill(name, missing)
+            if skill is None:
+                logger.info(f"Ignoring streamed {task} object for unrequested skill {name!r}")
+                continue
+            missing.remove(skill)
+            entry = {"name": name, "data": data}
+            llm_cache.set(_skill_cache_key(task, skill), entry, _cache_ttl(task))
+            yield entry
+
+    for skill in missing:
+        entry = get_skill_entry(task, skill)
+        if entry:
+            yield entry
+
+def _collect_skill_entries(task: str, skills: List[str], parallel: Optional[bool] = None) -> Dict[str, Any]:
+    """Assemble per-skill sections for task, fanning out one call per skill when parallel."""
+    skills = _unique_skills(skills)
+    if parallel is None:
+        parallel = fanout_enabled()
+    if parallel and len(skills) > 1:
+        results = fan_out(lambda skill: get_skill_entry(task, skill), skills)
+        entries = [results.get(skill) for skill in skills]
+    else:
+        entries = [get_skill_entry(task, skill) for skill in skills]
+    return {entry["name"]: entry["data"] for entry in entries if entry}
+
+def generate_skill_roadmap(skills: List[str], parallel: Optional[bool] = None) -> Dict[str, Any]:
+    """Generate learning roadmap using Llama 3.2.
+
+    Roadmaps are generated and cached per normalized skill, so only skills
+    not seen before reach the LLM and each generation has its own token budget.
+    """
+    return {"roadmap": _collect_skill_entries("roadmap", skills, parallel)}
+
+def analyze_market_demand(skills: List[str], parallel: Optional[bool] = None) -> Dict[str, Any]:
+    """Analyze market demand using Gemma 2.
+
+    In fan-out mode (the default, see settings.LLM_FANOUT_ENABLED) each skill is
+    analyzed and cached by its own concurrent call; otherwise all skills share
+    one generation.
+    """
+    if parallel is None:
+        parallel = fanout_enabled()
+    if parallel:
+        return {"skills": _collect_skill_entries("market", skills, parallel=True)}
+
+    response = call_openrouter(_market_prompt(skills), MARKET_MODEL, max_tokens=2000, temperature=0.5,
+                               cache_ttl=_cache_ttl("market"), task="market", valid=_has_json_root("skills"))
+    return _parse_market_analysis(response)
+
+def _parse_market_analysis(response: str) -> Dict[str, Any]:
+    skills, complete = _skill_members(response, "skills")
+    if not skills:
+        _parse_failed("market", response)
+        if response:
+            logger.warning(f"Failed to parse market analysis JSON; response was: {response[:500]}")
+    elif not complete:
+        _salvaged("market", len(skills))
+    return {"skills": skills}
@@ -0,0 +1,205 @@
+import datetime
+import logging
+import os
+import threading
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from ..models import EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_sender = None
+_sender_pid = None
+_wake = threading.Event()
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def enqueue_email(subject: str, body: str, to: List[str], html_body: Optional[str] = None,
+                  from_email: Optional[str] = None) -> EmailOutbox:
+    """Store an email for sending and return at once; the background sender picks it up.
+
+    With EMAIL_OUTBOX_SEND_IN_BACKGROUND off, rows wait for manage.py send_outbox
+    (run it with --loop as a dedicated sender).
+    """
+    email = EmailOutbox.objects.create(
+        subject=subject,
+        body=body,
+        html_body=html_body,
+        from_email=from_email or settings.EMAIL_HOST_USER,
+        to=list(to),
+        next_attempt_at=timezone.now(),
+    )
+    if _setting("EMAIL_OUTBOX_SEND_IN_BACKGROUND", True):
+        transaction.on_commit(wake_sender)
+    return email
+
+
+def _claim(limit: int) -> List[EmailOutbox]:
+    """Take up to limit due rows for this sender.
+
+    A row is claimed by moving its next_attempt_at past the lease, only if
+    no other sender moved it first; a sender that dies mid-batch therefore
+    leaves its rows to be picked up again once the lease runs out.
+    """
+    now = timezone.now()
+    lease_until = now + datetime.timedelta(seconds=_setting("EMAIL_OUTBOX_LEASE_SECONDS", 300))
+    due = (
+        EmailOutbox.objects
+        .filter(status=EmailOutbox.PENDING, next_attempt_at__lte=now)
+        .order_by("next_attempt_at", "id")
+        .values_list("id", "next_attempt_at")[:limit]
+    )
+    claimed = [
+        pk for pk, next_attempt_at in due
+        if EmailOutbox.objects.filter(pk=pk, status=EmailOutbox.PENDING, next_attempt_at=next_attempt_at)
+        .update(next_attempt_at=lease_until)
+    ]
+    return list(EmailOutbox.objects.filter(pk__in=claimed).order_by("id"))
+
+
+def _message(email: EmailOutbox, mail_connection) -> EmailMultiAlternatives:
+    message = EmailMultiAlternatives(
+        subject=email.subject,
+        body=email.body,
+        from_email=email.from_email,
+        to=email.to,
+        connection=mail_connection,
+    )
+    if email.html_body:
+        message.attach_alternative(email.html_body, "text/html")
+    return message
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds before retrying an email that has failed attempts times."""
+    base = _setting("EMAIL_OUTBOX_RETRY_BASE", 60)
+    return min(_setting("EMAIL_OUTBOX_RETRY_MAX", 3600), base * (2 ** (attempts - 1)))
+
+
+def _record_failure(email: EmailOutbox, error: Exception) -> bool:
+    """Schedule a retry, or give up after EMAIL_OUTBOX_MAX_ATTEMPTS; returns True if it will be retried."""
+    attempts = email.attempts + 1
+    retry = attempts < _setting("EMAIL_OUTBOX_MAX_ATTEMPTS", 5)
+    fields = {"attempts": attempts, "last_error": str(error)[:2000]}
+    if retry:
+        fields["next_attempt_at"] = timezone.now() + datetime.timedelta(seconds=retry_delay(attempts))
+    else:
+        fields["status"] = EmailOutbox.FAILED
+    EmailOutbox.objects.filter(pk=email.pk).update(**fields)
+    logger.warning(f"Email {email.pk} to {', '.join(email.to)} failed (attempt {attempts}): {error}"
+                   + ("" if retry else "; giving up"))
+    return retry
+
+
+def send_pending(limit: Optional[int] = None) -> Dict[str, int]:
+    """Send one batch of due emails over a single mail connection.
+
+    Messages go out one send_messages() call at a time on the open
+    connection, so a bad recipient fails only its own row. If the server
+    drops the connection, it is reopened for the rest of the batch.
+    """
+    limit = limit or _setting("EMAIL_OUTBOX_BATCH_SIZE", 50)
+    emails = _claim(limit)
+    result = {"claimed": len(emails), "sent": 0, "retrying": 0, "failed": 0}
+    if not emails:
+        return result
+
+    mail_connection = get_connection(fail_silently=False)
+    try:
+        mail_connection.open()
+    except Exception as e:
+        for email in emails:
+            result["retrying" if _record_failure(email, e) else "failed"] += 1
+        return result
+    try:
+        for email in emails:
+            try:
+                if not mail_connection.send_messages([_message(email, mail_connection)]):
+                    raise RuntimeError("The mail backend did not send the message")
+            except Exception as e:
+                result["retrying" if _record_failure(email, e) else "failed"] += 1
+                try:
+                    mail_connection.close()
+                    mail_connection.open()
+                except Exception:
+                    pass
+                continue
+            # Recorded at once, so a crash later in the batch cannot send it twice.
+            EmailOutbox.objects.filter(pk=email.pk).update(
+                status=EmailOutbox.SENT, sent_at=timezone.now(), last_error=None
+            )
+            result["sent"] += 1
+    finally:
+        try:
+            mail_connection.close()
+        except Exception:
+            pass
+    return result
+
+
+def drain(limit: Optional[int] = None) -> Dict[str, int]:
+    """Send batches until no due email is left; returns the summed counts."""
+    limit = limit or _setting("EMAIL_OUTBOX_BATCH_SIZE", 50)
+    totals = {"claimed": 0, "sent": 0, "retrying": 0, "failed": 0}
+    while True:
+        result = send_pending(limit)
+        for key, value in result.items():
+            totals[key] += value
+        if result["claimed"] < limit:
+            return totals
+
+
+def seconds_until_due() -> Optional[float]:
+    """Seconds until the next pending email is due (0 if one is due now), or None if none is pending."""
+    next_at = EmailOutbox.objects.filter(status=EmailOutbox.PENDING).aggregate(at=Min("next_attempt_at"))["at"]
+    if next_at is None:
+        return None
+    return max(0.0, (next_at - timezone.now()).total_seconds())
+
+
+def _run_sender(wake: threading.Event) -> None:
+    poll = _setting("EMAIL_OUTBOX_POLL_SECONDS", 60)
+    timeout = 0
+    while True:
+        wake.wait(timeout)
+        wake.clear()
+        close_old_connections()
+        try:
+            drain()
+            until_due = seconds_until_due()
+            # Sleep until the next retry is due (rows enqueued here wake us sooner).
+            timeout = poll if until_due is None else min(poll, max(until_due, 1.0))
+        except Exception:
+            logger.exception("Email outbox sender failed")
+            timeout = poll
+        finally:
+            connection.close()
+
+
+def start_sender(**kwargs) -> None:
+    """request_started receiver: start the sender once per process, so rows left by an earlier run are sent."""
+    if _sender_pid != os.getpid() and _setting("EMAIL_OUTBOX_SEND_IN_BACKGROUND", True):
+        wake_sender()
+
+
+def wake_sender() -> None:
+    """Start this process's sender thread if needed and have it send what is due now."""
+    global _sender, _sender_pid, _wake
+    with _lock:
+        if _sender is None or _sender_pid != os.getpid() or not _sender.is_alive():
+            # Rebuilt after fork so each gunicorn worker owns its thread.
+            _wake = threading.Event()
+            _sender = threading.Thread(target=_run_sender, args=(_wake,), name="email-outbox", daemon=True)
+            _sender_pid = os.getpid()
+            _sender.start()
+        _wake.set()
@@ -0,0 +1,44 @@
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher, make_password
+
+from ..models import User
+
+# Salt every password used to be hashed with; such hashes are rehashed on login.
+LEGACY_SALT = "8b4f6b2cc1868d75ef79e5cfb8779c11b6a374bf0fce05b485581bf4e1e25b96c8c2855015de8449"
+
+
+def hash_password(raw_password: str) -> str:
+    """Hash with the preferred hasher in settings.PASSWORD_HASHERS and a random salt."""
+    return make_password(raw_password)
+
+
+def _uses_legacy_salt(encoded: str) -> bool:
+    try:
+        return identify_hasher(encoded).decode(encoded).get("salt") == LEGACY_SALT
+    except Exception:
+        return False
+
+
+def needs_rehash(encoded: str) -> bool:
+    """True when encoded is not in the preferred hasher's current format (or uses the shared salt)."""
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return True
+    return (hasher.algorithm != get_hasher().algorithm or hasher.must_update(encoded)
+            or _uses_legacy_salt(encoded))
+
+
+def verify_password(user: User, raw_password: str) -> bool:
+    """Check raw_password against the user's hash, upgrading the stored hash when it is outdated."""
+    if not check_password(raw_password, user.password):
+        return False
+    if needs_rehash(user.password):
+        user.password = hash_password(raw_password)
+        User.objects.filter(pk=user.pk).update(password=user.password)
+    return True
+
+
+def burn_hash(raw_password: str) -> None:
+    """Spend the same hashing time as a real check, so unknown emails are not faster to reject."""
+    make_password(raw_password)
+
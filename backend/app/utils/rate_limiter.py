@@ -0,0 +1,290 @@
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Priority classes: lower values are served first when a model's bucket is empty.
+INTERACTIVE = 0
+BULK = 1
+BACKGROUND = 2
+PRIORITY_NAMES = {INTERACTIVE: "interactive", BULK: "bulk", BACKGROUND: "background"}
+
+_priority: contextvars.ContextVar = contextvars.ContextVar("llm_priority", default=INTERACTIVE)
+
+
+class QueueTimeout(Exception):
+    """A call waited longer than OPENROUTER_QUEUE_TIMEOUT for its model's rate limit."""
+
+
+@contextlib.contextmanager
+def priority(level: int) -> Iterator[None]:
+    """Run the enclosed LLM calls (and fan-outs started inside) at the given priority class."""
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> int:
+    return _priority.get()
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def model_limits(model: str) -> Optional[Dict[str, float]]:
+    """{"rpm", "burst"} for model, or None when it is not rate limited.
+
+    settings.OPENROUTER_RATE_LIMITS overrides per model; otherwise free-tier
+    models (":free" suffix) get OPENROUTER_FREE_RPM and others are unlimited.
+    The bucket is local to this process, so the configured limits are divided
+    by OPENROUTER_RATE_LIMIT_PROCESSES to keep their sum within the quota.
+    """
+    if not _setting("OPENROUTER_RATE_LIMIT_ENABLED", True):
+        return None
+    limits = _setting("OPENROUTER_RATE_LIMITS", {}).get(model)
+    if limits is None:
+        if not model.endswith(":free"):
+            return None
+        limits = {"rpm": _setting("OPENROUTER_FREE_RPM", 20)}
+    rpm = limits.get("rpm") or 0
+    if rpm <= 0:
+        return None
+    processes = max(1, _setting("OPENROUTER_RATE_LIMIT_PROCESSES", 1))
+    burst = limits.get("burst") or rpm
+    return {"rpm": rpm / processes, "burst": max(1.0, burst / processes)}
+
+
+class ModelScheduler:
+    """Token bucket for one model, with a priority queue of waiting calls.
+
+    The bucket refills at rpm/60 tokens per second up to burst. A call takes
+    one token; when none is left, callers queue ordered by (priority, arrival)
+    and are woken as tokens come back. A 429 pauses the whole model until its
+    Retry-After has passed.
+    """
+
+    def __init__(self, model: str, rpm: float, burst: float):
+        self.model = model
+        self.rate = rpm / 60.0
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._seq = itertools.count()
+        self.stats = {"acquired": 0, "queued": 0, "max_queue_depth": 0, "wait_ms": 0.0,
+                      "throttled": 0, "retries": 0, "timeouts": 0}
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _enqueue(self, level: int, now: float) -> Tuple[int, int]:
+        self._refill(now)
+        ticket = (level, next(self._seq))
+        heapq.heappush(self._waiting, ticket)
+        depth = len(self._waiting)
+        if depth > 1 or self.tokens < 1:
+            self.stats["queued"] += 1
+        self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], depth)
+        return ticket
+
+    def _try_take(self, ticket: Tuple[int, int], started: float, now: float) -> Optional[float]:
+        """Take a token if ticket is first in line: None when taken, else seconds worth waiting."""
+        self._refill(now)
+        if self._waiting[0] == ticket and self.tokens >= 1 and now >= self.paused_until:
+            heapq.heappop(self._waiting)
+            self.tokens -= 1
+            waited = now - started
+            self.stats["acquired"] += 1
+            self.stats["wait_ms"] += waited * 1000
+            if waited > 1:
+                level = ticket[0]
+                logger.info(f"{self.model}: waited {waited:.1f}s for a rate-limit slot "
+                            f"({PRIORITY_NAMES.get(level, level)}, {len(self._waiting)} still queued)")
+            return None
+        until_token = (1 - self.tokens) / self.rate if self.tokens < 1 else 0
+        return max(until_token, self.paused_until - now, 0.01)
+
+    def _abandon(self, ticket: Tuple[int, int], timed_out: bool) -> None:
+        if ticket in self._waiting:
+            self._waiting.remove(ticket)
+            heapq.heapify(self._waiting)
+        if timed_out:
+            self.stats["timeouts"] += 1
+
+    def acquire(self, level: int, timeout: float) -> float:
+        """Block until this call may go out; returns the seconds spent waiting."""
+        started = time.monotonic()
+        deadline = started + timeout
+        with self._cond:
+            ticket = self._enqueue(level, started)
+            try:
+                while True:
+                    now = time.monotonic()
+                    wake = self._try_take(ticket, started, now)
+                    if wake is None:
+                        return now - started
+                    if now >= deadline:
+                        self._abandon(ticket, timed_out=True)
+                        raise QueueTimeout(f"{self.model}: no rate-limit slot within {timeout}s")
+                    self._cond.wait(min(wake, deadline - now))
+            finally:
+                self._cond.notify_all()
+
+    async def aacquire(self, level: int, timeout: float) -> float:
+        """acquire() for coroutines: waits with asyncio.sleep in the same queue as threaded callers."""
+        started = time.monotonic()
+        deadline = started + timeout
+        with self._cond:
+            ticket = self._enqueue(level, started)
+        try:
+            while True:
+                with self._cond:
+                    now = time.monotonic()
+                    wake = self._try_take(ticket, started, now)
+                    if wake is None:
+                        self._cond.notify_all()
+                        return now - started
+                    if now >= deadline:
+                        self._abandon(ticket, timed_out=True)
+                        self._cond.notify_all()
+                        raise QueueTimeout(f"{self.model}: no rate-limit slot within {timeout}s")
+                # The condition cannot wake a coroutine, so poll at least every 250 ms.
+                await asyncio.sleep(min(wake, 0.25, deadline - now))
+        except asyncio.CancelledError:
+            with self._cond:
+                self._abandon(ticket, timed_out=False)
+                self._cond.notify_all()
+            raise
+
+    def pause(self, seconds: float) -> None:
+        """Hold every call for this model for seconds (after a 429)."""
+        with self._cond:
+            self.stats["throttled"] += 1
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = min(self.tokens, 0)
+            self._cond.notify_all()
+
+    def count_retry(self) -> None:
+        with self._cond:
+            self.stats["retries"] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                **self.stats,
+                "queue_depth": len(self._waiting),
+                "tokens": round(self.tokens, 2),
+                "paused_for_s": round(max(0.0, self.paused_until - time.monotonic()), 2),
+            }
+
+
+_lock = threading.Lock()
+_schedulers: Dict[str, ModelScheduler] = {}
+
+
+def get_scheduler(model: str) -> Optional[ModelScheduler]:
+    """The process-wide scheduler for model, or None when the model is not rate limited."""
+    limits = model_limits(model)
+    if limits is None:
+        return None
+    with _lock:
+        scheduler = _schedulers.get(model)
+        if scheduler is None:
+            scheduler = _schedulers[model] = ModelScheduler(model, limits["rpm"], limits["burst"])
+        return scheduler
+
+
+def reset() -> None:
+    with _lock:
+        _schedulers.clear()
+
+
+def stats() -> Dict[str, Dict[str, Any]]:
+    """Per-model counters and current queue depth for this process."""
+    with _lock:
+        schedulers = list(_schedulers.values())
+    return {scheduler.model: scheduler.snapshot() for scheduler in schedulers}
+
+
+def acquire(model: str) -> None:
+    """Wait for a slot for model at the current priority; raises QueueTimeout."""
+    scheduler = get_scheduler(model)
+    if scheduler is not None:
+        scheduler.acquire(current_priority(), _setting("OPENROUTER_QUEUE_TIMEOUT", 30))
+
+
+async def aacquire(model: str) -> None:
+    """acquire() for coroutines."""
+    scheduler = get_scheduler(model)
+    if scheduler is not None:
+        await scheduler.aacquire(current_priority(), _setting("OPENROUTER_QUEUE_TIMEOUT", 30))
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Seconds from the Retry-After header of an API error response, if it has one."""
+    response = getattr(error, "response", None)
+    value = getattr(response, "headers", {}).get("retry-after") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except Exception:
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Exponential backoff with jitter for retry number attempt (0-based), never below retry_after."""
+    base = _setting("OPENROUTER_BACKOFF_BASE", 1.0)
+    cap = _setting("OPENROUTER_BACKOFF_MAX", 30.0)
+    delay = min(cap, base * (2 ** attempt)) * random.uniform(0.5, 1.0)
+    return max(delay, retry_after or 0.0)
+
+
+def _retry_delay(model: str, attempt: int, error: Exception) -> float:
+    """Seconds the caller itself must sleep before retry number attempt (0 when the model is paused)."""
+    delay = backoff_delay(attempt, retry_after_seconds(error))
+    status_code = getattr(error, "status_code", None)
+    logger.warning(f"{model}: upstream returned {status_code}, retrying in {delay:.1f}s (attempt {attempt + 1})")
+    scheduler = get_scheduler(model)
+    if scheduler is not None:
+        scheduler.count_retry()
+        if status_code == 429:
+            scheduler.pause(delay)
+            return 0.0
+    return delay
+
+
+def wait_before_retry(model: str, attempt: int, error: Exception) -> None:
+    """Back off after a 429 or 5xx from model before retry number attempt (0-based).
+
+    A 429 pauses the model's scheduler for the delay, so every queued call
+    for the model waits it out, not just this one; other errors (or models
+    without a scheduler) just sleep in the calling thread.
+    """
+    time.sleep(_retry_delay(model, attempt, error))
+
+
+async def await_before_retry(model: str, attempt: int, error: Exception) -> None:
+    """wait_before_retry() for coroutines."""
+    await asyncio.sleep(_retry_delay(model, attempt, error))
@@ -0,0 +1,117 @@
+import datetime
+import hashlib
+import hmac
+import uuid
+from typing import Dict
+
+from django.conf import settings
+from django.core import signing
+from django.db import IntegrityError
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.crypto import salted_hmac
+
+from ..models import Token, UsedResetToken, User
+
+VALID = "valid"
+EXPIRED = "expired"
+INVALID = "invalid"
+
+_signer = signing.TimestampSigner(salt="app.reset-password")
+
+
+def _max_age() -> int:
+    return getattr(settings, "RESET_TOKEN_MAX_AGE", 24 * 60 * 60)
+
+
+def signed_mode() -> bool:
+    return getattr(settings, "RESET_TOKEN_MODE", "signed") == "signed"
+
+
+def _password_state(password: str) -> str:
+    # Changes whenever the password does (hashes are salted), so any reset voids older links.
+    return salted_hmac("app.reset-password.state", password).hexdigest()[:16]
+
+
+def issue_reset_token(user) -> str:
+    """A password reset token for user.
+
+    In signed mode (settings.RESET_TOKEN_MODE) it is
+    "<user id>:<password state>:<timestamp>:<signature>" and nothing is
+    written; it stops working once the password changes. In stored mode a
+    random token is saved as a Token row.
+    """
+    if signed_mode():
+        return _signer.sign(f"{user.id}:{_password_state(user.password)}")
+    created_at = timezone.now()
+    token = hashlib.sha512(
+        (str(user.id) + user.password + created_at.isoformat() + uuid.uuid4().hex).encode("utf-8")
+    ).hexdigest()
+    Token.objects.create(
+        token=token,
+        created_at=created_at,
+        expires_at=created_at + datetime.timedelta(seconds=_max_age()),
+        user_id=user.id,
+    )
+    return token
+
+
+def _digest(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+
+
+def _redeem_signed(user_id, token: str) -> str:
+    try:
+        value = _signer.unsign(token, max_age=_max_age())
+    except signing.SignatureExpired:
+        return EXPIRED
+    except signing.BadSignature:
+        return INVALID
+    signed_id, _, state = value.partition(":")
+    if signed_id != str(user_id):
+        return INVALID
+    password = User.objects.filter(id=user_id).values_list("password", flat=True).first()
+    if password is None or not hmac.compare_digest(state, _password_state(password)):
+        return INVALID
+    try:
+        # Kept until the token could no longer verify anyway; the primary key makes reuse fail.
+        UsedResetToken.objects.create(
+            digest=_digest(token),
+            expires_at=timezone.now() + datetime.timedelta(seconds=_max_age()),
+        )
+    except IntegrityError:
+        return INVALID
+    return VALID
+
+
+def _redeem_stored(user_id, token: str) -> str:
+    # Served by the (user_id, created_at) index; only the newest link for a user is honoured.
+    token_obj = Token.objects.filter(user_id=user_id).order_by("-created_at").first()
+    if token_obj is None or token_obj.is_used or not hmac.compare_digest(token, token_obj.token):
+        return INVALID
+    if token_obj.expires_at < timezone.now():
+        return EXPIRED
+    if not Token.objects.filter(pk=token_obj.pk, is_used=False).update(is_used=True):
+        return INVALID
+    return VALID
+
+
+def redeem_reset_token(user_id, token: str) -> str:
+    """Check a reset token and mark it used; returns VALID, EXPIRED or INVALID.
+
+    Signed tokens are recognised by their format, so links sent before
+    RESET_TOKEN_MODE changed keep working until they expire.
+    """
+    if not isinstance(token, str) or not token or user_id in (None, ""):
+        return INVALID
+    if ":" in token:
+        return _redeem_signed(user_id, token)
+    return _redeem_stored(user_id, token)
+
+
+def purge_expired() -> Dict[str, int]:
+    """Delete expired or used Token rows and expired UsedResetToken records."""
+    now = timezone.now()
+    tokens, _ = Token.objects.filter(Q(expires_at__lt=now) | Q(is_used=True)).delete()
+    used, _ = UsedResetToken.objects.filter(expires_at__lt=now).delete()
+    return {"tokens": tokens, "used_tokens": used}
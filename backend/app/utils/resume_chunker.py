@@ -0,0 +1,109 @@
+import re
+from typing import List, Tuple
+
+# Headings that start a resume section, matched against a whole (short) line.
+SECTION_HEADINGS = [
+    "summary", "professional summary", "profile", "objective", "career objective", "about me",
+    "experience", "work experience", "professional experience", "employment history", "internships",
+    "internship", "projects", "academic projects", "personal projects", "skills", "technical skills",
+    "key skills", "core competencies", "tools and technologies", "education", "academic background",
+    "certifications", "certificates", "courses", "relevant coursework", "coursework", "achievements",
+    "awards", "publications", "research", "extracurricular activities", "activities",
+    "positions of responsibility", "leadership", "volunteering", "languages", "hobbies", "interests",
+    "references", "declaration", "personal details", "personal information", "contact",
+]
+
+# Sections that never carry skills and are dropped before prompting. "Languages" stays:
+# on tech resumes it usually lists programming languages.
+DROPPED_SECTIONS = {
+    "hobbies", "interests", "references", "declaration", "personal details",
+    "personal information", "contact",
+}
+
+_HEADING_RE = re.compile(
+    r"^\s*(?:" + "|".join(re.escape(h) for h in sorted(SECTION_HEADINGS, key=len, reverse=True)) + r")\s*:?\s*$",
+    re.IGNORECASE,
+)
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+_URL_RE = re.compile(r"(?:https?://|www\.)\S+|\b(?:linkedin|github)\.com/\S*", re.IGNORECASE)
+_PHONE_RE = re.compile(r"(?<![\w+])\+?\(?\d[\d\s().-]{8,}\d(?!\w)")
+_PAGE_NUMBER_RE = re.compile(r"^\s*(?:page\s*)?\d+\s*(?:(?:of|/)\s*\d+)?\s*$", re.IGNORECASE)
+
+# Rough characters-per-token ratio used to turn token budgets into text lengths.
+CHARS_PER_TOKEN = 4
+
+
+def _strip_phone(match: "re.Match") -> str:
+    # 10-15 digits, and not just a run of years ("2019 - 2021, 2021-2023").
+    groups = re.findall(r"\d+", match.group(0))
+    digits = sum(len(g) for g in groups)
+    if 10 <= digits <= 15 and not all(len(g) == 4 and g[:2] in ("19", "20") for g in groups):
+        return " "
+    return match.group(0)
+
+
+def strip_boilerplate(text: str) -> str:
+    """Remove contact details, page numbers and repeated lines (page headers/footers).
+
+    Repeated lines keep their first occurrence; duplicates add nothing to skill extraction.
+    """
+    seen = set()
+    kept = []
+    for line in (text or "").splitlines():
+        line = line.strip()
+        if _PAGE_NUMBER_RE.match(line):
+            continue
+        if line and not _HEADING_RE.match(line):
+            if line.lower() in seen:
+                continue
+            seen.add(line.lower())
+        line = _PHONE_RE.sub(_strip_phone, _URL_RE.sub(" ", _EMAIL_RE.sub(" ", line)))
+        line = " ".join(line.replace("|", " ").split())
+        if line or (kept and kept[-1]):
+            kept.append(line)
+    return "\n".join(kept).strip()
+
+
+def split_sections(text: str) -> List[Tuple[str, str]]:
+    """Split resume text into (heading, body) pairs; text before the first heading gets heading ""."""
+    sections: List[Tuple[str, List[str]]] = [("", [])]
+    for line in text.splitlines():
+        if _HEADING_RE.match(line):
+            sections.append((line.strip().rstrip(":").strip().lower(), []))
+        else:
+            sections[-1][1].append(line)
+    return [(heading, "\n".join(body).strip()) for heading, body in sections if "\n".join(body).strip()]
+
+
+def _split_long(body: str, max_chars: int) -> List[str]:
+    pieces, current = [], ""
+    for line in body.splitlines():
+        while len(line) > max_chars:
+            pieces.append(line[:max_chars])
+            line = line[max_chars:]
+        if current and len(current) + len(line) + 1 > max_chars:
+            pieces.append(current)
+            current = ""
+        current = f"{current}\n{line}" if current else line
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_resume(text: str, max_tokens: int) -> List[str]:
+    """Boilerplate-free resume text packed section by section into chunks of at most max_tokens."""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    chunks, current = [], ""
+    for heading, body in split_sections(strip_boilerplate(text)):
+        if heading in DROPPED_SECTIONS:
+            continue
+        label = heading.title() if heading else ""
+        for piece in _split_long(body, max_chars - len(label) - 2):
+            block = f"{label}\n{piece}" if label else piece
+            if current and len(current) + len(block) + 2 > max_chars:
+                chunks.append(current)
+                current = ""
+            current = f"{current}\n\n{block}" if current else block
+    if current:
+        chunks.append(current)
+    return chunks
@@ -0,0 +1,221 @@
+import hashlib
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import IntegrityError, transaction
+
+from ..models import Resume
+from ..serializers import ResumeSerializer
+from . import metrics
+from .canonical import canonical_skills
+from .cooccurrence import record_resume
+from .openrouter_async import arecommend_skills
+from .openrouter_service import recommend_skills
+from .skill_extractor import PDFTooLargeError, aextract_skills, extract_skills, extract_text_from_pdf_file
+from .skill_index import set_resume_skills
+
+logger = logging.getLogger(__name__)
+
+# Pipeline stages in execution order; reported to progress callbacks and stored on jobs.
+STAGES = ["parse_pdf", "extract_skills", "recommend_skills", "save"]
+
+
+class PipelineError(Exception):
+    """The upload itself is unusable (e.g. no text in the PDF); maps to a 400 response."""
+
+
+def _filter_recommendations(recommended_skills: List[str], extracted_skills: List[str]) -> List[str]:
+    existing_lower = {s.strip().lower() for s in extracted_skills if s and s.strip()}
+    filtered = []
+    for s in recommended_skills:
+        if not s or not isinstance(s, str):
+            continue
+        if s.strip().lower() in existing_lower:
+            continue
+        if s.strip() not in filtered:
+            filtered.append(s.strip())
+    return filtered
+
+
+def recommend_for_resume(extracted_skills: List[str], role: str) -> List[str]:
+    """Up to 8 canonical skills to learn for role, excluding ones the resume already lists."""
+    if not role or not extracted_skills:
+        return []
+    return _finish_recommendations(recommend_skills(extracted_skills, role), extracted_skills, role)
+
+
+async def arecommend_for_resume(extracted_skills: List[str], role: str) -> List[str]:
+    if not role or not extracted_skills:
+        return []
+    return _finish_recommendations(await arecommend_skills(extracted_skills, role), extracted_skills, role)
+
+
+def _finish_recommendations(recommended: List[str], extracted_skills: List[str], role: str) -> List[str]:
+    recommended_skills = canonical_skills(recommended)[:8]
+    logger.info(f"OpenRouter recommended {len(recommended_skills)} skills for role: {role}")
+    return _filter_recommendations(recommended_skills, extracted_skills)
+
+
+def file_sha256(file_obj) -> str:
+    """SHA-256 of the upload's bytes, read in chunks; leaves the file rewound."""
+    digest = hashlib.sha256()
+    try:
+        file_obj.seek(0)
+    except Exception:
+        pass
+    if hasattr(file_obj, "chunks"):
+        for chunk in file_obj.chunks():
+            digest.update(chunk)
+    else:
+        for chunk in iter(lambda: file_obj.read(64 * 1024), b""):
+            digest.update(chunk)
+    try:
+        file_obj.seek(0)
+    except Exception:
+        pass
+    return digest.hexdigest()
+
+
+def _split_skills(value: Optional[str]) -> List[str]:
+    return [s.strip() for s in (value or "").split(",") if s.strip()]
+
+
+def _save_resume(content_hash: str, existing: Optional[Resume], **fields) -> Tuple[Resume, str]:
+    """Create the Resume row, or fill in a stored one that has no extracted skills yet.
+
+    Returns (resume, "created" | "updated" | "kept"). If another request
+    stored the same PDF meanwhile, its row is returned untouched ("kept").
+    """
+    if existing is None:
+        try:
+            with transaction.atomic():
+                return Resume.objects.create(content_hash=content_hash, **fields), "created"
+        except IntegrityError:
+            # Another request stored the same PDF since we looked it up; its row stands.
+            return Resume.objects.get(content_hash=content_hash), "kept"
+    for name, value in fields.items():
+        setattr(existing, name, value)
+    existing.save(update_fields=list(fields))
+    return existing, "updated"
+
+
+def run_resume_pipeline(file_obj, role: str, filename: Optional[str] = None,
+                        progress: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
+    """Parse a resume PDF, extract and recommend skills, and store the Resume row.
+
+    progress(stage, state) is called with state "started" and "done" around
+    each entry of STAGES ("skipped" instead when a stage is not needed).
+    A PDF whose bytes were already processed reuses its stored extracted
+    skills and goes straight to role recommendation.
+    Returns the /extract-skills response payload.
+    """
+    def report(stage, state):
+        if progress:
+            progress(stage, state)
+
+    content_hash, existing, extracted_skills = _lookup(file_obj)
+    resume_text = None
+    if extracted_skills is not None:
+        report("parse_pdf", "skipped")
+        report("extract_skills", "skipped")
+    else:
+        report("parse_pdf", "started")
+        resume_text = _parse(file_obj)
+        report("parse_pdf", "done")
+
+        report("extract_skills", "started")
+        extracted_skills = canonical_skills(extract_skills(resume_text))
+        logger.info(f"Extracted {len(extracted_skills)} skills")
+        report("extract_skills", "done")
+
+    report("recommend_skills", "started")
+    recommended_skills = recommend_for_resume(extracted_skills, role)
+    report("recommend_skills", "done")
+
+    report("save", "started")
+    payload = _store(file_obj, filename, content_hash, existing, role, resume_text,
+                     extracted_skills, recommended_skills)
+    report("save", "done")
+    return payload
+
+
+@metrics.timed("db_read")
+def _lookup(file_obj) -> Tuple[str, Optional[Resume], Optional[List[str]]]:
+    """(content hash, stored Resume or None, its extracted skills if they can be reused)."""
+    content_hash = file_sha256(file_obj)
+    existing = Resume.objects.filter(content_hash=content_hash).first()
+    if existing and existing.extracted_skills:
+        extracted_skills = _split_skills(existing.extracted_skills)
+        logger.info(f"Reusing {len(extracted_skills)} extracted skills from resume {existing.id}")
+        return content_hash, existing, extracted_skills
+    return content_hash, existing, None
+
+
+def _parse(file_obj) -> str:
+    try:
+        resume_text = extract_text_from_pdf_file(file_obj)
+    except PDFTooLargeError as e:
+        raise PipelineError(str(e))
+    if not resume_text.strip():
+        raise PipelineError("Could not extract text from PDF")
+    return resume_text
+
+
+@metrics.timed("db_write")
+def _store(file_obj, filename: Optional[str], content_hash: str, existing: Optional[Resume], role: str,
+           resume_text: Optional[str], extracted_skills: List[str], recommended_skills: List[str]) -> Dict[str, Any]:
+    """Save the Resume and its skill links unless the PDF is already stored; returns the /extract-skills payload."""
+    if resume_text is None:
+        # Same PDF as a stored resume: its extracted skills were reused, but the first
+        # uploader's row (role, recommendations, skill links, co-occurrence counts) is kept.
+        resume, outcome = existing, "kept"
+    else:
+        resume, outcome = _save_resume(
+            content_hash,
+            existing,
+            file_name=filename if filename is not None else getattr(file_obj, 'name', None),
+            role=role,
+            extracted_skills=", ".join(extracted_skills),
+            recommended_skills=", ".join(recommended_skills) if recommended_skills else None
+        )
+    if outcome != "kept":
+        set_resume_skills(resume, extracted_skills, recommended_skills)
+    if outcome == "created":
+        record_resume(role, extracted_skills, recommended_skills)
+
+    extraction_issue = None
+    if not extracted_skills:
+        if not resume_text or not resume_text.strip():
+            extraction_issue = "bad_read"
+        elif len(resume_text) >= getattr(settings, 'PDF_CHAR_BUDGET', 50000):
+            extraction_issue = "input_too_long"
+        else:
+            extraction_issue = "no_skills_found"
+
+    return {
+        "status": "success",
+        "data": ResumeSerializer(resume).data,
+        "extracted_skills": extracted_skills,
+        "recommended_skills": recommended_skills,
+        "extraction_issue": extraction_issue,
+        "duplicate": outcome == "kept",
+    }
+
+
+async def arun_resume_pipeline(file_obj, role: str, filename: Optional[str] = None) -> Dict[str, Any]:
+    """run_resume_pipeline() for async views.
+
+    The LLM stages are awaited on the event loop; PDF parsing runs on a
+    worker thread and the ORM work in Django's sync thread.
+    """
+    content_hash, existing, extracted_skills = await sync_to_async(_lookup)(file_obj)
+    resume_text = None
+    if extracted_skills is None:
+        resume_text = await sync_to_async(_parse, thread_sensitive=False)(file_obj)
+        extracted_skills = canonical_skills(await aextract_skills(resume_text))
+        logger.info(f"Extracted {len(extracted_skills)} skills")
+    recommended_skills = await arecommend_for_resume(extracted_skills, role)
+    return await sync_to_async(_store)(file_obj, filename, content_hash, existing, role, resume_text,
+                                       extracted_skills, recommended_skills)
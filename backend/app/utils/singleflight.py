@@ -0,0 +1,260 @@
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache.backends.filebased import FileBasedCache
+
+from . import llm_cache
+
+logger = logging.getLogger(__name__)
+
+LOCK_PREFIX = "sf:lock"
+RESULT_PREFIX = "sf:result"
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Exception = None
+
+
+_lock = threading.Lock()
+_inflight: Dict[str, _Call] = {}
+_stats = {"leaders": 0, "coalesced_local": 0, "coalesced_shared": 0}
+# In-flight generations of ado(), per event loop.
+_async_inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = \
+    weakref.WeakKeyDictionary()
+
+
+def _count(name: str) -> None:
+    with _lock:
+        _stats[name] += 1
+
+
+def stats() -> Dict[str, int]:
+    """Per-process counters: calls that ran, and calls that piggybacked on one in flight."""
+    with _lock:
+        return dict(_stats)
+
+
+def _lock_path(cache: FileBasedCache, lock_key: str) -> str:
+    return os.path.join(cache._dir, "singleflight", hashlib.sha256(lock_key.encode("utf-8")).hexdigest() + ".lock")
+
+
+def _acquire(cache, lock_key: str, ttl: int) -> bool:
+    """Take the cross-worker lock for lock_key; False if another worker holds it.
+
+    FileBasedCache.add() checks and then writes, so two workers can both
+    win it; with that backend the lock is a file created with O_EXCL. A
+    lock file older than ttl (its holder crashed) is replaced.
+    """
+    if not isinstance(cache, FileBasedCache):
+        return cache.add(lock_key, os.getpid(), timeout=ttl)
+    path = _lock_path(cache, lock_key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    for _ in range(2):
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            if _held(cache, lock_key, ttl):
+                return False
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    return False
+
+
+def _held(cache, lock_key: str, ttl: int) -> bool:
+    if not isinstance(cache, FileBasedCache):
+        return cache.has_key(lock_key)
+    try:
+        return time.time() - os.path.getmtime(_lock_path(cache, lock_key)) < ttl
+    except FileNotFoundError:
+        return False
+
+
+def _release(cache, lock_key: str) -> None:
+    try:
+        if isinstance(cache, FileBasedCache):
+            os.remove(_lock_path(cache, lock_key))
+        else:
+            cache.delete(lock_key)
+    except Exception:
+        pass
+
+
+def _result_ttl(cache_ttl: Optional[int], lock_ttl: int) -> int:
+    # Published results only bridge followers to the leader; never outlive the caller's cache TTL.
+    return lock_ttl if cache_ttl is None else min(lock_ttl, cache_ttl)
+
+
+def do(key: str, fn: Callable[[], Any], cache_ttl: Optional[int] = None) -> Any:
+    """Run fn() once per key at a time and hand its result to every concurrent caller.
+
+    Callers in the same process wait on the in-flight call. When
+    settings.LLM_SINGLEFLIGHT_SHARED is on, the first caller across workers
+    also takes a short-lived lock in the shared LLM cache and publishes its
+    result there, so other workers wait for it instead of repeating the
+    call. The shared lock is best-effort: if it expires or the leader
+    produces nothing, waiting workers run fn() themselves, as does a local
+    caller whose wait exceeds LLM_SINGLEFLIGHT_WAIT. cache_ttl is how long
+    the result may be reused (None: no limit); with cache_ttl=0 nothing is
+    published and only callers in this process are coalesced.
+    """
+    with _lock:
+        call = _inflight.get(key)
+        leader = call is None
+        if leader:
+            call = _Call()
+            _inflight[key] = call
+
+    if not leader:
+        _count("coalesced_local")
+        if not call.done.wait(getattr(settings, "LLM_SINGLEFLIGHT_WAIT", 90)):
+            # The in-flight call is taking too long; make our own rather than return nothing.
+            logger.warning(f"Single-flight wait for {key} timed out, calling directly")
+            _count("leaders")
+            return fn()
+        if call.error:
+            raise call.error
+        return call.result
+
+    try:
+        if getattr(settings, "LLM_SINGLEFLIGHT_SHARED", True) and cache_ttl != 0:
+            call.result = _shared_do(key, fn, cache_ttl)
+        else:
+            _count("leaders")
+            call.result = fn()
+        return call.result
+    except Exception as e:
+        call.error = e
+        raise
+    finally:
+        with _lock:
+            _inflight.pop(key, None)
+        call.done.set()
+
+
+def _shared_do(key: str, fn: Callable[[], Any], cache_ttl: Optional[int]) -> Any:
+    cache = llm_cache.backend()
+    lock_key = f"{LOCK_PREFIX}:{key}"
+    result_key = f"{RESULT_PREFIX}:{key}"
+    lock_ttl = getattr(settings, "LLM_SINGLEFLIGHT_LOCK_TTL", 120)
+    deadline = time.monotonic() + getattr(settings, "LLM_SINGLEFLIGHT_WAIT", 90)
+
+    try:
+        acquired = _acquire(cache, lock_key, lock_ttl)
+    except Exception as e:
+        logger.warning(f"Single-flight lock unavailable, calling directly: {e}")
+        acquired = True
+
+    if acquired:
+        _count("leaders")
+        try:
+            result = fn()
+            if result:
+                cache.set(result_key, result, timeout=_result_ttl(cache_ttl, lock_ttl))
+            return result
+        finally:
+            _release(cache, lock_key)
+
+    # Another worker holds the lock: wait for its published result.
+    interval = 0.05
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        interval = min(interval * 2, 0.5)
+        result = cache.get(result_key)
+        if result:
+            _count("coalesced_shared")
+            return result
+        if not _held(cache, lock_key, lock_ttl):
+            break
+    _count("leaders")
+    return fn()
+
+
+_acount = sync_to_async(_count, thread_sensitive=False)
+
+
+def _in_thread(fn: Callable, *args, **kwargs) -> Awaitable:
+    return sync_to_async(fn, thread_sensitive=False)(*args, **kwargs)
+
+
+async def ado(key: str, fn: Callable[[], Awaitable[Any]], cache_ttl: Optional[int] = None) -> Any:
+    """do() for coroutines: concurrent callers on the same event loop await one generation.
+
+    The generation runs as its own task, so a caller that goes away (a
+    client disconnecting) does not cancel it for the others. Across workers
+    it coordinates through the shared cache lock exactly like do().
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        inflight = _async_inflight.setdefault(loop, {})
+    task = inflight.get(key)
+    if task is not None:
+        await _acount("coalesced_local")
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), getattr(settings, "LLM_SINGLEFLIGHT_WAIT", 90))
+        except asyncio.TimeoutError:
+            logger.warning(f"Single-flight wait for {key} timed out, calling directly")
+            _count("leaders")
+            return await fn()
+
+    async def run():
+        try:
+            if getattr(settings, "LLM_SINGLEFLIGHT_SHARED", True) and cache_ttl != 0:
+                return await _ashared_do(key, fn, cache_ttl)
+            _count("leaders")
+            return await fn()
+        finally:
+            inflight.pop(key, None)
+
+    task = inflight[key] = asyncio.ensure_future(run())
+    return await asyncio.shield(task)
+
+
+async def _ashared_do(key: str, fn: Callable[[], Awaitable[Any]], cache_ttl: Optional[int]) -> Any:
+    cache = llm_cache.backend()
+    lock_key = f"{LOCK_PREFIX}:{key}"
+    result_key = f"{RESULT_PREFIX}:{key}"
+    lock_ttl = getattr(settings, "LLM_SINGLEFLIGHT_LOCK_TTL", 120)
+    deadline = time.monotonic() + getattr(settings, "LLM_SINGLEFLIGHT_WAIT", 90)
+
+    try:
+        acquired = await _in_thread(_acquire, cache, lock_key, lock_ttl)
+    except Exception as e:
+        logger.warning(f"Single-flight lock unavailable, calling directly: {e}")
+        acquired = True
+
+    if acquired:
+        _count("leaders")
+        try:
+            result = await fn()
+            if result:
+                await _in_thread(cache.set, result_key, result, timeout=_result_ttl(cache_ttl, lock_ttl))
+            return result
+        finally:
+            await _in_thread(_release, cache, lock_key)
+
+    interval = 0.05
+    while time.monotonic() < deadline:
+        await asyncio.sleep(interval)
+        interval = min(interval * 2, 0.5)
+        result = await _in_thread(cache.get, result_key)
+        if result:
+            await _acount("coalesced_shared")
+            return result
+        if not await _in_thread(_held, cache, lock_key, lock_ttl):
+            break
+    _count("leaders")
+    return await fn()
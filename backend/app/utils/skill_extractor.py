@@ -1,16 +1,388 @@
-from io import BytesIO
+import logging
+import mmap
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
+
+from django.conf import settings
 from PyPDF2 import PdfReader
 
-def extract_text_from_pdf_file(file_obj) -> str:
+from . import metrics
+from .canonical import canonical_skills
+from .fanout import afan_out, fan_out, fanout_enabled
+from .openrouter_async import aextract_skills_from_resume
+from .openrouter_service import extract_skills_from_resume
+from .resume_chunker import chunk_resume
+from .skill_taxonomy import AMBIGUOUS_ALIASES, AMBIGUOUS_NAMES, SKILLS
+
+logger = logging.getLogger(__name__)
+
+
+class PDFTooLargeError(ValueError):
+    """The upload exceeds settings.PDF_MAX_BYTES."""
+
+
+_pool_lock = threading.Lock()
+_pool = None
+_pool_pid = None
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            # forkserver: never fork a multi-threaded server process directly.
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("forkserver"))
+            _pool_pid = os.getpid()
+    return _pool
+
+
+def _reset_pool() -> None:
+    global _pool, _pool_pid
+    with _pool_lock:
+        pool, _pool, _pool_pid = _pool, None, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _upload_size(file_obj) -> Optional[int]:
+    size = getattr(file_obj, "size", None)
+    if size is not None:
+        return size
+    try:
+        return os.fstat(file_obj.fileno()).st_size
+    except Exception:
+        return None
+
+
+def _upload_path(file_obj) -> Optional[str]:
+    """Path of the file on disk (spooled upload or opened file), if there is one."""
+    if hasattr(file_obj, "temporary_file_path"):
+        return file_obj.temporary_file_path()
+    name = getattr(file_obj, "name", None)
+    if isinstance(name, str) and os.path.isfile(name):
+        return name
+    return None
+
+
+@contextmanager
+def _open_reader(file_obj) -> Iterator[PdfReader]:
+    """PdfReader over the upload without copying it: mmap when it is on disk, closed on exit."""
+    try:
+        fileno = file_obj.fileno()
+    except Exception:
+        fileno = None
+    if fileno is not None:
+        with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as data:
+            yield PdfReader(data)
+        return
+    # In-memory uploads already hold the bytes; read them in place.
+    stream = getattr(file_obj, "file", file_obj)
+    stream.seek(0)
+    yield PdfReader(stream)
+
+
+def _extract_pages(reader: PdfReader, start: int, stop: int, char_budget: int) -> List[str]:
+    parts, total = [], 0
+    for index in range(start, stop):
+        page_text = reader.pages[index].extract_text()
+        if page_text:
+            parts.append(page_text)
+            total += len(page_text) + 1
+            if total >= char_budget:
+                break
+    return parts
+
+
+def _extract_page_range(path: str, start: int, stop: int, char_budget: int) -> List[str]:
+    """Process-pool worker: extract pages [start, stop) of the PDF at path."""
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _extract_pages(PdfReader(data), start, stop, char_budget)
+
+
+@metrics.timed("pdf_parse")
+def extract_text_from_pdf_file(file_obj, char_budget: Optional[int] = None) -> str:
+    """Extract up to char_budget characters of text from an uploaded PDF.
+
+    Uploads over settings.PDF_MAX_BYTES raise PDFTooLargeError, only the first
+    PDF_MAX_PAGES pages are read, and extraction stops as soon as the budget
+    (settings.PDF_CHAR_BUDGET by default) is reached. Long PDFs on disk are
+    split into page ranges and extracted on a process pool; uploads Django
+    kept in memory (under FILE_UPLOAD_MAX_MEMORY_SIZE, 2.5 MB by default)
+    are always read serially, as the pool workers open the PDF by path.
+    """
+    max_bytes = getattr(settings, "PDF_MAX_BYTES", 10 * 1024 * 1024)
+    max_pages = getattr(settings, "PDF_MAX_PAGES", 50)
+    workers = getattr(settings, "PDF_WORKERS", 1)
+    parallel_min_pages = getattr(settings, "PDF_PARALLEL_MIN_PAGES", 8)
+    if char_budget is None:
+        char_budget = getattr(settings, "PDF_CHAR_BUDGET", 50000)
+
+    size = _upload_size(file_obj)
+    if size is not None and size > max_bytes:
+        raise PDFTooLargeError(f"PDF is {size} bytes; the limit is {max_bytes} bytes")
+    if size == 0:
+        return ""
+
     try:
         file_obj.seek(0)
     except Exception:
         pass
 
-    reader = PdfReader(BytesIO(file_obj.read()))
-    text_parts = []
-    for page in reader.pages:
-        page_text = page.extract_text()
-        if page_text:
-            text_parts.append(page_text)
-    return "\n".join(text_parts)
+    with _open_reader(file_obj) as reader:
+        page_count = len(reader.pages)
+        if page_count > max_pages:
+            logger.info(f"PDF has {page_count} pages; reading the first {max_pages}")
+            page_count = max_pages
+
+        path = _upload_path(file_obj)
+        if path is None or workers <= 1 or page_count < parallel_min_pages:
+            text_parts = _extract_pages(reader, 0, page_count, char_budget)
+        else:
+            try:
+                text_parts = _extract_parallel(path, page_count, workers, char_budget)
+            except Exception as e:
+                logger.warning(f"Parallel PDF extraction failed, reading serially: {e}")
+                _reset_pool()
+                text_parts = _extract_pages(reader, 0, page_count, char_budget)
+    return "\n".join(text_parts)[:char_budget]
+
+
+def _extract_parallel(path: str, page_count: int, workers: int, char_budget: int) -> List[str]:
+    # Pages are handed out one window (a range per worker) at a time, so a
+    # budget met early in the document skips the remaining windows entirely.
+    pool = _get_pool(workers)
+    pages_per_range = max(1, page_count // (workers * 2))
+    text_parts, total = [], 0
+    start = 0
+    while start < page_count and total < char_budget:
+        ranges = []
+        for _ in range(workers):
+            if start >= page_count:
+                break
+            stop = min(start + pages_per_range, page_count)
+            ranges.append((start, stop))
+            start = stop
+        futures = [pool.submit(_extract_page_range, path, a, b, char_budget - total) for a, b in ranges]
+        for future in futures:
+            for part in future.result():
+                if total >= char_budget:
+                    break
+                text_parts.append(part)
+                total += len(part) + 1
+    return text_parts
+
+
+def _extract_document(path: str, max_bytes: int, max_pages: int, char_budget: int) -> str:
+    """Process-pool worker: text of a whole PDF on disk, read serially within the limits."""
+    size = os.path.getsize(path)
+    if size > max_bytes:
+        raise PDFTooLargeError(f"PDF is {size} bytes; the limit is {max_bytes} bytes")
+    if size == 0:
+        return ""
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            reader = PdfReader(data)
+            page_count = min(len(reader.pages), max_pages)
+            return "\n".join(_extract_pages(reader, 0, page_count, char_budget))[:char_budget]
+
+
+def submit_pdf_text(path: str) -> Future:
+    """Start extracting the text of the PDF at path on the process pool; returns a Future for it.
+
+    Meant for batches: many small PDFs are parsed concurrently, one per
+    worker, with the same byte/page/character limits as
+    extract_text_from_pdf_file. With PDF_WORKERS=1 the PDF is parsed
+    right away in the calling thread.
+    """
+    args = (
+        path,
+        getattr(settings, "PDF_MAX_BYTES", 10 * 1024 * 1024),
+        getattr(settings, "PDF_MAX_PAGES", 50),
+        getattr(settings, "PDF_CHAR_BUDGET", 50000),
+    )
+    workers = getattr(settings, "PDF_WORKERS", 1)
+    if workers > 1:
+        try:
+            return _get_pool(workers).submit(_extract_document, *args)
+        except Exception as e:
+            logger.warning(f"PDF process pool unavailable, parsing in-process: {e}")
+            _reset_pool()
+    future = Future()
+    try:
+        future.set_result(_extract_document(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over skill aliases; finds every alias in one pass over the text.
+
+    Matches must sit on word boundaries (no letter or digit directly before
+    or after), so "java" does not fire inside "javascript".
+    """
+
+    def __init__(self, aliases: Dict[str, str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[tuple]] = [[]]
+        for alias, canonical in aliases.items():
+            state = 0
+            for char in alias:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append((len(alias), canonical))
+
+        # Breadth-first pass to fill in failure links and merge outputs.
+        queue = list(self._goto[0].values())
+        while queue:
+            state = queue.pop(0)
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> List[str]:
+        """Canonical skills mentioned in text, in order of first appearance."""
+        text = text.lower()
+        found: Dict[str, None] = {}
+        state = 0
+        last = len(text) - 1
+        for i, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for length, canonical in self._out[state]:
+                start = i - length + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if i < last and text[i + 1].isalnum():
+                    continue
+                found.setdefault(canonical)
+        return list(found)
+
+
+def _alias_index() -> Dict[str, str]:
+    aliases = {}
+    for canonical, names in SKILLS.items():
+        if canonical not in AMBIGUOUS_NAMES:
+            aliases[canonical.lower()] = canonical
+        for name in names:
+            if name not in AMBIGUOUS_ALIASES:
+                aliases[name.lower()] = canonical
+    return aliases
+
+
+@lru_cache(maxsize=1)
+def get_skill_matcher() -> SkillMatcher:
+    """The matcher for the curated taxonomy, compiled once per process."""
+    return SkillMatcher(_alias_index())
+
+
+def extract_skills_local(resume_text: str) -> List[str]:
+    """Skills from the curated taxonomy found in resume_text, without any LLM call."""
+    return get_skill_matcher().find(resume_text or "")
+
+
+EXTRACTION_MODES = ("local", "hybrid", "llm")
+
+
+def extract_skills(resume_text: str, mode: Optional[str] = None) -> List[str]:
+    """Extract skills according to settings.SKILL_EXTRACTION_MODE (or mode).
+
+    local:  taxonomy matcher only, no LLM call.
+    hybrid: taxonomy matcher first, then the LLM is asked only for skills
+            the matcher did not find; if the LLM fails the local result stands.
+    llm:    LLM extraction only.
+    """
+    mode = mode or getattr(settings, "SKILL_EXTRACTION_MODE", "hybrid")
+    if mode not in EXTRACTION_MODES:
+        raise ValueError(f"Unknown skill extraction mode: {mode}")
+    if mode == "llm":
+        return extract_skills_llm(resume_text)
+
+    local_skills = extract_skills_local(resume_text)
+    if mode == "local":
+        return local_skills
+
+    return _merge(local_skills, extract_skills_llm(resume_text, with_known=True))
+
+
+def _merge(local_skills: List[str], extra: List[str]) -> List[str]:
+    seen = {s.lower() for s in local_skills}
+    merged = list(local_skills)
+    for skill in extra:
+        if skill.lower() not in seen:
+            seen.add(skill.lower())
+            merged.append(skill)
+    return merged
+
+
+def _chunks(resume_text: str) -> List[str]:
+    return chunk_resume(resume_text, getattr(settings, "RESUME_CHUNK_TOKENS", 1500)) or [resume_text]
+
+
+def extract_skills_llm(resume_text: str, with_known: bool = False) -> List[str]:
+    """LLM skill extraction over boilerplate-free resume chunks (map-reduce).
+
+    The resume is stripped of contact details and repeated headers/footers,
+    split into sections and packed into chunks of settings.RESUME_CHUNK_TOKENS.
+    Each chunk is extracted separately (in parallel when fan-out is on) and
+    the per-chunk lists are merged in document order. With with_known, each
+    chunk's prompt lists the skills the local matcher found in that chunk.
+    """
+    chunks = _chunks(resume_text)
+
+    def extract(index: int) -> List[str]:
+        chunk = chunks[index]
+        return extract_skills_from_resume(chunk, known_skills=extract_skills_local(chunk) if with_known else None)
+
+    indexes = range(len(chunks))
+    if len(chunks) > 1 and fanout_enabled():
+        results = fan_out(extract, indexes)
+    else:
+        results = {index: extract(index) for index in indexes}
+    return canonical_skills(skill for index in indexes for skill in results.get(index) or [])
+
+
+async def aextract_skills(resume_text: str, mode: Optional[str] = None) -> List[str]:
+    """extract_skills() for coroutines."""
+    mode = mode or getattr(settings, "SKILL_EXTRACTION_MODE", "hybrid")
+    if mode not in EXTRACTION_MODES:
+        raise ValueError(f"Unknown skill extraction mode: {mode}")
+    if mode == "llm":
+        return await aextract_skills_llm(resume_text)
+    local_skills = extract_skills_local(resume_text)
+    if mode == "local":
+        return local_skills
+    return _merge(local_skills, await aextract_skills_llm(resume_text, with_known=True))
+
+
+async def aextract_skills_llm(resume_text: str, with_known: bool = False) -> List[str]:
+    """extract_skills_llm() for coroutines."""
+    chunks = _chunks(resume_text)
+
+    async def extract(index: int) -> List[str]:
+        chunk = chunks[index]
+        return await aextract_skills_from_resume(
+            chunk, known_skills=extract_skills_local(chunk) if with_known else None)
+
+    indexes = range(len(chunks))
+    results = await afan_out(extract, indexes, max_workers=None if fanout_enabled() else 1)
+    return canonical_skills(skill for index in indexes for skill in results.get(index) or [])
@@ -0,0 +1,82 @@
+from typing import Dict, Iterable, List, Tuple
+
+from django.db import transaction
+from django.db.models import Count
+
+from ..models import Resume, ResumeSkill, Skill
+
+
+# Matches the max_length of Skill.name/Skill.key.
+MAX_SKILL_LENGTH = 120
+
+
+def _skill_name(name: str) -> str:
+    return " ".join(name.split())[:MAX_SKILL_LENGTH]
+
+
+def _skill_key(name: str) -> str:
+    return _skill_name(name).lower()
+
+
+def get_or_create_skills(names: Iterable[str]) -> Dict[str, Skill]:
+    """Skill rows for names, keyed by lowercased name; missing ones are bulk-inserted."""
+    wanted: Dict[str, str] = {}
+    for name in names:
+        if name and isinstance(name, str) and name.strip():
+            wanted.setdefault(_skill_key(name), _skill_name(name))
+    if not wanted:
+        return {}
+    existing = {skill.key: skill for skill in Skill.objects.filter(key__in=list(wanted))}
+    missing = [Skill(name=wanted[key], key=key) for key in wanted if key not in existing]
+    if missing:
+        Skill.objects.bulk_create(missing, ignore_conflicts=True)
+        existing.update({skill.key: skill for skill in Skill.objects.filter(key__in=[s.key for s in missing])})
+    return existing
+
+
+def _links(resume: Resume, extracted: List[str], recommended: List[str],
+           skills: Dict[str, Skill]) -> List[ResumeSkill]:
+    extracted_keys = {_skill_key(s) for s in extracted if s and s.strip()}
+    recommended_keys = {_skill_key(s) for s in recommended if s and s.strip()}
+    return [
+        ResumeSkill(
+            resume=resume,
+            skill=skills[key],
+            is_extracted=key in extracted_keys,
+            is_recommended=key in recommended_keys,
+        )
+        for key in extracted_keys | recommended_keys
+    ]
+
+
+def set_resume_skills(resume: Resume, extracted: Iterable[str], recommended: Iterable[str]) -> None:
+    """Replace the resume's ResumeSkill rows with one bulk insert."""
+    extracted, recommended = list(extracted), list(recommended)
+    with transaction.atomic():
+        skills = get_or_create_skills([*extracted, *recommended])
+        ResumeSkill.objects.filter(resume=resume).delete()
+        ResumeSkill.objects.bulk_create(_links(resume, extracted, recommended, skills))
+
+
+def add_resume_skills(entries: Iterable[Tuple[Resume, List[str], List[str]]]) -> None:
+    """Insert ResumeSkill rows for newly created resumes, given (resume, extracted, recommended) triples."""
+    entries = list(entries)
+    with transaction.atomic():
+        skills = get_or_create_skills(name for _, extracted, recommended in entries
+                                      for name in [*extracted, *recommended])
+        links = [link for resume, extracted, recommended in entries
+                 for link in _links(resume, extracted, recommended, skills)]
+        ResumeSkill.objects.bulk_create(links, batch_size=1000)
+
+
+def top_skills(limit: int = 20) -> List[Tuple[str, int]]:
+    """Skills extracted from the most resumes, with counts."""
+    rows = (
+        Skill.objects
+        .filter(resume_links__is_extracted=True)
+        .annotate(resume_count=Count("resume_links"))
+        .order_by("-resume_count", "name")
+        .values_list("name", "resume_count")[:limit]
+    )
+    return list(rows)
+
@@ -0,0 +1,221 @@
+"""Curated skill and role dictionaries: canonical name -> aliases people write.
+
+SKILLS drives both resume scanning and input canonicalization. Resume
+matching is case-insensitive and on word boundaries. The canonical name is
+matched too, so only list aliases that differ from it; names that are also
+ordinary words or letters are in AMBIGUOUS_NAMES and match only via aliases.
+Aliases in AMBIGUOUS_ALIASES ("ml", "rails") canonicalize input but are
+never matched in resume text. ROLES is used to canonicalize target roles.
+"""
+
+AMBIGUOUS_NAMES = {
+    "C", "R", "Go", "Swift", "Julia", "Ruby", "React", "Excel", "Rust", "Dart", "Jest", "Flask",
+    "Assembly", "Postman", "Cypress",
+}
+AMBIGUOUS_ALIASES = {"rails", "oops", "networking", "ml"}
+
+SKILLS = {
+    # Programming languages
+    "Python": ["python3"],
+    "Java": ["java se", "java ee", "core java"],
+    "JavaScript": ["js", "java script", "ecmascript", "es6"],
+    "TypeScript": [],
+    "C": ["c programming", "c language", "ansi c"],
+    "C++": ["cpp", "c plus plus"],
+    "C#": ["c sharp", "csharp"],
+    "Go": ["golang", "go lang"],
+    "Rust": ["rust programming", "rust lang", "rustlang"],
+    "Kotlin": [],
+    "Swift": ["swiftui", "swift programming"],
+    "Objective-C": ["objective c"],
+    "Ruby": ["ruby programming"],
+    "PHP": [],
+    "Scala": [],
+    "R": ["r programming", "r language", "rstudio"],
+    "MATLAB": [],
+    "Perl": [],
+    "Dart": ["dart programming", "dartlang"],
+    "Julia": ["julia programming", "julia language"],
+    "Haskell": [],
+    "Elixir": [],
+    "Lua": [],
+    "Bash": ["shell scripting", "bash scripting", "shell script"],
+    "PowerShell": [],
+    "Solidity": [],
+    "Assembly": ["assembly language", "x86 assembly", "arm assembly"],
+    "VHDL": [],
+    "Verilog": [],
+    # Web
+    "HTML": ["html5"],
+    "CSS": ["css3"],
+    "Sass": ["scss"],
+    "Tailwind CSS": ["tailwind", "tailwindcss"],
+    "Bootstrap": [],
+    "React": ["react.js", "reactjs", "react js"],
+    "React Native": [],
+    "Next.js": ["nextjs", "next js"],
+    "Angular": ["angularjs", "angular.js"],
+    "Vue.js": ["vue", "vuejs", "vue js"],
+    "Svelte": [],
+    "Redux": [],
+    "jQuery": [],
+    "Node.js": ["nodejs", "node js"],
+    "Express.js": ["expressjs", "express js"],
+    "Django": [],
+    "Django REST Framework": ["drf", "django rest"],
+    "Flask": ["python flask", "flask framework"],
+    "FastAPI": ["fast api"],
+    "Spring Boot": ["springboot", "spring framework"],
+    "Ruby on Rails": ["rails", "ror"],
+    "Laravel": [],
+    "ASP.NET": ["asp.net core", ".net core"],
+    ".NET": ["dotnet", "dot net"],
+    "GraphQL": [],
+    "REST APIs": ["rest api", "restful apis", "restful api", "restful"],
+    "WebSockets": ["websocket"],
+    "Webpack": [],
+    "Vite": [],
+    "Flutter": [],
+    "Android Development": ["android", "android sdk"],
+    "iOS Development": ["ios"],
+    # Data and databases
+    "SQL": ["structured query language"],
+    "MySQL": [],
+    "PostgreSQL": ["postgres", "psql"],
+    "SQLite": [],
+    "Oracle Database": ["oracle db", "pl/sql", "plsql"],
+    "Microsoft SQL Server": ["sql server", "mssql", "t-sql"],
+    "MongoDB": ["mongo"],
+    "Redis": [],
+    "Cassandra": [],
+    "Elasticsearch": ["elastic search"],
+    "DynamoDB": [],
+    "Firebase": [],
+    "Snowflake": [],
+    "BigQuery": ["google bigquery"],
+    "Apache Spark": ["pyspark", "spark sql"],
+    "Hadoop": ["apache hadoop"],
+    "Apache Kafka": ["kafka"],
+    "Apache Airflow": ["airflow"],
+    "dbt": [],
+    "ETL": ["etl pipelines"],
+    "Data Warehousing": ["data warehouse"],
+    "Pandas": [],
+    "NumPy": [],
+    "SciPy": [],
+    "Matplotlib": [],
+    "Seaborn": [],
+    "Plotly": [],
+    "Excel": ["microsoft excel", "ms excel", "advanced excel"],
+    "Tableau": [],
+    "Power BI": ["powerbi"],
+    "Looker": [],
+    "Data Analysis": ["data analytics"],
+    "Data Visualization": ["data visualisation"],
+    "Statistics": ["statistical analysis"],
+    # Machine learning and AI
+    "Machine Learning": ["ml"],
+    "Deep Learning": [],
+    "Artificial Intelligence": ["ai"],
+    "Natural Language Processing": ["nlp"],
+    "Computer Vision": ["opencv"],
+    "Generative AI": ["genai", "gen ai"],
+    "Large Language Models": ["llm", "llms"],
+    "TensorFlow": [],
+    "Keras": [],
+    "PyTorch": [],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "XGBoost": [],
+    "Hugging Face": ["huggingface"],
+    "LangChain": [],
+    "MLOps": [],
+    # Cloud and DevOps
+    "AWS": ["amazon web services"],
+    "Microsoft Azure": ["azure"],
+    "Google Cloud": ["gcp", "google cloud platform"],
+    "Docker": [],
+    "Kubernetes": ["k8s"],
+    "Terraform": [],
+    "Ansible": [],
+    "Jenkins": [],
+    "GitHub Actions": [],
+    "CI/CD": ["ci cd", "continuous integration", "continuous deployment"],
+    "Linux": ["unix", "ubuntu"],
+    "Nginx": [],
+    "Serverless": ["aws lambda", "serverless computing"],
+    "Prometheus": [],
+    "Grafana": [],
+    "Microservices": ["microservice architecture"],
+    "Git": [],
+    "GitHub": [],
+    "GitLab": [],
+    "Bitbucket": [],
+    "Jira": [],
+    # Computer science and engineering practice
+    "Data Structures": ["data structures and algorithms", "dsa"],
+    "Algorithms": [],
+    "Object-Oriented Programming": ["oop", "oops", "object oriented programming"],
+    "System Design": [],
+    "Operating Systems": [],
+    "Computer Networks": ["networking"],
+    "DBMS": ["database management systems"],
+    "Unit Testing": ["unit tests"],
+    "Test-Driven Development": ["tdd"],
+    "Selenium": [],
+    "Pytest": [],
+    "Jest": ["jest testing", "jestjs"],
+    "Cypress": ["cypress.io", "cypress testing"],
+    "Postman": ["postman api"],
+    "Cybersecurity": ["cyber security", "information security"],
+    "Blockchain": [],
+    "Embedded Systems": [],
+    "Arduino": [],
+    "Raspberry Pi": [],
+    "IoT": ["internet of things"],
+    "Figma": [],
+    "UI/UX Design": ["ui/ux", "ux design", "ui design"],
+    "Agile": ["agile methodology"],
+    "Scrum": [],
+    # Professional skills
+    "Project Management": [],
+    "Communication": ["communication skills"],
+    "Leadership": [],
+    "Teamwork": ["team work"],
+    "Problem Solving": ["problem-solving"],
+    "Time Management": [],
+    "Critical Thinking": [],
+    "Public Speaking": [],
+}
+
+ROLES = {
+    "Software Engineer": ["sde", "swe", "software developer", "software development engineer",
+                          "software engineering", "programmer", "developer", "sde 1", "sde 2", "sde i", "sde ii"],
+    "Frontend Developer": ["front end developer", "frontend engineer", "front-end developer", "ui developer",
+                           "react developer"],
+    "Backend Developer": ["back end developer", "backend engineer", "back-end developer", "server side developer"],
+    "Full Stack Developer": ["fullstack developer", "full-stack developer", "full stack engineer", "mern stack developer",
+                             "mern developer"],
+    "Web Developer": ["web designer and developer"],
+    "Mobile Developer": ["mobile app developer", "app developer"],
+    "Android Developer": ["android engineer"],
+    "iOS Developer": ["ios engineer"],
+    "Data Analyst": ["data analytics", "business intelligence analyst", "bi analyst"],
+    "Data Scientist": ["data science"],
+    "Data Engineer": ["big data engineer", "etl developer"],
+    "Machine Learning Engineer": ["ml engineer", "mle", "machine learning developer"],
+    "AI Engineer": ["artificial intelligence engineer", "ai developer", "genai engineer"],
+    "DevOps Engineer": ["devops", "build and release engineer"],
+    "Site Reliability Engineer": ["sre"],
+    "Cloud Engineer": ["cloud developer", "aws engineer", "cloud architect"],
+    "Cybersecurity Analyst": ["security analyst", "cyber security analyst", "information security analyst",
+                              "security engineer"],
+    "QA Engineer": ["software tester", "test engineer", "sdet", "qa analyst", "quality assurance engineer"],
+    "Business Analyst": ["ba"],
+    "Product Manager": ["pm", "product owner"],
+    "UI/UX Designer": ["ui designer", "ux designer", "product designer", "ui ux designer"],
+    "Embedded Systems Engineer": ["embedded engineer", "embedded software engineer", "firmware engineer"],
+    "Database Administrator": ["dba"],
+    "Network Engineer": ["network administrator"],
+    "Game Developer": ["game programmer"],
+    "Blockchain Developer": ["web3 developer", "smart contract developer"],
+}
@@ -1,42 +1,117 @@
 from django.shortcuts import render
-from django.contrib.auth.hashers import make_password
-from django.core.mail import send_mail
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views import View
+from asgiref.sync import sync_to_async
 from rest_framework import status
+from rest_framework.renderers import BaseRenderer, JSONRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
-from .models import User, Token, Resume
-from .serializers import UserSerializer, TokenSerializer, ResumeSerializer
+from .models import User, Resume, ExtractionJob
+from .serializers import UserSerializer, ResumeSerializer, ExtractionJobSerializer
 from django.conf import settings
 from datetime import datetime, timedelta
-import hashlib
-import uuid
 from django.utils import timezone
+import itertools
 import traceback
+import hmac
 import json
 import logging
-from .utils.openrouter_service import generate_skill_roadmap, analyze_market_demand, recommend_skills, extract_skills_from_resume
-from .utils.skill_extractor import extract_text_from_pdf_file
+from .utils.openrouter_service import generate_skill_roadmap, recommend_skills, stream_skill_entries
+from .utils.canonical import canonical_role, canonical_skills
+from .utils.resume_pipeline import PipelineError, arun_resume_pipeline, run_resume_pipeline
+from .utils.openrouter_async import agenerate_skill_roadmap, arecommend_skills
+from .utils.jobs import enqueue_bulk_ingest, enqueue_extraction
+from .utils.bulk_ingest import BulkIngestError
+from .utils import cooccurrence, metrics
+from .utils.passwords import burn_hash, hash_password, verify_password
+from .utils.market_snapshots import amarket_analysis, latest_snapshots, market_analysis, skill_history
+from .utils.outbox import enqueue_email
+from .utils.reset_tokens import EXPIRED, VALID, issue_reset_token, redeem_reset_token
 
 logger = logging.getLogger(__name__)
-SALT = "8b4f6b2cc1868d75ef79e5cfb8779c11b6a374bf0fce05b485581bf4e1e25b96c8c2855015de8449"
 URL = "http://localhost:3000"
 
+def _skills_from(data):
+    """Return (normalized skills, None) from a request body, or (None, error message)."""
+    skills = data.get('skills') or data.get('skill')
+    if isinstance(skills, str):
+        skills = [skills]
+    if not skills or not isinstance(skills, list):
+        return None, "Skill(s) is required"
+
+    skills_normalized = [s.lower() for s in canonical_skills([str(s) for s in skills if s])]
+    if not skills_normalized:
+        return None, "No valid skills provided"
+    return skills_normalized, None
+
+
+def _requested_skills(request):
+    """Return (normalized skills, None) from the request body, or (None, error Response)."""
+    skills, error = _skills_from(request.data)
+    if error:
+        return None, Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+    return skills, None
+
+
+def _recommend_params(data):
+    """Return (skills, role, strategy, None) for /skill-recommend, or (None, None, None, error message)."""
+    skills = data.get('skills', [])
+    if not isinstance(skills, list):
+        return None, None, None, "skills must be a list"
+    strategy = data.get('strategy') or getattr(settings, 'SKILL_RECOMMEND_STRATEGY', 'cooccurrence')
+    if strategy not in cooccurrence.STRATEGIES:
+        return None, None, None, f"strategy must be one of: {', '.join(cooccurrence.STRATEGIES)}"
+    return canonical_skills(skills), canonical_role(data.get('role')), strategy, None
+
+
+def _without_owned(recs, skills):
+    existing = {s.lower() for s in skills}
+    return [r for r in canonical_skills(recs) if r.lower() not in existing]
+
+
+class EventStreamRenderer(BaseRenderer):
+    """Lets clients send Accept: text/event-stream; error bodies are still rendered as JSON."""
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data)
+
+
+def _sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _skill_event_stream(task, skills, ready=()):
+    """SSE events for the entries in ready, then for skills as they are generated."""
+    count = 0
+    try:
+        for entry in itertools.chain(ready, stream_skill_entries(task, skills) if skills else ()):
+            count += 1
+            yield _sse_event("skill", {"skill": entry["name"], "data": entry["data"]})
+    except Exception as e:
+        logger.error(f"Streaming {task} failed: {e}")
+        yield _sse_event("error", {"error": str(e)})
+    yield _sse_event("done", {"count": count})
+
+
+def _sse_response(events):
+    response = StreamingHttpResponse(events, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
 class SkillRoadmapView(APIView):
     authentication_classes = []
     permission_classes = [AllowAny]
     
     def post(self, request, *args, **kwargs):
-        skills = request.data.get('skills') or request.data.get('skill')
-        if isinstance(skills, str):
-            skills = [skills]
-        if not skills or not isinstance(skills, list):
-            return Response({"error": "Skill(s) is required"}, status=status.HTTP_400_BAD_REQUEST)
-
-        skills_normalized = [str(s).strip().lower() for s in skills if s and str(s).strip()]
-        if not skills_normalized:
-            return Response({"error": "No valid skills provided"}, status=status.HTTP_400_BAD_REQUEST)
+        skills_normalized, error = _requested_skills(request)
+        if error:
+            return error
 
         try:
             roadmap = generate_skill_roadmap(skills_normalized) or {}
@@ -45,42 +120,87 @@ class SkillRoadmapView(APIView):
             return Response({"error": f"Failed to generate roadmap: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class SkillMarketAnalysisView(APIView):
+class SkillRoadmapStreamView(APIView):
+    """Server-sent events: one "skill" event per roadmap entry as it is generated, then "done"."""
     authentication_classes = []
     permission_classes = [AllowAny]
+    renderer_classes = [JSONRenderer, EventStreamRenderer]
 
     def post(self, request, *args, **kwargs):
-        skills = request.data.get('skills') or request.data.get('skill')
-        if isinstance(skills, str):
-            skills = [skills]
-        if not skills or not isinstance(skills, list):
-            return Response({"error": "Skill(s) is required"}, status=status.HTTP_400_BAD_REQUEST)
+        skills_normalized, error = _requested_skills(request)
+        if error:
+            return error
+        return _sse_response(_skill_event_stream("roadmap", skills_normalized))
 
-        skills_normalized = [str(s).strip().lower() for s in skills if s and str(s).strip()]
-        if not skills_normalized:
-            return Response({"error": "No valid skills provided"}, status=status.HTTP_400_BAD_REQUEST)
+
+class SkillMarketAnalysisView(APIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def post(self, request, *args, **kwargs):
+        skills_normalized, error = _requested_skills(request)
+        if error:
+            return error
 
         try:
-            analysis = analyze_market_demand(skills_normalized) or {}
+            analysis = market_analysis(skills_normalized)
             return Response(analysis, status=status.HTTP_200_OK)
         except Exception as e:
             return Response({"error": f"Failed to analyze market demand: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+class SkillMarketAnalysisStreamView(APIView):
+    """Server-sent events: one "skill" event per market analysis entry as it is generated, then "done"."""
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    renderer_classes = [JSONRenderer, EventStreamRenderer]
+
+    def post(self, request, *args, **kwargs):
+        skills_normalized, error = _requested_skills(request)
+        if error:
+            return error
+        snapshots = latest_snapshots(skills_normalized)
+        missing = [s for s in skills_normalized if s not in snapshots]
+        return _sse_response(_skill_event_stream("market", missing, list(snapshots.values())))
+
+
+class SkillMarketHistoryView(APIView):
+    """Stored market snapshots for one skill (?skill=...&days=90), oldest first."""
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request, *args, **kwargs):
+        skills, error = _skills_from(request.query_params)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            days = int(request.query_params.get('days', 90))
+        except ValueError:
+            days = 0
+        if not 1 <= days <= 366:
+            return Response({"error": "days must be between 1 and 366"}, status=status.HTTP_400_BAD_REQUEST)
+        history = [{"date": row["snapshot_date"], "data": row["data"]} for row in skill_history(skills[0], days)]
+        return Response({"skill": skills[0], "history": history}, status=status.HTTP_200_OK)
+
+
 class SkillRecommendView(APIView):
     authentication_classes = []
     permission_classes = [AllowAny]
 
     def post(self, request, *args, **kwargs):
-        skills = request.data.get('skills', [])
-        role = request.data.get('role')
-        if not isinstance(skills, list):
-            return Response({"error": "skills must be a list"}, status=status.HTTP_400_BAD_REQUEST)
+        skills, role, strategy, error = _recommend_params(request.data)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
         try:
-            recs = recommend_skills(skills, role)
-            existing = {s.strip().lower() for s in skills if s and isinstance(s, str)}
-            filtered = [r for r in recs if isinstance(r, str) and r.strip().lower() not in existing]
-            return Response({"recommended_skills": filtered}, status=status.HTTP_200_OK)
+            recs = None
+            if strategy == 'cooccurrence':
+                recs = cooccurrence.recommend(skills, role)
+            if recs is None:
+                # Unseen role (or llm strategy): ask the model.
+                strategy = 'llm'
+                recs = recommend_skills(skills, role)
+            return Response({"recommended_skills": _without_owned(recs, skills), "strategy": strategy},
+                            status=status.HTTP_200_OK)
         except Exception as e:
             return Response({"error": f"Failed to generate recommendations: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
@@ -104,6 +224,16 @@ def mail_template(content, button_url, button_text):
             </body>
             </html>"""
 
+def _wants_async(request):
+    # Works for DRF requests and for the plain Django requests of the async views.
+    query = getattr(request, 'query_params', request.GET)
+    data = getattr(request, 'data', request.POST)
+    value = query.get('async', data.get('async'))
+    if value is None:
+        return getattr(settings, 'EXTRACTION_ASYNC_DEFAULT', False)
+    return str(value).lower() in ('1', 'true', 'yes')
+
+
 class ResumeSkillExtractionView(APIView):
     permission_classes = [AllowAny]
     
@@ -112,73 +242,178 @@ class ResumeSkillExtractionView(APIView):
             return Response({"error": "No file provided"}, status=status.HTTP_400_BAD_REQUEST)
 
         file_obj = request.FILES['file']
-        role = request.data.get('role', '').strip()
+        role = canonical_role(request.data.get('role', ''))
 
         try:
-            resume_text = extract_text_from_pdf_file(file_obj)
-            if not resume_text.strip():
-                return Response(
-                    {"error": "Could not extract text from PDF"}, 
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            extracted_skills = extract_skills_from_resume(resume_text)
-            logger.info(f"OpenRouter extracted {len(extracted_skills)} skills")
-            recommended_skills = []
-            if role and extracted_skills:
-                recommended_skills = recommend_skills(extracted_skills, role)
-                logger.info(f"OpenRouter recommended {len(recommended_skills)} skills for role: {role}")
-                if recommended_skills:
-                    recommended_skills = recommended_skills[:8]
-
-            if recommended_skills and extracted_skills:
-                existing_lower = {s.strip().lower() for s in extracted_skills if s and s.strip()}
-                filtered = []
-                for s in recommended_skills:
-                    if not s or not isinstance(s, str):
-                        continue
-                    if s.strip().lower() in existing_lower:
-                        continue
-                    if s.strip() not in filtered:
-                        filtered.append(s.strip())
-                recommended_skills = filtered
+            if _wants_async(request):
+                job = enqueue_extraction(file_obj, role)
+                return Response({
+                    "status": job.status,
+                    "job_id": str(job.id),
+                    "status_url": f"{request.path.rstrip('/')}/jobs/{job.id}",
+                }, status=status.HTTP_202_ACCEPTED)
+
+            payload = run_resume_pipeline(file_obj, role)
+            return Response(payload, status=status.HTTP_201_CREATED)
+
+        except PipelineError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            tb = traceback.format_exc()
+            logger.error(f"Resume skill extraction error: {tb}")
+            return Response({
+                "status": "error", 
+                "message": str(e), 
+                "traceback": tb
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-            try:
-                file_obj.seek(0)
-            except Exception:
-                pass
-
-            filename = getattr(file_obj, 'name', None)
-            resume = Resume.objects.create(
-                file_name=filename,
-                role=role,
-                extracted_skills=", ".join(extracted_skills),
-                recommended_skills=", ".join(recommended_skills) if recommended_skills else None
-            )
-            serializer = ResumeSerializer(resume)
-            
-            extraction_issue = None
-            if not extracted_skills:
-                if not resume_text or not resume_text.strip():
-                    extraction_issue = "bad_read"
-                elif len(resume_text) > 50000:
-                    extraction_issue = "input_too_long"
-                else:
-                    extraction_issue = "no_skills_found"
 
+class BulkResumeIngestView(APIView):
+    """Queue a ZIP of resume PDFs for ingestion; the job's result is a per-file manifest."""
+    permission_classes = [AllowAny]
+
+    def post(self, request, *args, **kwargs):
+        if 'file' not in request.FILES:
+            return Response({"error": "No file provided"}, status=status.HTTP_400_BAD_REQUEST)
+
+        role = canonical_role(request.data.get('role', ''))
+        try:
+            job = enqueue_bulk_ingest(request.FILES['file'], role)
             return Response({
-                "status": "success",
-                "data": serializer.data,
-                "extracted_skills": extracted_skills,
-                "recommended_skills": recommended_skills,
-                "extraction_issue": extraction_issue
-            }, status=status.HTTP_201_CREATED)
+                "status": job.status,
+                "job_id": str(job.id),
+                "status_url": f"{request.path.rstrip('/').rsplit('/bulk', 1)[0]}/jobs/{job.id}",
+            }, status=status.HTTP_202_ACCEPTED)
+        except BulkIngestError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            tb = traceback.format_exc()
+            logger.error(f"Bulk resume ingestion error: {tb}")
+            return Response({"status": "error", "message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class ExtractionJobStatusView(APIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request, job_id, *args, **kwargs):
+        try:
+            job = ExtractionJob.objects.get(pk=job_id)
+        except ExtractionJob.DoesNotExist:
+            return Response({"error": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(ExtractionJobSerializer(job).data, status=status.HTTP_200_OK)
+
+
+class AsyncAPIView(View):
+    """Base for the async views, served under async/ (DRF 3.14's APIView cannot run coroutine handlers).
+
+    Under ASGI (e.g. uvicorn backend.asgi:application) their LLM calls are
+    awaited on the event loop instead of holding a worker thread each. Like
+    the APIViews they are CSRF-exempt and answer with JSON.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+    def request_data(self, request):
+        """The JSON (or form) body as a dict, or None when it is not valid JSON."""
+        if request.content_type == 'application/json':
+            try:
+                data = json.loads(request.body or b'{}')
+            except ValueError:
+                return None
+            return data if isinstance(data, dict) else None
+        return request.POST
+
+
+def _json_error(message, status_code):
+    return JsonResponse({"error": message}, status=status_code)
+
 
+class AsyncSkillRoadmapView(AsyncAPIView):
+    async def post(self, request, *args, **kwargs):
+        data = self.request_data(request)
+        if data is None:
+            return _json_error("Invalid JSON body", status.HTTP_400_BAD_REQUEST)
+        skills_normalized, error = _skills_from(data)
+        if error:
+            return _json_error(error, status.HTTP_400_BAD_REQUEST)
+        try:
+            roadmap = await agenerate_skill_roadmap(skills_normalized) or {}
+            return JsonResponse(roadmap, status=status.HTTP_200_OK)
+        except Exception as e:
+            return _json_error(f"Failed to generate roadmap: {str(e)}", status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AsyncSkillMarketAnalysisView(AsyncAPIView):
+    async def post(self, request, *args, **kwargs):
+        data = self.request_data(request)
+        if data is None:
+            return _json_error("Invalid JSON body", status.HTTP_400_BAD_REQUEST)
+        skills_normalized, error = _skills_from(data)
+        if error:
+            return _json_error(error, status.HTTP_400_BAD_REQUEST)
+        try:
+            analysis = await amarket_analysis(skills_normalized)
+            return JsonResponse(analysis, status=status.HTTP_200_OK)
+        except Exception as e:
+            return _json_error(f"Failed to analyze market demand: {str(e)}", status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AsyncSkillRecommendView(AsyncAPIView):
+    async def post(self, request, *args, **kwargs):
+        data = self.request_data(request)
+        if data is None:
+            return _json_error("Invalid JSON body", status.HTTP_400_BAD_REQUEST)
+        skills, role, strategy, error = _recommend_params(data)
+        if error:
+            return _json_error(error, status.HTTP_400_BAD_REQUEST)
+        try:
+            recs = None
+            if strategy == 'cooccurrence':
+                # May rebuild the model from the database.
+                recs = await sync_to_async(cooccurrence.recommend)(skills, role)
+            if recs is None:
+                strategy = 'llm'
+                recs = await arecommend_skills(skills, role)
+            return JsonResponse({"recommended_skills": _without_owned(recs, skills), "strategy": strategy},
+                                status=status.HTTP_200_OK)
+        except Exception as e:
+            return _json_error(f"Failed to generate recommendations: {str(e)}",
+                               status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AsyncResumeSkillExtractionView(AsyncAPIView):
+    async def post(self, request, *args, **kwargs):
+        if 'file' not in request.FILES:
+            return _json_error("No file provided", status.HTTP_400_BAD_REQUEST)
+
+        file_obj = request.FILES['file']
+        role = canonical_role(request.POST.get('role', ''))
+
+        try:
+            if _wants_async(request):
+                job = await sync_to_async(enqueue_extraction)(file_obj, role)
+                return JsonResponse({
+                    "status": job.status,
+                    "job_id": str(job.id),
+                    "status_url": f"{request.path.rstrip('/').rsplit('/async/', 1)[0]}/extract-skills/jobs/{job.id}",
+                }, status=status.HTTP_202_ACCEPTED)
+
+            payload = await arun_resume_pipeline(file_obj, role)
+            return JsonResponse(payload, status=status.HTTP_201_CREATED)
+
+        except PipelineError as e:
+            return _json_error(str(e), status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             tb = traceback.format_exc()
             logger.error(f"Resume skill extraction error: {tb}")
-            return Response({
-                "status": "error", 
-                "message": str(e), 
+            return JsonResponse({
+                "status": "error",
+                "message": str(e),
                 "traceback": tb
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
@@ -190,9 +425,8 @@ class ResetPasswordView(APIView):
         token = request.data["token"]
         password = request.data["password"]
 
-        token_obj = Token.objects.filter(
-            user_id=user_id).order_by("-created_at")[0]
-        if token_obj.expires_at < timezone.now():
+        result = redeem_reset_token(user_id, token)
+        if result == EXPIRED:
             return Response(
                 {
                     "success": False,
@@ -200,7 +434,7 @@ class ResetPasswordView(APIView):
                 },
                 status=status.HTTP_200_OK,
             )
-        elif token_obj is None or token != token_obj.token or token_obj.is_used:
+        if result != VALID or not User.objects.filter(id=user_id).update(password=hash_password(password)):
             return Response(
                 {
                     "success": False,
@@ -208,20 +442,13 @@ class ResetPasswordView(APIView):
                 },
                 status=status.HTTP_200_OK,
             )
-        else:
-            token_obj.is_used = True
-            hashed_password = make_password(password=password, salt=SALT)
-            ret_code = User.objects.filter(
-                id=user_id).update(password=hashed_password)
-            if ret_code:
-                token_obj.save()
-                return Response(
-                    {
-                        "success": True,
-                        "message": "Your password reset was successfully!",
-                    },
-                    status=status.HTTP_200_OK,
-                )
+        return Response(
+            {
+                "success": True,
+                "message": "Your password reset was successfully!",
+            },
+            status=status.HTTP_200_OK,
+        )
 
 
 class ForgotPasswordView(APIView):
@@ -229,62 +456,27 @@ class ForgotPasswordView(APIView):
     def post(self, request, format=None):
         email = request.data["email"]
         user = User.objects.get(email=email)
-        created_at = timezone.now()
-        expires_at = timezone.now() + timezone.timedelta(1)
-        salt = uuid.uuid4().hex
-        token = hashlib.sha512(
-            (str(user.id) + user.password + created_at.isoformat() + salt).encode(
-                "utf-8"
-            )
-        ).hexdigest()
-        token_obj = {
-            "token": token,
-            "created_at": created_at,
-            "expires_at": expires_at,
-            "user_id": user.id,
-        }
-        serializer = TokenSerializer(data=token_obj)
-        if serializer.is_valid():
-            serializer.save()
-            subject = "Forgot Password Link"
-            content = mail_template(
-                "We have received a request to reset your password. Please reset your password using the link below.",
-                f"{URL}/resetPassword?id={user.id}&token={token}",
-                "Reset Password",
-            )
-            send_mail(
-                subject=subject,
-                message=content,
-                from_email=settings.EMAIL_HOST_USER,
-                recipient_list=[email],
-                html_message=content,
-            )
-            return Response(
-                {
-                    "success": True,
-                    "message": "A password reset link has been sent to your email.",
-                },
-                status=status.HTTP_200_OK,
-            )
-        else:
-            error_msg = ""
-            for key in serializer.errors:
-                error_msg += serializer.errors[key][0]
-            return Response(
-                {
-                    "success": False,
-                    "message": error_msg,
-                },
-                status=status.HTTP_200_OK,
-            )
+        token = issue_reset_token(user)
+        subject = "Forgot Password Link"
+        content = mail_template(
+            "We have received a request to reset your password. Please reset your password using the link below.",
+            f"{URL}/resetPassword?id={user.id}&token={token}",
+            "Reset Password",
+        )
+        enqueue_email(subject, content, [email], html_body=content)
+        return Response(
+            {
+                "success": True,
+                "message": "A password reset link has been sent to your email.",
+            },
+            status=status.HTTP_200_OK,
+        )
 
 
 class RegistrationView(APIView):
     permission_classes = [AllowAny]
     def post(self, request, format=None):
-        request.data["password"] = make_password(
-            password=request.data["password"], salt=SALT
-        )
+        request.data["password"] = hash_password(request.data["password"])
         serializer = UserSerializer(data=request.data)
         if serializer.is_valid():
             serializer.save()
@@ -307,13 +499,13 @@ class LoginView(APIView):
     def post(self, request, format=None):
         email = request.data["email"]
         password = request.data["password"]
-        hashed_password = make_password(password=password, salt=SALT)
         try:
             user = User.objects.get(email=email)
         except User.DoesNotExist:
+            burn_hash(password)
             return Response({"success": False, "message": "Invalid Login Credentials!"}, status=status.HTTP_200_OK)
 
-        if user is None or user.password != hashed_password:
+        if user is None or not verify_password(user, password):
             return Response(
                 {
                     "success": False,
@@ -333,3 +525,16 @@ class LoginView(APIView):
                 },
                 status=status.HTTP_200_OK,
             )
+
+
+class MetricsView(View):
+    """Prometheus metrics of the worker process that answers (see utils.metrics).
+
+    With settings.METRICS_TOKEN set, scrapes must send it as a bearer token.
+    """
+
+    def get(self, request):
+        token = getattr(settings, 'METRICS_TOKEN', None)
+        if token and not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+            return HttpResponse(status=401)
+        return HttpResponse(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -18,12 +18,25 @@ import os
 load_dotenv()
 
 # Email Configuration
-EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+EMAIL_BACKEND = os.getenv('EMAIL_BACKEND', "django.core.mail.backends.smtp.EmailBackend")  # locmem/filebased for local testing
+EMAIL_FILE_PATH = os.getenv('EMAIL_FILE_PATH', '/tmp/career-compass-mail')  # used by the filebased backend
 EMAIL_HOST = "smtp.gmail.com"
 EMAIL_USE_TLS = True
 EMAIL_PORT = 587
 EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER')  # Get from environment variable
 EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD')  # Get from environment variable
+EMAIL_TIMEOUT = 10  # seconds; a stalled SMTP server fails the batch instead of hanging the sender
+
+# Email outbox: views enqueue; a sender thread per worker, started by the worker's first request,
+# sends due rows in batches over one connection. With SEND_IN_BACKGROUND off, run
+# manage.py send_outbox --loop as a dedicated sender instead.
+EMAIL_OUTBOX_SEND_IN_BACKGROUND = os.getenv('EMAIL_OUTBOX_SEND_IN_BACKGROUND', 'true').lower() == 'true'
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv('EMAIL_OUTBOX_BATCH_SIZE', '50'))  # emails per connection
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv('EMAIL_OUTBOX_MAX_ATTEMPTS', '5'))  # then the row is marked failed
+EMAIL_OUTBOX_RETRY_BASE = 60  # seconds before the first retry, doubled after each failure
+EMAIL_OUTBOX_RETRY_MAX = 3600
+EMAIL_OUTBOX_LEASE_SECONDS = 300  # a claimed row is retried after this if its sender died
+EMAIL_OUTBOX_POLL_SECONDS = 60  # longest a sender sleeps between checks for due retries
 
 # Timezone setting
 TIME_ZONE = 'Asia/Kolkata'
@@ -56,6 +69,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'app.middleware.ServerTimingMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -90,6 +104,9 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'backend.wsgi.application'
 
+# manage.py test keeps the LLM response cache in a temporary directory.
+TEST_RUNNER = 'app.tests.runner.TestRunner'
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
@@ -117,6 +134,128 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# Caches
+# The "llm" cache holds OpenRouter responses. It is file-based so every gunicorn
+# worker on the host shares the same entries; MAX_ENTRIES bounds its size.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'llm': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv('LLM_CACHE_DIR', str(BASE_DIR / '.llm_cache')),
+        'TIMEOUT': None,
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('LLM_CACHE_MAX_ENTRIES', '5000')),
+            'CULL_FREQUENCY': 4,
+        },
+    },
+}
+
+LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+LLM_CACHE_DEFAULT_TTL = 60 * 60  # seconds, for non-deterministic calls without a task TTL
+LLM_CACHE_TTLS = {}  # per-task overrides, e.g. {'roadmap': 3600}
+
+# Identical in-flight LLM requests share one generation; SHARED also coalesces cacheable
+# calls across workers through a lock file in the 'llm' cache directory.
+LLM_SINGLEFLIGHT_SHARED = os.getenv('LLM_SINGLEFLIGHT_SHARED', 'true').lower() == 'true'
+LLM_SINGLEFLIGHT_LOCK_TTL = 120  # seconds; a crashed leader's lock expires after this
+LLM_SINGLEFLIGHT_WAIT = 90  # seconds a waiting caller gives the leader before calling itself
+
+# OpenRouter HTTP client: one pooled keep-alive client per worker process
+OPENROUTER_BASE_URL = os.getenv('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1')
+OPENROUTER_POOL_MAX_CONNECTIONS = int(os.getenv('OPENROUTER_POOL_MAX_CONNECTIONS', '20'))
+OPENROUTER_POOL_MAX_KEEPALIVE = int(os.getenv('OPENROUTER_POOL_MAX_KEEPALIVE', '10'))
+OPENROUTER_KEEPALIVE_EXPIRY = 60.0  # seconds an idle connection is kept open
+OPENROUTER_CONNECT_TIMEOUT = float(os.getenv('OPENROUTER_CONNECT_TIMEOUT', '5'))
+OPENROUTER_READ_TIMEOUT = float(os.getenv('OPENROUTER_READ_TIMEOUT', '60'))
+OPENROUTER_MODEL_TIMEOUTS = {}  # per-model read timeout overrides, e.g. {'openai/gpt-oss-20b:free': 90}
+OPENROUTER_ASYNC_MAX_CONNECTIONS = int(os.getenv('OPENROUTER_ASYNC_MAX_CONNECTIONS', '500'))  # per event loop, for the async/ views
+
+# Outbound rate limiting: a token bucket per model with interactive calls served ahead of
+# bulk and background ones. Free-tier (":free") models default to OPENROUTER_FREE_RPM
+# requests per minute; other models are unlimited unless listed below. Buckets live in each
+# process, so every limit is split evenly over OPENROUTER_RATE_LIMIT_PROCESSES (by default
+# gunicorn's WEB_CONCURRENCY); count any manage.py ingest_resumes runs in it as well.
+OPENROUTER_RATE_LIMIT_ENABLED = os.getenv('OPENROUTER_RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+OPENROUTER_RATE_LIMIT_PROCESSES = int(os.getenv('OPENROUTER_RATE_LIMIT_PROCESSES', os.getenv('WEB_CONCURRENCY', '1')))
+OPENROUTER_FREE_RPM = int(os.getenv('OPENROUTER_FREE_RPM', '20'))
+OPENROUTER_RATE_LIMITS = {}  # per-model overrides, e.g. {'openai/gpt-oss-20b:free': {'rpm': 10, 'burst': 5}}
+OPENROUTER_QUEUE_TIMEOUT = float(os.getenv('OPENROUTER_QUEUE_TIMEOUT', '30'))  # max seconds queued for a slot
+OPENROUTER_MAX_RETRIES = int(os.getenv('OPENROUTER_MAX_RETRIES', '3'))  # retries after a 429 or 5xx
+OPENROUTER_BACKOFF_BASE = 1.0  # seconds before the first retry, doubled each time (Retry-After wins if longer)
+OPENROUTER_BACKOFF_MAX = 30.0
+
+# Fallback model chains and hedged requests: a task's call moves to the next model in its
+# chain when a model fails, and races it when the model is slower than its recent p95.
+LLM_MODEL_CHAINS = {}  # per-task overrides of openrouter_service.MODEL_CHAINS, e.g. {'market': ['openai/gpt-oss-20b:free']}
+LLM_HEDGE_ENABLED = os.getenv('LLM_HEDGE_ENABLED', 'true').lower() == 'true'
+LLM_HEDGE_PERCENTILE = 95
+LLM_HEDGE_MIN_SAMPLES = 20  # latencies needed before the percentile is trusted
+LLM_HEDGE_DEFAULT_DELAY = float(os.getenv('LLM_HEDGE_DEFAULT_DELAY', '15'))  # seconds, until then
+LLM_HEDGE_MIN_DELAY = 1.0  # never hedge sooner than this
+LLM_LATENCY_WINDOW = 200  # recent calls kept per model
+
+# Per-skill fan-out for roadmap and market analysis requests
+LLM_FANOUT_ENABLED = os.getenv('LLM_FANOUT_ENABLED', 'true').lower() == 'true'
+LLM_FANOUT_MAX_WORKERS = int(os.getenv('LLM_FANOUT_MAX_WORKERS', '4'))
+LLM_FANOUT_CALL_TIMEOUT = float(os.getenv('LLM_FANOUT_CALL_TIMEOUT', '60'))  # seconds per skill call
+
+# Skill extraction: 'local' (taxonomy only), 'hybrid' (taxonomy, then LLM for the rest) or 'llm'
+SKILL_EXTRACTION_MODE = os.getenv('SKILL_EXTRACTION_MODE', 'hybrid')
+RESUME_CHUNK_TOKENS = int(os.getenv('RESUME_CHUNK_TOKENS', '1500'))  # longer resumes are extracted chunk by chunk
+
+# Market demand snapshots (manage.py snapshot_market_demand)
+MARKET_SNAPSHOT_TOP_N = int(os.getenv('MARKET_SNAPSHOT_TOP_N', '50'))  # most frequent skills per snapshot
+MARKET_SNAPSHOT_MAX_AGE_DAYS = int(os.getenv('MARKET_SNAPSHOT_MAX_AGE_DAYS', '7'))  # older snapshots are not served
+
+# /skill-recommend: 'cooccurrence' (counts over stored resumes, LLM for unseen roles) or 'llm'
+SKILL_RECOMMEND_STRATEGY = os.getenv('SKILL_RECOMMEND_STRATEGY', 'cooccurrence')
+SKILL_RECOMMEND_MIN_ROLE_RESUMES = int(os.getenv('SKILL_RECOMMEND_MIN_ROLE_RESUMES', '3'))  # fewer falls back to the LLM
+SKILL_RECOMMEND_REBUILD_SECONDS = int(os.getenv('SKILL_RECOMMEND_REBUILD_SECONDS', '3600'))  # full rebuild from the DB
+
+# Background /extract-skills jobs (POST with async=true returns 202 and a job id)
+EXTRACTION_ASYNC_DEFAULT = os.getenv('EXTRACTION_ASYNC_DEFAULT', 'false').lower() == 'true'
+EXTRACTION_JOB_WORKERS = int(os.getenv('EXTRACTION_JOB_WORKERS', '2'))  # threads per worker process
+EXTRACTION_JOB_UPLOAD_DIR = os.getenv('EXTRACTION_JOB_UPLOAD_DIR') or None  # defaults to the system temp dir
+EXTRACTION_JOB_STALE_SECONDS = int(os.getenv('EXTRACTION_JOB_STALE_SECONDS', '3600'))  # see manage.py sweep_jobs
+
+# Bulk resume ingestion (/extract-skills/bulk and manage.py ingest_resumes)
+BULK_MAX_FILES = int(os.getenv('BULK_MAX_FILES', '500'))  # PDFs per ZIP or directory
+BULK_LLM_WORKERS = int(os.getenv('BULK_LLM_WORKERS', '8'))  # resumes in their LLM stage at once
+
+# Resume PDF text extraction
+PDF_MAX_BYTES = int(os.getenv('PDF_MAX_BYTES', str(10 * 1024 * 1024)))  # larger uploads are rejected
+PDF_MAX_PAGES = int(os.getenv('PDF_MAX_PAGES', '50'))  # pages beyond this are ignored
+PDF_CHAR_BUDGET = int(os.getenv('PDF_CHAR_BUDGET', '50000'))  # extraction stops once this much text is read
+PDF_WORKERS = int(os.getenv('PDF_WORKERS', str(min(4, os.cpu_count() or 1))))  # process pool size, 1 disables it
+PDF_PARALLEL_MIN_PAGES = int(os.getenv('PDF_PARALLEL_MIN_PAGES', '8'))  # shorter PDFs, and in-memory uploads, are read serially
+
+# Instrumentation: Prometheus metrics at /metrics (per worker process) and a Server-Timing
+# header with per-stage durations (pdf_parse, llm_<task>, db_read, db_write) on every response
+METRICS_TOKEN = os.getenv('METRICS_TOKEN') or None  # if set, /metrics requires 'Authorization: Bearer <token>'
+SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING_ENABLED', 'true').lower() == 'true'
+
+# Password hashing: PASSWORD_HASHER picks the hasher new and rehashed passwords use
+# ('pbkdf2', 'scrypt', 'argon2' or 'bcrypt'; the last two need argon2-cffi / bcrypt installed).
+# The others stay listed so existing hashes keep verifying and are upgraded on login.
+_PASSWORD_HASHERS = {
+    'pbkdf2': 'app.hashers.ConfigurablePBKDF2PasswordHasher',
+    'scrypt': 'django.contrib.auth.hashers.ScryptPasswordHasher',
+    'argon2': 'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'bcrypt': 'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+}
+PASSWORD_HASHER = os.getenv('PASSWORD_HASHER', 'pbkdf2')
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    path for name, path in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER
+]
+PASSWORD_HASH_ITERATIONS = int(os.getenv('PASSWORD_HASH_ITERATIONS', '600000'))  # PBKDF2 cost
+
+# Password reset links: 'signed' tokens need no Token row (a used one is recorded until it
+# expires); 'stored' keeps a Token row per request. manage.py purge_reset_tokens cleans both up.
+RESET_TOKEN_MODE = os.getenv('RESET_TOKEN_MODE', 'signed')
+RESET_TOKEN_MAX_AGE = int(os.getenv('RESET_TOKEN_MAX_AGE', str(24 * 60 * 60)))  # seconds a link stays valid
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
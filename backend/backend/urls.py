@@ -19,10 +19,12 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from django.http import HttpResponse
+from app.views import MetricsView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/extract-skills/', include('app.urls')),
     path('api/v1/', include('app.urls')),
+    path('metrics', MetricsView.as_view(), name='metrics'),
     path('', lambda request: HttpResponse('CareerCompass API is running')),
 ]
\ No newline at end of file